@@ -3,11 +3,14 @@ from fastapi import FastAPI, HTTPException, Security, WebSocket, WebSocketDiscon
 import asyncio
 from contextlib import asynccontextmanager
 from framework.core.telemetry import telemetry
+from api.telemetry_ws import WebSocketTelemetrySink
 from fastapi.security import APIKeyHeader
+import os
 import time
 import json
 import logging
 from framework.core import Pipeline, NodeRegistry, PipelineManager
+from framework.core.pipeline_store import default_store_path
 manager = PipelineManager()
 
 from framework.data.data_types import (
@@ -26,13 +29,26 @@ import yaml
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    # Start telemetry broadcaster on startup
-    broadcaster_task = asyncio.create_task(telemetry._async_broadcaster())
+    # Route telemetry to websocket clients while the API is up
+    sink = WebSocketTelemetrySink()
+    app.state.telemetry_sink = sink
+    telemetry.set_sink(sink)
+    broadcaster_task = asyncio.create_task(sink.run())
+
+    # Warm reload of stored pipelines (builds run in parallel off the event loop)
+    manager.open_store(default_store_path())
+    auto_start = os.environ.get("STREAMLET_AUTOSTART", "1") == "1"
+    failures = await asyncio.to_thread(manager.restore, auto_start)
+    for pipeline_id, error in failures.items():
+        logging.error(f"Pipeline {pipeline_id} not restored: {error}")
     
     yield
     
-    # Cleanup on shutdown
-    telemetry.stop()
+    # Cleanup on shutdown (stored run state is kept for the next start)
+    await asyncio.to_thread(manager.shutdown_all)
+    manager.close_store()
+    telemetry.set_sink(None)
+    sink.close()
     broadcaster_task.cancel()
     try:
         await broadcaster_task
@@ -53,9 +69,6 @@ app.add_middleware(
 api_keys = ["SECRET_KEY"]  # In production, use proper auth
 security = APIKeyHeader(name="X-API-Key")
 
-# In-memory pipeline store (replace with DB in production)
-pipelines = {}
-
 class PipelineConfig(BaseModel):
     config: Union[str, dict]  # Accept both path and direct config
     name: str = "Unnamed Pipeline"
@@ -102,20 +115,17 @@ def create_pipeline(config: PipelineConfig):
 
 @app.post("/pipelines/{pipeline_id}/start")
 def start_pipeline(pipeline_id: str):
-    pipeline = manager.get_pipeline(pipeline_id)
-    if not pipeline:
+    if not manager.start_pipeline(pipeline_id):
         raise HTTPException(status_code=404, detail="Pipeline not found")
-    pipeline.run()
     return {"status": "started"}
 
 @app.post("/pipelines/{pipeline_id}/stop")
 def stop_pipeline(pipeline_id: str):
-    pipeline = manager.get_pipeline(pipeline_id)
-    if not pipeline:
+    if not manager.get_pipeline(pipeline_id):
         raise HTTPException(status_code=404, detail="Pipeline not found")
     
     try:
-        pipeline.shutdown()
+        manager.stop_pipeline(pipeline_id)
         return {"status": "stopped"}
     except Exception as e:
         raise HTTPException(
@@ -178,38 +188,47 @@ def update_node_params(pipeline_id: str, node_id: str, update: NodeUpdate):
 # --- Configuration Endpoints ---
 @app.patch("/pipelines/{pipeline_id}/nodes")
 async def update_node(
-    pipeline_id: UUID,
+    pipeline_id: str,
     update: NodeUpdate,
     api_key: str = Security(security)
 ):
     """Update node parameters in real-time"""
     pipeline = _get_pipeline(pipeline_id)
     try:
-        node = next(n for n in pipeline["instance"].nodes 
-                   if n.node_id == update.node_id)
-        node.update_params(update.params)
+        if not pipeline.update_node_params(update.node_id, update.params):
+            raise HTTPException(400, "Invalid parameters")
         return {"status": "updated"}
-    except StopIteration:
+    except ValueError:
         raise HTTPException(404, "Node not found")
 
 @app.get("/pipelines/{pipeline_id}/nodes")
 async def get_nodes(
-    pipeline_id: UUID,
+    pipeline_id: str,
     api_key: str = Security(security)
 ):
     """Get current node configuration"""
     pipeline = _get_pipeline(pipeline_id)
     return [{
-        "id": n.node_id,
-        "type": n.node_type,
-        "params": n.config,
-        "inputs": n.inputs,
-        "outputs": n.outputs
-    } for n in pipeline["instance"].nodes]
+        "id": n['name'],
+        "type": n['type'],
+        "params": n,
+        "inputs": [f"{ref}_out" for ref in n.get('inputs', [])],
+        "outputs": [f"{n['name']}_out"]
+    } for n in pipeline.config['nodes']]
+
+@app.get("/pipelines/{pipeline_id}/usage")
+def get_pipeline_usage(pipeline_id: str):
+    """Latest resource usage sample and the quota it is held to"""
+    pipeline = _get_pipeline(pipeline_id)
+    quota = getattr(pipeline, 'quota', None)
+    return {
+        "usage": getattr(pipeline, 'usage', {}),
+        "quota": vars(quota) if quota else None
+    }
 
 # --- Helper Functions ---
-def _get_pipeline(pipeline_id: UUID):
-    pipeline = pipelines.get(pipeline_id)
+def _get_pipeline(pipeline_id: str):
+    pipeline = manager.get_pipeline(pipeline_id)
     if not pipeline:
         raise HTTPException(404, "Pipeline not found")
     return pipeline
@@ -262,7 +281,8 @@ async def websocket_telemetry(websocket: WebSocket):
         })
         
         # Add to telemetry system
-        await telemetry.add_connection(websocket)
+        sink = websocket.app.state.telemetry_sink
+        await sink.add_connection(websocket)
         
         # Keep connection alive
         while True:
@@ -273,7 +293,7 @@ async def websocket_telemetry(websocket: WebSocket):
     except Exception as e:
         print(f"WebSocket error: {str(e)}")
     finally:
-        await telemetry.remove_connection(websocket)
+        await websocket.app.state.telemetry_sink.remove_connection(websocket)
         try:
             await websocket.close()
         except RuntimeError:
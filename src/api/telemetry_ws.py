@@ -0,0 +1,91 @@
+# api/telemetry_ws.py
+import janus
+import asyncio
+from fastapi import WebSocket
+from fastapi.websockets import WebSocketDisconnect
+from framework.core.telemetry import TelemetrySink, telemetry_logger
+
+class WebSocketTelemetrySink(TelemetrySink):
+    """Broadcast telemetry to connected websocket clients.
+
+    Must be created inside a running event loop. Messages are buffered in a
+    bounded queue; when clients fall behind new messages are dropped instead
+    of growing memory.
+    """
+
+    def __init__(self, max_queue: int = 10000):
+        self.active_connections = set()
+        self.async_lock = asyncio.Lock()
+        self.queue = janus.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.is_running = False
+
+    async def add_connection(self, websocket: WebSocket):
+        async with self.async_lock:
+            self.active_connections.add(websocket)
+            client = f"{websocket.client.host}:{websocket.client.port}"
+            telemetry_logger.debug(f"➕ Added connection: {client}. Total: {len(self.active_connections)}")
+
+    async def remove_connection(self, websocket: WebSocket):
+        async with self.async_lock:
+            if websocket in self.active_connections:
+                self.active_connections.discard(websocket)
+                client = f"{websocket.client.host}:{websocket.client.port}"
+                telemetry_logger.debug(f"➖ Removed connection: {client}. Total: {len(self.active_connections)}")
+
+    def emit(self, message: dict):
+        """Called from sync nodes to queue messages"""
+        try:
+            self.queue.sync_q.put_nowait(message)
+        except janus.SyncQueueFull:
+            self.dropped += 1
+
+    async def run(self):
+        """Process messages from the queue"""
+        self.is_running = True
+
+        try:
+            while self.is_running:
+                try:
+                    message = await asyncio.wait_for(
+                        self.queue.async_q.get(),
+                        timeout=1.0
+                    )
+
+                    async with self.async_lock:
+                        dead_connections = []
+
+                        for conn in self.active_connections:
+                            try:
+                                await conn.send_json(message)
+                            except (WebSocketDisconnect, RuntimeError):
+                                dead_connections.append(conn)
+                            except Exception as e:
+                                telemetry_logger.error(f"  ⚠️ Send error to {conn.client}: {str(e)}")
+
+                        for conn in dead_connections:
+                            self.active_connections.discard(conn)
+
+                    self.queue.async_q.task_done()
+
+                except asyncio.TimeoutError:
+                    continue
+                except Exception as e:
+                    telemetry_logger.error(f"Broadcaster error: {str(e)}")
+                    await asyncio.sleep(0.1)
+
+        except asyncio.CancelledError:
+            telemetry_logger.info("🔌 Broadcaster task cancelled")
+        finally:
+            self.is_running = False
+            telemetry_logger.info("🛑 Telemetry broadcaster stopped")
+
+    def stop(self):
+        """Gracefully stop the broadcaster"""
+        if self.is_running:
+            telemetry_logger.info("🛑 Stopping telemetry broadcaster")
+            self.is_running = False
+
+    def close(self):
+        self.stop()
+        self.queue.close()
@@ -3,5 +3,12 @@ from .data_bus import DataBus
 from .registry import NodeRegistry
 from .telemetry import Telemetry
 from .pipeline_manager import PipelineManager
+from .executors import FairExecutor
+from .scheduler import Scheduler
+from .process_pipeline import ProcessPipeline
+from .template import PipelineTemplate
+from .event_loop import SharedEventLoop, shared_loop
 
-__all__ = ['Pipeline', 'DataBus', 'NodeRegistry', 'Telemetry', 'PipelineManager']
\ No newline at end of file
+__all__ = ['Pipeline', 'DataBus', 'NodeRegistry', 'Telemetry', 'PipelineManager',
+           'FairExecutor', 'Scheduler', 'ProcessPipeline',
+           'PipelineTemplate', 'SharedEventLoop', 'shared_loop']
\ No newline at end of file
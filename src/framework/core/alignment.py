@@ -0,0 +1,172 @@
+# framework/core/alignment.py
+import math
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# How a stream's value is picked for a primary key:
+#   nearest     - the element closest to the key, within tolerance
+#   interpolate - linear interpolation between the elements either side of
+#                 the key (both within tolerance); nearest when that fails
+JOIN_METHODS = ("nearest", "interpolate")
+
+MISSING = object()  # No match within tolerance
+
+
+class SortedStream:
+    """One input's buffered (key, value) pairs, kept sorted by key.
+
+    Lookups are binary searches, O(log n). In-order arrivals are appended
+    in O(1); out-of-order ones are placed by binary search but inserted
+    into a list, and eviction deletes a list prefix, so both cost O(n)
+    pointer moves - cheap next to packet handling, and bounded by
+    max_items.
+    """
+
+    def __init__(self, max_items: int = 10000):
+        self.keys: List[float] = []
+        self.values: List[Any] = []
+        self.max_items = max_items
+        self.max_key = -math.inf
+        self.dropped = 0  # Oldest elements discarded because max_items was reached
+
+    def add(self, key: float, value: Any):
+        if not self.keys or key >= self.keys[-1]:
+            self.keys.append(key)
+            self.values.append(value)
+        else:
+            index = bisect_right(self.keys, key)
+            self.keys.insert(index, key)
+            self.values.insert(index, value)
+        if key > self.max_key:
+            self.max_key = key
+        if len(self.keys) > self.max_items:
+            excess = len(self.keys) - self.max_items
+            del self.keys[:excess]
+            del self.values[:excess]
+            self.dropped += excess
+
+    def lookup(self, key: float, tolerance: float, method: str = "nearest") -> Any:
+        """Value for a key, or MISSING when nothing lies within tolerance"""
+        keys = self.keys
+        index = bisect_left(keys, key)
+        if method == "interpolate":
+            if index < len(keys) and keys[index] == key:
+                return self.values[index]
+            if 0 < index < len(keys):
+                k0, k1 = keys[index - 1], keys[index]
+                if key - k0 <= tolerance and k1 - key <= tolerance:
+                    try:
+                        v0, v1 = float(self.values[index - 1]), float(self.values[index])
+                        return v0 + (v1 - v0) * (key - k0) / (k1 - k0)
+                    except (TypeError, ValueError):
+                        pass  # Not numeric; fall back to nearest
+
+        best, best_distance = MISSING, tolerance
+        for candidate in (index - 1, index):
+            if 0 <= candidate < len(keys):
+                distance = abs(keys[candidate] - key)
+                if distance <= best_distance:
+                    best, best_distance = self.values[candidate], distance
+        return best
+
+    def evict_before(self, key: float):
+        """Drop elements older than key, keeping the newest of them for interpolation"""
+        keep_from = max(0, bisect_left(self.keys, key) - 1)
+        if keep_from:
+            del self.keys[:keep_from]
+            del self.values[:keep_from]
+
+    def items(self) -> List[Tuple[float, Any]]:
+        return list(zip(self.keys, self.values))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class StreamAligner:
+    """Joins N streams on a shared key such as event time or sequence number.
+
+    Each element of the primary stream is paired with a value from every
+    other stream (see JOIN_METHODS). A primary element is resolved once
+    the watermark of every other stream (its latest key minus
+    allowed_lateness) has passed key + tolerance, so no closer match can
+    still arrive. Resolved primary elements, and elements of the other
+    streams too old to match anything pending, are then evicted.
+
+    Streams marked idle stop holding back resolution; whatever they have
+    buffered is still used.
+    """
+
+    def __init__(self, streams: Sequence[str], primary: Optional[str] = None,
+                 tolerance: float = 0.0, method: str = "nearest",
+                 allowed_lateness: float = 0.0, max_buffer: int = 10000,
+                 emit_partial: bool = False):
+        if len(streams) < 2:
+            raise ValueError("A join needs at least two streams")
+        if method not in JOIN_METHODS:
+            raise ValueError(f"Unknown join method '{method}'")
+        if tolerance < 0:
+            raise ValueError("tolerance must not be negative")
+        self.streams = list(streams)
+        self.primary = primary if primary is not None else self.streams[0]
+        if self.primary not in self.streams:
+            raise ValueError(f"Primary stream '{self.primary}' is not an input")
+        self.tolerance = tolerance
+        self.method = method
+        self.allowed_lateness = allowed_lateness
+        self.emit_partial = emit_partial
+        self.buffers = {stream: SortedStream(max_buffer) for stream in self.streams}
+        self.idle = set()
+        self.resolved_through = -math.inf  # Latest primary key already resolved
+        self.late = 0  # Elements dropped for arriving after their key was resolved
+        self.unmatched = 0  # Primary elements dropped for lack of a full match
+
+    def watermark(self, stream: str) -> float:
+        return self.buffers[stream].max_key - self.allowed_lateness
+
+    def add(self, stream: str, key: float, value: Any) -> List[Tuple[float, Dict[str, Any]]]:
+        """Buffer an element and return the rows it allowed to resolve"""
+        horizon = self.resolved_through if stream == self.primary else self.resolved_through - self.tolerance
+        if key < horizon:
+            self.late += 1
+            return []
+        self.buffers[stream].add(key, value)
+        return self.resolve()
+
+    def set_idle(self, stream: str, idle: bool):
+        if idle:
+            self.idle.add(stream)
+        else:
+            self.idle.discard(stream)
+
+    def resolve(self) -> List[Tuple[float, Dict[str, Any]]]:
+        """Rows (key, {stream: value}) for every primary element that can no longer change"""
+        others = [s for s in self.streams if s != self.primary]
+        limit = min((self.watermark(s) for s in others if s not in self.idle), default=math.inf)
+        limit = min(limit - self.tolerance, self.watermark(self.primary))
+        primary = self.buffers[self.primary]
+        count = bisect_right(primary.keys, limit)
+        if not count:
+            return []
+
+        rows = []
+        for key, value in zip(primary.keys[:count], primary.values[:count]):
+            row = {self.primary: value}
+            complete = True
+            for stream in others:
+                match = self.buffers[stream].lookup(key, self.tolerance, self.method)
+                if match is MISSING:
+                    complete = False
+                    match = None
+                row[stream] = match
+            if complete or self.emit_partial:
+                rows.append((key, row))
+            else:
+                self.unmatched += 1
+
+        self.resolved_through = primary.keys[count - 1]
+        del primary.keys[:count]
+        del primary.values[:count]
+        for stream in others:
+            self.buffers[stream].evict_before(self.resolved_through - self.tolerance)
+        return rows
@@ -0,0 +1,116 @@
+# framework/core/bulkhead.py
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+logger = logging.getLogger('bulkhead')
+
+# Where a node's deliveries run:
+#   inline  - on the DataBus worker that delivers the packet (default)
+#   io      - on the pipeline's bounded I/O pool (blocking network calls)
+#   cpu     - on the pipeline's bounded CPU pool, sized to the core count
+#   process - offloaded to worker processes
+EXECUTION_CLASSES = ("inline", "io", "cpu", "process")
+
+
+class Bulkhead:
+    """Bounded executor for one execution class.
+
+    At most max_workers tasks run and max_queue wait; further submissions
+    are rejected immediately so a slow dependency cannot pile up work.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int = 100):
+        self.name = name
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix=f"{name}-bulkhead")
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self.rejected = 0
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Optional[Future]:
+        """Schedule fn, or return None if the bulkhead is full"""
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            return None
+        try:
+            future = self.executor.submit(fn, *args, **kwargs)
+        except RuntimeError:
+            self._slots.release()
+            return None
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self, wait: bool = True):
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def create_bulkheads(settings: dict) -> dict:
+    """Bulkheads for a pipeline, sized from its settings"""
+    cpu_workers = int(settings.get('cpu_workers', os.cpu_count() or 1))
+    return {
+        "io": Bulkhead("io", int(settings.get('io_workers', 16)),
+                       int(settings.get('io_queue', 100))),
+        "cpu": Bulkhead("cpu", cpu_workers, int(settings.get('cpu_queue', 100))),
+    }
+
+
+class CircuitBreaker:
+    """Sheds work for a node while its dependency keeps failing.
+
+    After failure_threshold consecutive failures the breaker opens and
+    rejects calls for reset_timeout seconds. It then lets a single trial
+    call through (half open): success closes it, failure opens it again.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 on_state_change: Optional[Callable[[str], None]] = None):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.on_state_change = on_state_change
+        self.state = self.CLOSED
+        self.failures = 0        # Consecutive failures
+        self.total_failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may proceed now"""
+        if self.state == self.CLOSED:
+            return True
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._set_state(self.HALF_OPEN)
+                return True
+            return self.state == self.CLOSED
+
+    def record_success(self):
+        if self.state == self.CLOSED and self.failures == 0:
+            return
+        with self._lock:
+            self.failures = 0
+            self._set_state(self.CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.total_failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._set_state(self.OPEN)
+
+    def _set_state(self, state: str):
+        if state == self.state:
+            return
+        self.state = state
+        if self.on_state_change:
+            try:
+                self.on_state_change(state)
+            except Exception as e:
+                logger.error(f"Circuit state callback failed: {str(e)}")
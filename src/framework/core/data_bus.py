@@ -1,18 +1,64 @@
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable, Dict
+import heapq
+import itertools
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Optional
 import msgpack
+import inspect
 import logging
+import threading
+import time
 from framework.data.data_packet import DataPacket
+from .executors import FairExecutor
+from .spill_queue import SpillQueue
+
+
+class _SpillEdge:
+    """Channel whose in-flight deliveries are capped; the overflow waits in a SpillQueue"""
+
+    def __init__(self, max_in_flight: int, queue_options: Dict):
+        self.max_in_flight = max(1, max_in_flight)
+        self.queue_options = queue_options
+        self.queue = SpillQueue(**queue_options)
+        self.in_flight = 0
+        self.lock = threading.Lock()
+
 
 class DataBus:
-    def __init__(self, max_workers: int = 10):
+    # Nodes marked ROUTES_AT_PUBLISH (keyed partitions) are routed synchronously in publish
+    routes_at_publish = True
+
+    def __init__(self, max_workers: int = 10, executor=None,
+                 min_workers: int = 0, idle_timeout: Optional[float] = 30.0):
         self.subscribers = defaultdict(list)
+        self.routers = defaultdict(list)
         self.channels = defaultdict(list)
         self.serializer = msgpack
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        # A shared executor (e.g. a pipeline's FairExecutor tenant) is not ours to shut down
+        self._owns_executor = executor is None
+        # Otherwise an elastic pool that grows with backlog and retires idle workers
+        self.pool = None
+        if executor is None:
+            self.pool = FairExecutor(max_workers=max_workers, name="databus",
+                                     min_workers=min_workers, idle_timeout=idle_timeout)
+            executor = self.pool.tenant("databus")
+        self.executor = executor
         self.logger = logging.getLogger('databus')
         self.enabled = False  # DataBus starts disabled
+
+        # In-flight deliveries, tracked for bounded draining on shutdown
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        self._idle = threading.Condition(self._pending_lock)
+        self._channel_in_flight = Counter()  # Deliveries per channel, for flow control
+        self.completed = 0  # Deliveries finished (not cancelled) since the bus was created
+
+        # CPU seconds spent delivering, collected by take_cpu_time()
+        self._cpu_time = 0.0
+        self._cpu_lock = threading.Lock()
+
+        # Channels with bounded delivery and disk overflow (see set_spill)
+        self._edges: Dict[str, _SpillEdge] = {}
         
     def set_enabled(self, enabled: bool):
         """Enable or disable data processing"""
@@ -26,6 +72,10 @@ class DataBus:
         
     def subscribe(self, node: Any, channel: str):
         """Add node subscription to channel"""
+        if self.routes_at_publish and getattr(node, 'ROUTES_AT_PUBLISH', False):
+            # Routed in publish order, before delivery threads can reorder packets
+            self.routers[channel].append(node.route)
+            return
         self.subscribers[channel].append(node.on_data)
 
     def publish(self, channel: str, data: Any):
@@ -33,50 +83,411 @@ class DataBus:
         # Only process data if DataBus is enabled
         if not self.enabled:
             return
+
+        for route in self.routers.get(channel, ()):
+            route(data, channel)
             
         if not self.subscribers[channel]:
             self.logger.debug(f"No subscribers for channel {channel}")
             return
             
+        edge = self._edges.get(channel)
+        if edge is not None:
+            self._publish_to_edge(channel, edge, data)
+            return
+
         # Process in separate thread to avoid blocking
-        self.executor.submit(self._deliver, channel, data)
+        self._submit(channel, data)
+
+    def _submit(self, channel: str, data: Any, on_done: Optional[Callable] = None):
+        with self._pending_lock:
+            self._channel_in_flight[channel] += 1
+        try:
+            future = self.executor.submit(self._deliver, channel, data)
+        except RuntimeError:
+            # Executor already shut down
+            self._on_channel_done(channel)
+            return None
+        future.add_done_callback(lambda _: self._on_channel_done(channel))
+        if on_done is not None:
+            # Registered before _track so a follow-up delivery is pending before this one ends
+            future.add_done_callback(on_done)
+        self._track(future)
+        return future
+
+    # ===================
+    # Spilling Edges
+    # ===================
+    def set_spill(self, channel: str, max_in_flight: int = 4, **queue_options):
+        """Cap concurrent deliveries on a channel and spill the overflow to disk.
+
+        Packets beyond max_in_flight wait in a SpillQueue (queue_options are
+        passed to it) and are delivered in publish order as earlier ones
+        complete. FrameSyncBus delivers within the frame and ignores this.
+        """
+        previous = self._edges.get(channel)
+        self._edges[channel] = _SpillEdge(max_in_flight, queue_options)
+        if previous is not None:
+            previous.queue.close()
+
+    def new_spill_queue(self, channel: str) -> Optional[SpillQueue]:
+        """An empty SpillQueue configured like the channel's spilling edge, or None"""
+        edge = self._edges.get(channel)
+        return SpillQueue(**edge.queue_options) if edge is not None else None
+
+    def _publish_to_edge(self, channel: str, edge: _SpillEdge, data: Any):
+        with edge.lock:
+            if edge.in_flight >= edge.max_in_flight or edge.queue:
+                if not edge.queue.put(data):
+                    self.logger.warning(f"Spill limit reached on {channel}, packet dropped")
+                return
+            edge.in_flight += 1
+        self._submit_to_edge(channel, edge, data)
+
+    def _submit_to_edge(self, channel: str, edge: _SpillEdge, data: Any):
+        if self._submit(channel, data, lambda _: self._on_edge_delivery_done(channel, edge)) is None:
+            with edge.lock:
+                edge.in_flight -= 1
+
+    def _on_edge_delivery_done(self, channel: str, edge: _SpillEdge):
+        with edge.lock:
+            if not self.enabled or not edge.queue:
+                edge.in_flight -= 1
+                return
+            data = edge.queue.get_nowait()
+        self._submit_to_edge(channel, edge, data)
+
+    def _track(self, future):
+        """Count a delivery as in flight until it completes"""
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._on_delivery_done)
+
+    def track_delivery(self, channel: str, future):
+        """Count work queued outside the bus (e.g. on a keyed lane) as in flight on a channel"""
+        with self._pending_lock:
+            self._channel_in_flight[channel] += 1
+        future.add_done_callback(lambda _: self._on_channel_done(channel))
+        self._track(future)
+
+    def _on_delivery_done(self, future):
+        with self._idle:
+            self._pending.discard(future)
+            if not future.cancelled():
+                self.completed += 1
+            if not self._pending:
+                self._idle.notify_all()
+
+    def _on_channel_done(self, channel: str):
+        with self._pending_lock:
+            self._channel_in_flight[channel] -= 1
+            if self._channel_in_flight[channel] <= 0:
+                del self._channel_in_flight[channel]
+
+    def in_flight(self, channel: str) -> int:
+        """Deliveries on one channel queued (in memory or spilled) or running"""
+        with self._pending_lock:
+            count = self._channel_in_flight.get(channel, 0)
+        edge = self._edges.get(channel)
+        return count + (len(edge.queue) if edge is not None else 0)
+
+    def pending_count(self) -> int:
+        """Number of deliveries queued (in memory or spilled) or running"""
+        with self._pending_lock:
+            pending = len(self._pending)
+        return pending + sum(len(edge.queue) for edge in self._edges.values())
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until no deliveries are in flight; False if the timeout expired"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def discard_pending(self) -> int:
+        """Cancel deliveries that have not started yet, returning how many"""
+        with self._pending_lock:
+            pending = list(self._pending)
+        # Spilled packets go first so cancelled deliveries don't pull them in
+        discarded = 0
+        for edge in self._edges.values():
+            with edge.lock:
+                discarded += len(edge.queue)
+                edge.queue.clear()
+        discarded += sum(1 for future in pending if future.cancel())
+        if discarded:
+            self.logger.warning(f"Discarded {discarded} undelivered packets")
+        return discarded
+
+    def take_cpu_time(self) -> float:
+        """CPU seconds used by deliveries since the last call"""
+        with self._cpu_lock:
+            cpu_time, self._cpu_time = self._cpu_time, 0.0
+        return cpu_time
+
+    def running_workers(self) -> int:
+        """Worker threads currently delivering for this bus"""
+        running = getattr(self.executor, 'running', None)
+        return running() if running else 0
 
     def _deliver(self, channel: str, data: Any):
         """Actual delivery logic in worker thread"""
+        cpu_start = time.thread_time()
         try:
-            # Serialization logic remains
-            if isinstance(data, DataPacket):
-                packed = self.serializer.packb(data.model_dump(mode='json'))
-            else:
-                packed = self.serializer.packb(data)
+            self._deliver_to_subscribers(channel, data)
+        finally:
+            cpu_time = time.thread_time() - cpu_start
+            with self._cpu_lock:
+                self._cpu_time += cpu_time
 
-            unpacked = self.serializer.unpackb(packed)
-            is_packet = isinstance(unpacked, dict) and 'data_type' in unpacked
+    def _deliver_to_subscribers(self, channel: str, data: Any):
+        try:
+            unpacked, is_packet = self._serialize(data)
 
             for callback in self.subscribers[channel]:
                 try:
-                    if is_packet:
-                        callback(DataPacket.model_validate(unpacked), channel)
-                    else:
-                        callback(unpacked, channel)
+                    payload = DataPacket.model_validate(unpacked) if is_packet else unpacked
+                    self._dispatch(callback, payload, channel)
                 except Exception as e:
                     self.logger.error(f"Callback error: {str(e)}", exc_info=True)
         except Exception as e:
             self.logger.error(f"Delivery failed: {str(e)}", exc_info=True)
 
+    def _serialize(self, data: Any):
+        """Round-trip data through msgpack so subscribers never share objects"""
+        if isinstance(data, DataPacket):
+            packed = self.serializer.packb(data.model_dump(mode='json'))
+        else:
+            packed = self.serializer.packb(data)
+
+        unpacked = self.serializer.unpackb(packed)
+        is_packet = isinstance(unpacked, dict) and 'data_type' in unpacked
+        return unpacked, is_packet
+
+    def private_copy(self, data: Any) -> Any:
+        """A copy of published data that shares nothing with the publisher"""
+        unpacked, is_packet = self._serialize(data)
+        return DataPacket.model_validate(unpacked) if is_packet else unpacked
+
+    def _dispatch(self, callback: Callable, payload: Any, channel: str):
+        """Run a subscriber inline or on its node's bulkhead, shedding when it can't take more"""
+        node = getattr(callback, '__self__', None)
+        breaker = getattr(node, 'breaker', None)
+        if breaker is not None and not breaker.allow():
+            node.record_shed("circuit_open")
+            return
+        if getattr(node, 'stalled', False):
+            node.hold_while_stalled(payload, channel)
+            return
+
+        if inspect.iscoroutinefunction(callback) and hasattr(node, 'run_async'):
+            failures = breaker.total_failures if breaker is not None else 0
+            future = node.run_async(callback, payload, channel)
+            if future is not None:
+                self._watch(future, breaker, failures)
+            return
+
+        offload = getattr(node, 'offload', None)
+        if offload is not None:
+            failures = breaker.total_failures if breaker is not None else 0
+            future = offload.submit(node, payload, channel)
+            if future is None:
+                node.record_shed("offload_full")
+                return
+            self._watch(future, breaker, failures)
+            return
+
+        bulkhead = getattr(node, 'bulkhead', None)
+        if bulkhead is None:
+            self._invoke(callback, payload, channel, breaker)
+            return
+
+        future = bulkhead.submit(self._invoke, callback, payload, channel, breaker)
+        if future is None:
+            node.record_shed("bulkhead_full")
+            return
+        self._track(future)
+
+    def redeliver(self, node: Any, payload: Any, channel: str):
+        """Deliver a packet held back from one node again, through the usual dispatch checks"""
+        if not self.enabled:
+            return
+        try:
+            future = self.executor.submit(self._dispatch, node.on_data, payload, channel)
+        except RuntimeError:
+            return  # Executor already shut down
+        self._track(future)
+
+    def _invoke(self, callback: Callable, payload: Any, channel: str, breaker=None):
+        failures = breaker.total_failures if breaker is not None else 0
+        node = getattr(callback, '__self__', None)
+        try:
+            # Calls into nodes are timed for the stall watchdog
+            with node.activity() if hasattr(node, 'activity') else nullcontext():
+                callback(payload, channel)
+        except Exception as e:
+            self._record_outcome(breaker, failures, e)
+            return
+        self._record_outcome(breaker, failures, None)
+
+    def _watch(self, future, breaker, failures: int):
+        """Track a delivery running elsewhere and feed its outcome to the breaker"""
+        future.add_done_callback(
+            lambda f: self._record_outcome(breaker, failures, None if f.cancelled() else f.exception())
+        )
+        self._track(future)
+
+    def _record_outcome(self, breaker, failures: int, error: Optional[BaseException]):
+        if error is not None:
+            self.logger.error(f"Callback error: {str(error)}", exc_info=error)
+            if breaker is not None:
+                breaker.record_failure()
+        # Nodes may report failures themselves instead of raising
+        elif breaker is not None and breaker.total_failures == failures:
+            breaker.record_success()
+
+    def replace_subscriber(self, old_node: Any, new_node: Any):
+        """Point every subscription of old_node at new_node instead"""
+        for callbacks in list(self.subscribers.values()) + list(self.routers.values()):
+            for i, callback in enumerate(callbacks):
+                if getattr(callback, '__self__', None) is old_node:
+                    callbacks[i] = getattr(new_node, callback.__name__)
+
     def flush(self):
         """Clear all data from channels"""
         self.subscribers.clear()
+        self.routers.clear()
         self.channels.clear()
 
-    def shutdown(self):
-        """Clean up thread pool"""
+    def shutdown(self, wait: bool = True) -> int:
+        """Clean up thread pool without draining queued deliveries"""
         self.logger.info("Shutting down DataBus")
         self.enabled = False
-        self.executor.shutdown(wait=True)
+        discarded = self.discard_pending()
+        # Only deliveries already running are waited for
+        if self._owns_executor:
+            self.pool.shutdown(wait=wait, cancel_futures=True)
+        elif wait:
+            self.drain()
+        # Spill segment files and handles go with the bus
+        edges, self._edges = self._edges, {}
+        for edge in edges.values():
+            edge.queue.close()
+        return discarded
 
     def get_channel_stats(self) -> Dict[str, Dict[str, int]]:
         return {
             channel: {'subscribers': len(callbacks)}
             for channel, callbacks in self.subscribers.items()
-        }
\ No newline at end of file
+        }
+
+
+class FrameSyncBus(DataBus):
+    """DataBus that delivers on the pipeline's frame thread.
+
+    publish() only queues deliveries; run_pending() (called by the pipeline
+    at the end of every frame) delivers them in topological order of the
+    subscribing nodes until the graph is quiet, so every packet produced in
+    a frame reaches its consumers within that frame. Packets published from
+    other threads (network readers, bulkheads) are delivered next frame.
+    """
+    routes_at_publish = False  # Keyed nodes are delivered in rank order like the rest
+
+    def __init__(self, max_workers: int = 10, executor=None,
+                 max_frame_deliveries: int = 10000, **pool_options):
+        super().__init__(max_workers=max_workers, executor=executor, **pool_options)
+        self.max_frame_deliveries = max_frame_deliveries
+        self._ranks: Dict[str, int] = {}
+        self._queue = []
+        self._queue_lock = threading.Lock()
+        self._seq = itertools.count()
+
+    def set_ranks(self, ranks: Dict[str, int]):
+        """Topological rank of each node name; lower ranks are delivered first"""
+        self._ranks = dict(ranks)
+
+    def publish(self, channel: str, data: Any):
+        if not self.enabled:
+            return
+
+        subscribers = self.subscribers[channel]
+        if not subscribers:
+            self.logger.debug(f"No subscribers for channel {channel}")
+            return
+
+        try:
+            unpacked, is_packet = self._serialize(data)
+        except Exception as e:
+            self.logger.error(f"Delivery failed: {str(e)}", exc_info=True)
+            return
+
+        with self._queue_lock:
+            for callback in subscribers:
+                node = getattr(callback, '__self__', None)
+                rank = self._ranks.get(getattr(node, 'name', None), len(self._ranks))
+                heapq.heappush(self._queue, (rank, next(self._seq), callback, unpacked, is_packet, channel))
+
+    def redeliver(self, node: Any, payload: Any, channel: str):
+        if not self.enabled:
+            return
+        rank = self._ranks.get(getattr(node, 'name', None), len(self._ranks))
+        with self._queue_lock:
+            # Already a private copy, so it is queued as is rather than re-validated
+            heapq.heappush(self._queue, (rank, next(self._seq), node.on_data, payload, False, channel))
+
+    def run_pending(self) -> int:
+        """Deliver queued packets in rank order on the calling thread, returning how many"""
+        delivered = 0
+        while delivered < self.max_frame_deliveries:
+            with self._queue_lock:
+                if not self._queue:
+                    break
+                _, _, callback, unpacked, is_packet, channel = heapq.heappop(self._queue)
+            try:
+                payload = DataPacket.model_validate(unpacked) if is_packet else unpacked
+                self._dispatch(callback, payload, channel)
+            except Exception as e:
+                self.logger.error(f"Callback error: {str(e)}", exc_info=True)
+            delivered += 1
+
+        with self._pending_lock:
+            self.completed += delivered
+        if delivered >= self.max_frame_deliveries and self._queue:
+            # Likely a cycle in the graph - carry the rest over to the next frame
+            self.logger.warning(f"Frame delivery limit reached, {len(self._queue)} packets deferred")
+        return delivered
+
+    def pending_count(self) -> int:
+        with self._queue_lock:
+            queued = len(self._queue)
+        return queued + super().pending_count()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # No frames run during shutdown, so deliver the backlog here
+        while True:
+            with self._queue_lock:
+                if not self._queue:
+                    break
+            if not self.enabled or (deadline is not None and time.monotonic() >= deadline):
+                return False
+            self.run_pending()
+        remaining = None if deadline is None else max(0, deadline - time.monotonic())
+        return super().drain(remaining)
+
+    def discard_pending(self) -> int:
+        with self._queue_lock:
+            discarded = len(self._queue)
+            self._queue.clear()
+        if discarded:
+            self.logger.warning(f"Discarded {discarded} undelivered packets")
+        return discarded + super().discard_pending()
+
+    def flush(self):
+        with self._queue_lock:
+            self._queue.clear()
+        super().flush()
@@ -1,11 +1,33 @@
 import time
+import inspect
 import functools
 import logging
 
 def node_telemetry(method_name=None):
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                if not self.telemetry.enabled:
+                    return await func(self, *args, **kwargs)
+                self.emit_telemetry("processing_start", time.time())
+                start = time.perf_counter()
+                try:
+                    return await func(self, *args, **kwargs)
+                except Exception as e:
+                    self.emit_telemetry("processing_error", str(e))
+                    raise
+                finally:
+                    duration = time.perf_counter() - start
+                    self.emit_telemetry("processing_end", time.time())
+                    self.emit_telemetry("execution_time", duration)
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
+            # Skip timing entirely when no sink is listening
+            if not self.telemetry.enabled:
+                return func(self, *args, **kwargs)
             self.emit_telemetry("processing_start", time.time())
             start = time.perf_counter()
             try:
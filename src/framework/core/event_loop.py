@@ -0,0 +1,72 @@
+# framework/core/event_loop.py
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Coroutine, Optional
+
+logger = logging.getLogger('event_loop')
+
+
+class SharedEventLoop:
+    """One asyncio loop on a background thread, shared by all async nodes.
+
+    Async on_data/process coroutines and long-lived network tasks (e.g.
+    websocket readers) run here instead of on a thread or loop each.
+    The loop thread starts on first use.
+    """
+
+    def __init__(self, name: str = "streamlet-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._loop, ready), name=self.name, daemon=True
+                )
+                self._thread.start()
+                ready.wait()
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule a coroutine, returning a thread-safe future for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self, timeout: float = 5.0):
+        """Cancel pending tasks and stop the loop thread"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        async def _cancel_all():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_all(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Tasks did not cancel cleanly: {str(e)}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+
+shared_loop = SharedEventLoop()
@@ -0,0 +1,298 @@
+# framework/core/executors.py
+import logging
+import itertools
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Deque, Dict, Optional
+
+logger = logging.getLogger('executors')
+
+
+class _Tenant:
+    def __init__(self, tenant_id: str, weight: int, max_running: Optional[int] = None):
+        self.id = tenant_id
+        self.weight = max(1, int(weight))
+        self.max_running = max_running
+        self.credit = self.weight
+        self.queue: Deque = deque()
+        self.running = 0
+
+    def runnable(self) -> bool:
+        return bool(self.queue) and (self.max_running is None or self.running < self.max_running)
+
+
+class FairExecutor:
+    """Worker pool shared by many tenants (pipelines).
+
+    Work is queued per tenant and served with weighted round robin: a
+    tenant with weight 3 gets up to three tasks started for every one of a
+    weight-1 tenant while both have work queued. A busy pipeline therefore
+    cannot starve quiet ones, and the process runs a bounded number of
+    threads no matter how many pipelines it hosts.
+
+    The pool is elastic: a worker is started whenever queued work
+    outnumbers idle workers (up to max_workers), and workers left idle for
+    idle_timeout seconds retire until only min_workers remain.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, name: str = "streamlet",
+                 min_workers: int = 0, idle_timeout: Optional[float] = 60.0):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.min_workers = max(0, min(min_workers, self.max_workers))
+        self.idle_timeout = idle_timeout
+        self.name = name
+        self._thread_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._work_available = threading.Condition(self._lock)
+        self._tenants: Dict[str, _Tenant] = {}
+        self._ring: Deque[_Tenant] = deque()  # Tenants with queued work
+        self._threads = []
+        self._idle_workers = 0
+        self._queued = 0
+        self._shutdown = False
+
+    # ==================
+    # Tenant Management
+    # ==================
+    def tenant(self, tenant_id: str, weight: int = 1,
+               max_running: Optional[int] = None) -> "TenantExecutor":
+        """Register (or re-weight) a tenant and return an executor view for it.
+
+        max_running caps how many of the tenant's tasks run at once; the
+        rest wait in its queue while other tenants are served.
+        """
+        with self._lock:
+            tenant = self._tenants.get(tenant_id)
+            if tenant is None:
+                tenant = self._tenants[tenant_id] = _Tenant(tenant_id, weight, max_running)
+            else:
+                tenant.weight = max(1, int(weight))
+                tenant.max_running = max_running
+                self._work_available.notify_all()
+        return TenantExecutor(self, tenant_id)
+
+    def remove_tenant(self, tenant_id: str) -> int:
+        """Forget a tenant, cancelling its queued work; returns tasks cancelled"""
+        with self._lock:
+            tenant = self._tenants.pop(tenant_id, None)
+            if tenant is None:
+                return 0
+            if tenant in self._ring:
+                self._ring.remove(tenant)
+            tasks = list(tenant.queue)
+            tenant.queue.clear()
+            self._queued -= len(tasks)
+        for future, _, _, _ in tasks:
+            future.cancel()
+        return len(tasks)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                t.id: {"weight": t.weight, "queued": len(t.queue), "running": t.running}
+                for t in self._tenants.values()
+            }
+
+    def running(self, tenant_id: str) -> int:
+        """Tasks of one tenant currently running"""
+        with self._lock:
+            tenant = self._tenants.get(tenant_id)
+            return tenant.running if tenant else 0
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Current size and load of the worker pool"""
+        with self._lock:
+            return {
+                "workers": len(self._threads),
+                "idle": self._idle_workers,
+                "queued": self._queued,
+                "min_workers": self.min_workers,
+                "max_workers": self.max_workers,
+            }
+
+    # ==========
+    # Execution
+    # ==========
+    def submit(self, tenant_id: str, fn: Callable, *args, **kwargs) -> Future:
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            tenant = self._tenants.get(tenant_id)
+            if tenant is None:
+                tenant = self._tenants[tenant_id] = _Tenant(tenant_id, 1)
+            if not tenant.queue:
+                self._ring.append(tenant)
+            tenant.queue.append((future, fn, args, kwargs))
+            self._queued += 1
+            self._adjust_workers()
+            self._work_available.notify()
+        return future
+
+    def _adjust_workers(self):
+        """Start a worker if queued work outnumbers idle workers (called with the lock held)"""
+        if self._queued > self._idle_workers and len(self._threads) < self.max_workers:
+            thread = threading.Thread(
+                target=self._worker,
+                name=f"{self.name}-worker-{next(self._thread_ids)}",
+                daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _has_runnable(self) -> bool:
+        return any(tenant.runnable() for tenant in self._ring)
+
+    def _next_task(self):
+        """Pick the next task by weighted round robin (called with the lock held)"""
+        # Tenants at their max_running cap give up their turn
+        while not self._ring[0].runnable():
+            self._ring[0].credit = self._ring[0].weight
+            self._ring.rotate(-1)
+        tenant = self._ring[0]
+        task = tenant.queue.popleft()
+        self._queued -= 1
+        tenant.credit -= 1
+        if not tenant.queue:
+            self._ring.popleft()
+            tenant.credit = tenant.weight
+        elif tenant.credit <= 0:
+            self._ring.rotate(-1)
+            tenant.credit = tenant.weight
+        tenant.running += 1
+        return tenant, task
+
+    def _worker(self):
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+                while not self._has_runnable() and not self._shutdown:
+                    if (not self._work_available.wait(self.idle_timeout)
+                            and not self._has_runnable()
+                            and len(self._threads) > self.min_workers):
+                        break  # Idle too long; retire
+                self._idle_workers -= 1
+                if not self._has_runnable():
+                    self._threads.remove(threading.current_thread())
+                    return
+                tenant, (future, fn, args, kwargs) = self._next_task()
+
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args, **kwargs))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                with self._lock:
+                    tenant.running -= 1
+                    if tenant.queue and tenant.max_running is not None:
+                        self._work_available.notify()  # Capped work may run now
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                for tenant in self._ring:
+                    for future, _, _, _ in tenant.queue:
+                        future.cancel()
+                    self._queued -= len(tenant.queue)
+                    tenant.queue.clear()
+                self._ring.clear()
+            self._work_available.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+class TenantExecutor:
+    """Executor-like view that submits work to a FairExecutor as one tenant"""
+
+    def __init__(self, pool: FairExecutor, tenant_id: str):
+        self.pool = pool
+        self.tenant_id = tenant_id
+        self._closed = False
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        if self._closed:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        return self.pool.submit(self.tenant_id, fn, *args, **kwargs)
+
+    def running(self) -> int:
+        return self.pool.running(self.tenant_id)
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """Stop accepting work; the shared pool itself keeps running"""
+        self._closed = True
+
+
+class SerialExecutor:
+    """Runs tasks one at a time, in submission order, on another executor.
+
+    At most one task is queued on or running in the underlying executor,
+    so a SerialExecutor on a pipeline's tenant takes one of its
+    max_running slots and is served within its weight, like any other
+    work of that pipeline.
+    """
+
+    def __init__(self, executor):
+        self.executor = executor
+        self._lock = threading.Lock()
+        self._queue: Deque = deque()
+        self._scheduled = False
+        self._closed = False
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._queue.append((future, fn, args, kwargs))
+            if self._scheduled:
+                return future
+            self._scheduled = True
+        self._schedule()
+        return future
+
+    def _schedule(self):
+        try:
+            self.executor.submit(self._run_next)
+        except RuntimeError:
+            # Underlying executor shut down; nothing queued here can run
+            with self._lock:
+                self._scheduled = False
+                tasks = list(self._queue)
+                self._queue.clear()
+            for future, _, _, _ in tasks:
+                future.cancel()
+
+    def _run_next(self):
+        with self._lock:
+            if not self._queue:
+                self._scheduled = False
+                return
+            future, fn, args, kwargs = self._queue.popleft()
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+        with self._lock:
+            if not self._queue:
+                self._scheduled = False
+                return
+        # One task per turn, so other work of the tenant is served in between
+        self._schedule()
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """Stop accepting work; the underlying executor keeps running"""
+        with self._lock:
+            self._closed = True
+            tasks = list(self._queue) if cancel_futures else []
+            if cancel_futures:
+                self._queue.clear()
+        for future, _, _, _ in tasks:
+            future.cancel()
@@ -0,0 +1,185 @@
+# framework/core/expressions.py
+import ast
+import math
+from typing import Any, Dict, List, Mapping
+import numpy as np
+
+# Callable names; all accept scalars or NumPy arrays
+FUNCTIONS = {
+    "abs": np.abs, "sqrt": np.sqrt, "exp": np.exp, "log": np.log, "log2": np.log2,
+    "log10": np.log10, "sin": np.sin, "cos": np.cos, "tan": np.tan, "asin": np.arcsin,
+    "acos": np.arccos, "atan": np.arctan, "atan2": np.arctan2, "sinh": np.sinh,
+    "cosh": np.cosh, "tanh": np.tanh, "hypot": np.hypot, "floor": np.floor,
+    "ceil": np.ceil, "round": np.round, "sign": np.sign, "min": np.minimum,
+    "max": np.maximum, "clip": np.clip, "where": np.where,
+    # Reductions over array content; these rule out batching across packets
+    "sum": np.sum, "mean": np.mean, "std": np.std, "amin": np.min, "amax": np.max,
+}
+REDUCTIONS = {"sum", "mean", "std", "amin", "amax"}
+CONSTANTS = {"pi": math.pi, "e": math.e, "inf": math.inf, "nan": math.nan}
+
+_OPERATORS = (
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.UAdd, ast.USub, ast.Not, ast.And, ast.Or,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+_ALLOWED = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp,
+    ast.Call, ast.Name, ast.Attribute, ast.Constant, ast.Load,
+) + _OPERATORS
+
+# Helpers the rewritten tree calls for operators that don't broadcast
+_HELPERS = {
+    "_and": np.logical_and,
+    "_or": np.logical_or,
+    "_not": np.logical_not,
+    "_where": np.where,
+}
+
+
+def _call(name: str, *args: ast.expr) -> ast.Call:
+    return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=list(args), keywords=[])
+
+
+class _Compiler(ast.NodeTransformer):
+    """Checks a parsed formula against the whitelist and rewrites it for NumPy.
+
+    Variables (plain or dotted names) become slots _v0, _v1...; and/or/not,
+    chained comparisons and conditionals become element-wise calls so the
+    same code runs on scalars and arrays.
+    """
+
+    def __init__(self):
+        self.variables: Dict[str, str] = {}  # Dotted path -> slot
+        self.constants: Dict[str, np.float64] = {}  # Slot -> value
+        self.functions = set()
+
+    def visit(self, node):
+        if not isinstance(node, _ALLOWED):
+            raise ValueError(f"{type(node).__name__} is not allowed in expressions")
+        return super().visit(node)
+
+    def _slot(self, path: str) -> ast.Name:
+        if any(part.startswith("_") for part in path.split(".")):
+            raise ValueError(f"Invalid name '{path}' in expression")
+        slot = self.variables.setdefault(path, f"_v{len(self.variables)}")
+        return ast.Name(id=slot, ctx=ast.Load())
+
+    def _constant(self, value: float) -> ast.Name:
+        # NumPy floats overflow to inf; Python ints would grow without bound (9**9**9)
+        slot = f"_k{len(self.constants)}"
+        self.constants[slot] = np.float64(value)
+        return ast.Name(id=slot, ctx=ast.Load())
+
+    def visit_Name(self, node: ast.Name):
+        if node.id in CONSTANTS:
+            return self._constant(CONSTANTS[node.id])
+        if node.id in FUNCTIONS:
+            raise ValueError(f"Function '{node.id}' must be called")
+        return self._slot(node.id)
+
+    def visit_Attribute(self, node: ast.Attribute):
+        parts = []
+        current = node
+        while isinstance(current, ast.Attribute):
+            parts.append(current.attr)
+            current = current.value
+        if not isinstance(current, ast.Name):
+            raise ValueError("Attribute access is only allowed on variable names")
+        parts.append(current.id)
+        return self._slot(".".join(reversed(parts)))
+
+    def visit_Constant(self, node: ast.Constant):
+        if type(node.value) not in (int, float, bool):
+            raise ValueError(f"Constant {node.value!r} is not allowed in expressions")
+        if isinstance(node.value, bool):
+            return node
+        return self._constant(node.value)
+
+    def visit_Call(self, node: ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            raise ValueError(f"Unknown function in expression: {ast.unparse(node.func)}")
+        if node.keywords:
+            raise ValueError("Keyword arguments are not allowed in expressions")
+        self.functions.add(node.func.id)
+        return _call(f"_f_{node.func.id}", *[self.visit(arg) for arg in node.args])
+
+    def visit_BoolOp(self, node: ast.BoolOp):
+        helper = "_and" if isinstance(node.op, ast.And) else "_or"
+        values = [self.visit(value) for value in node.values]
+        result = values[0]
+        for value in values[1:]:
+            result = _call(helper, result, value)
+        return result
+
+    def visit_UnaryOp(self, node: ast.UnaryOp):
+        operand = self.visit(node.operand)
+        if isinstance(node.op, ast.Not):
+            return _call("_not", operand)
+        return ast.UnaryOp(op=node.op, operand=operand)
+
+    def visit_Compare(self, node: ast.Compare):
+        operands = [self.visit(node.left)] + [self.visit(c) for c in node.comparators]
+        pairs = [ast.Compare(left=operands[i], ops=[op], comparators=[operands[i + 1]])
+                 for i, op in enumerate(node.ops)]
+        result = pairs[0]
+        for pair in pairs[1:]:
+            result = _call("_and", result, pair)
+        return result
+
+    def visit_IfExp(self, node: ast.IfExp):
+        return _call("_where", self.visit(node.test), self.visit(node.body), self.visit(node.orelse))
+
+
+class Expression:
+    """A numeric formula parsed and compiled once, evaluated many times.
+
+    Formulas may use arithmetic, comparisons, and/or/not, `a if c else b`,
+    the names in FUNCTIONS and CONSTANTS, and variables - plain or dotted
+    names such as accel.x - whose values are supplied per evaluation.
+    Anything else (attribute access on non-variables, subscripts, other
+    calls, strings) is rejected at compile time with ValueError.
+    Evaluation works element-wise on scalars and NumPy arrays alike.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid expression '{source}': {e.msg}") from None
+        compiler = _Compiler()
+        tree = ast.fix_missing_locations(compiler.visit(tree))
+        self._slots = compiler.variables
+        self.variables: List[str] = list(compiler.variables)
+        # Batches of packets can be stacked into arrays unless a reduction would mix them
+        self.elementwise = not (compiler.functions & REDUCTIONS)
+        self._code = compile(tree, "<expression>", "eval")
+        self._globals = {"__builtins__": {}, **_HELPERS}
+        self._globals.update({f"_f_{name}": fn for name, fn in FUNCTIONS.items()})
+        self._globals.update(compiler.constants)
+
+    def __call__(self, values: Mapping[str, Any]) -> Any:
+        """Evaluate with a value (scalar or array) for every variable"""
+        try:
+            namespace = {slot: _numeric(values[path]) for path, slot in self._slots.items()}
+        except KeyError as e:
+            raise ValueError(f"No value for '{e.args[0]}' in expression '{self.source}'") from None
+        with np.errstate(all="ignore"):
+            return eval(self._code, self._globals, namespace)
+
+
+def _numeric(value: Any) -> Any:
+    """Python ints from packets become NumPy floats, like constants"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return np.float64(value)
+    return value
+
+
+def to_python(value: Any) -> Any:
+    """Turn NumPy results into plain floats, bools and lists for packets"""
+    if isinstance(value, np.ndarray):
+        return value.item() if value.ndim == 0 else value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
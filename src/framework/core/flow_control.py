@@ -0,0 +1,63 @@
+# framework/core/flow_control.py
+from typing import Dict, Iterable, Optional, Union
+
+# What a source that cannot pause does with packets received without credit:
+#   drop   - discard them
+#   latest - hold the newest one and publish it once credit returns
+INGRESS_POLICIES = ("drop", "latest")
+
+# Credit of a branch with no consumer that limits it
+UNLIMITED = 1 << 30
+
+
+class FlowControl:
+    """Credit-based backpressure along the pipeline graph.
+
+    Each consuming node has a number of credits (config `credits`, else
+    default_credits): packets it may have buffered or in delivery to it.
+    Its free credit is that minus its backlog, capped by the credit of
+    every node downstream of it, so a slow sink drains the credit of the
+    whole path up to the sources. refresh() recomputes this once a frame;
+    sources without credit pause, or drop at ingress when they can't.
+    """
+
+    def __init__(self, data_bus, default_credits: int = 100):
+        if default_credits < 1:
+            raise ValueError("default_credits must be at least 1")
+        self.data_bus = data_bus
+        self.default_credits = default_credits
+        self._credits: Dict[str, int] = {}
+
+    @classmethod
+    def from_settings(cls, setting: Union[bool, Dict, None], data_bus) -> Optional["FlowControl"]:
+        """Build from settings.flow_control (true or a dict of options); None if disabled"""
+        if not setting:
+            return None
+        options = setting if isinstance(setting, dict) else {}
+        return cls(data_bus, **options)
+
+    def capacity(self, node) -> int:
+        return int(node.config.get('credits', self.default_credits))
+
+    def refresh(self, nodes: Iterable) -> Dict[str, int]:
+        """Recompute credits for nodes given in topological order"""
+        nodes = list(nodes)
+        consumers: Dict[str, list] = {node.name: [] for node in nodes}
+        for node in nodes:
+            for channel in node.inputs:
+                producer = channel[:-len("_out")] if channel.endswith("_out") else channel
+                if producer in consumers:
+                    consumers[producer].append(node.name)
+
+        credits: Dict[str, int] = {}
+        for node in reversed(nodes):
+            limits = [credits[name] for name in consumers[node.name] if name in credits]
+            if node.inputs:
+                in_delivery = sum(self.data_bus.in_flight(channel) for channel in node.inputs)
+                limits.append(self.capacity(node) - node.backlog() - in_delivery)
+            credits[node.name] = min(limits) if limits else UNLIMITED
+        self._credits = credits
+        return credits
+
+    def credit(self, node_name: str) -> int:
+        return self._credits.get(node_name, UNLIMITED)
@@ -0,0 +1,233 @@
+# framework/core/graph.py
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Type
+from framework.data.data_types import DataType, DataFormat, DataCategory
+
+logger = logging.getLogger('graph')
+
+# Edge verdicts
+SAFE = "safe"                  # Every packet upstream can emit is accepted downstream
+RUNTIME = "runtime"            # Compatibility depends on the packet, validate at runtime
+INCOMPATIBLE = "incompatible"  # No packet upstream can emit is accepted downstream
+
+TYPE_CHECK_MODES = ("strict", "warn", "off")
+
+_DIMENSIONS = (
+    ("data_type", "output_data_types", "accepted_data_types", DataType),
+    ("format", "output_formats", "accepted_formats", DataFormat),
+    ("category", "output_categories", "accepted_categories", DataCategory),
+)
+
+
+@dataclass
+class EdgeCheck:
+    upstream: str
+    downstream: str
+    channel: str
+    status: str
+    reasons: List[str] = field(default_factory=list)
+
+
+@dataclass
+class GraphPlan:
+    """Statically checked wiring of a pipeline config"""
+    key: str
+    order: List[str]
+    edges: List[EdgeCheck]
+    errors: List[str]
+    warnings: List[str]
+
+    def safe_inputs(self, node_name: str) -> Set[str]:
+        """Input channels of a node that never need runtime validation"""
+        return {
+            edge.channel for edge in self.edges
+            if edge.downstream == node_name and edge.status == SAFE
+        }
+
+
+class _PlanCache:
+    """Small LRU of compiled plans keyed by topology hash"""
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self._plans: "OrderedDict[str, GraphPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[GraphPlan]:
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+            return plan
+
+    def put(self, key: str, plan: GraphPlan):
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_size:
+                self._plans.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+
+
+plan_cache = _PlanCache()
+
+
+def plan_key(config: Dict, mode: str = "strict") -> str:
+    """Hash the parts of a config that affect type checking.
+
+    Envelopes are declared on node classes, so only names, types and
+    input wiring matter - params can change without invalidating a plan.
+    """
+    topology = [
+        [n.get('name'), n.get('type'), list(n.get('inputs', []))]
+        for n in config.get('nodes', [])
+    ]
+    raw = json.dumps([mode, topology], sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def compile_plan(config: Dict, resolve: Callable[[str], Type], mode: str = "strict") -> GraphPlan:
+    """Check every edge of a config, reusing a cached plan when possible"""
+    key = plan_key(config, mode)
+    plan = plan_cache.get(key)
+    if plan is not None:
+        logger.debug(f"Using cached graph plan {key[:8]}")
+        return plan
+
+    plan = _compile(config, resolve, mode, key)
+    plan_cache.put(key, plan)
+    return plan
+
+
+def _compile(config: Dict, resolve: Callable[[str], Type], mode: str, key: str) -> GraphPlan:
+    errors: List[str] = []
+    warnings: List[str] = []
+    classes: Dict[str, Type] = {}
+    inputs: Dict[str, List[str]] = {}
+
+    # Resolve classes and validate structure
+    for node_config in config.get('nodes', []):
+        name = node_config.get('name')
+        if not name:
+            errors.append("All nodes must have a 'name' field")
+            continue
+        if name in classes:
+            errors.append(f"Duplicate node name: {name}")
+            continue
+        try:
+            classes[name] = resolve(node_config['type'])
+        except (KeyError, ValueError) as e:
+            errors.append(f"Node '{name}': {e}")
+            continue
+        inputs[name] = list(node_config.get('inputs', []))
+
+    for name, refs in inputs.items():
+        for ref in refs:
+            if ref not in classes:
+                errors.append(f"Unknown input reference '{ref}' for node '{name}'")
+
+    order = topological_order(inputs)
+
+    # Propagate output envelopes in topological order
+    envelopes: Dict[str, Dict[str, Optional[Set]]] = {}
+    for name in order:
+        node_class = classes[name]
+        if getattr(node_class, 'PASSTHROUGH_OUTPUT', False):
+            upstream = [envelopes[ref] for ref in inputs[name] if ref in envelopes]
+            envelopes[name] = _union_envelopes(upstream)
+        else:
+            envelopes[name] = {
+                dim: _as_set(getattr(node_class, attr, None))
+                for dim, attr, _, _ in _DIMENSIONS
+            }
+
+    edges: List[EdgeCheck] = []
+    if mode != "off":
+        for name in order:
+            for ref in inputs[name]:
+                if ref not in classes:
+                    continue
+                edge = _check_edge(ref, name, envelopes[ref], classes[name])
+                edges.append(edge)
+                if edge.status == INCOMPATIBLE:
+                    message = (f"Edge {ref} -> {name} can never deliver: "
+                               f"{'; '.join(edge.reasons)}")
+                    (errors if mode == "strict" else warnings).append(message)
+
+    for message in warnings:
+        logger.warning(message)
+
+    return GraphPlan(key=key, order=order, edges=edges, errors=errors, warnings=warnings)
+
+
+def _check_edge(upstream: str, downstream: str, envelope: Dict, node_class: Type) -> EdgeCheck:
+    status = SAFE
+    reasons = []
+    for dim, _, accepted_attr, universe in _DIMENSIONS:
+        produced = envelope.get(dim)
+        accepted = set(getattr(node_class, accepted_attr, set()))
+        if accepted >= set(universe):
+            continue
+        if produced is None:
+            status = RUNTIME if status == SAFE else status
+        elif produced <= accepted:
+            continue
+        elif produced & accepted:
+            status = RUNTIME if status == SAFE else status
+        else:
+            status = INCOMPATIBLE
+            reasons.append(
+                f"{dim} {sorted(p.value for p in produced)} not in "
+                f"{sorted(getattr(a, 'value', str(a)) for a in accepted)}"
+            )
+    return EdgeCheck(upstream, downstream, f"{upstream}_out", status, reasons)
+
+
+def _as_set(values) -> Optional[Set]:
+    return set(values) if values is not None else None
+
+
+def _union_envelopes(envelopes: List[Dict]) -> Dict[str, Optional[Set]]:
+    merged = {}
+    for dim, _, _, _ in _DIMENSIONS:
+        values = [env.get(dim) for env in envelopes]
+        if not values or any(v is None for v in values):
+            merged[dim] = None
+        else:
+            merged[dim] = set().union(*values)
+    return merged
+
+
+def topological_order(inputs: Dict[str, List[str]]) -> List[str]:
+    """Kahn ordering of node names; nodes on cycles keep config order at the end"""
+    indegree = {name: 0 for name in inputs}
+    downstream: Dict[str, List[str]] = {name: [] for name in inputs}
+    for name, refs in inputs.items():
+        for ref in refs:
+            if ref in downstream:
+                downstream[ref].append(name)
+                indegree[name] += 1
+
+    ready = deque(name for name in inputs if indegree[name] == 0)
+    order = []
+    while ready:
+        name = ready.popleft()
+        order.append(name)
+        for child in downstream[name]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                ready.append(child)
+
+    if len(order) < len(inputs):
+        cyclic = [name for name in inputs if name not in order]
+        logger.debug(f"Cycle detected among nodes: {cyclic}")
+        order.extend(cyclic)
+    return order
@@ -0,0 +1,134 @@
+# framework/core/manifest.py
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import pkgutil
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger('manifest')
+
+MANIFEST_VERSION = 1
+
+
+def default_manifest_path() -> Path:
+    """Location of the on-disk node manifest"""
+    override = os.environ.get("STREAMLET_NODE_MANIFEST")
+    if override:
+        return Path(override)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "streamlet" / "node_manifest.json"
+
+
+def discover(package_path: Iterable[str], prefix: str, manifest_path: Optional[Path] = None) -> List[Dict]:
+    """Return manifest entries for every node module in a package.
+
+    Modules whose file is unchanged since the manifest was written are not
+    imported; only new or modified modules are imported to refresh their
+    entries. The refreshed manifest is written back to disk.
+
+    Import failures (usually a missing optional dependency) are cached the
+    same way, so they are logged once rather than on every start. Editing
+    the module, or deleting the manifest after installing the dependency,
+    retries the import.
+    """
+    manifest_path = manifest_path or default_manifest_path()
+    cached = _load(manifest_path)
+    modules: Dict[str, Dict] = {}
+    changed = False
+
+    for module_name, origin in _scan(package_path, prefix):
+        fingerprint = _fingerprint(origin)
+        previous = cached.get(module_name)
+        if previous and previous.get("fingerprint") == fingerprint:
+            modules[module_name] = previous
+            continue
+
+        entries = _import_entries(module_name)
+        changed = True
+        if entries is None:
+            modules[module_name] = {"fingerprint": fingerprint, "nodes": [], "failed": True}
+            continue
+        modules[module_name] = {"fingerprint": fingerprint, "nodes": entries}
+
+    if changed or set(modules) != set(cached):
+        _save(manifest_path, modules)
+
+    return [entry for module in modules.values() for entry in module["nodes"]]
+
+
+def _scan(package_path: Iterable[str], prefix: str):
+    """Yield (module name, source file) for candidate node modules"""
+    for _, module_name, is_pkg in pkgutil.walk_packages(package_path, prefix=prefix):
+        if is_pkg or "__" in module_name or "base_node" in module_name:
+            continue
+        spec = importlib.util.find_spec(module_name)
+        if spec is None or not spec.origin:
+            continue
+        yield module_name, spec.origin
+
+
+def _fingerprint(origin: str) -> List[int]:
+    stat = os.stat(origin)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _import_entries(module_name: str) -> Optional[List[Dict]]:
+    """Import a node module and describe the node classes it exports"""
+    from framework.core.registry import NodeRegistry
+
+    try:
+        module = importlib.import_module(module_name)
+    except Exception as e:
+        logger.error(f"Failed to load {module_name}: {str(e)}")
+        return None
+
+    entries = []
+    for cls in getattr(module, 'NODE_CLASSES', []):
+        node_type = getattr(cls, 'node_type', None)
+        if not node_type:
+            continue
+        try:
+            params_schema = cls.get_param_schema()
+        except Exception as e:
+            logger.warning(f"Could not build params schema for {node_type}: {str(e)}")
+            params_schema = {"type": "object"}
+        entries.append({
+            "type": node_type,
+            "module": module_name,
+            "class": cls.__name__,
+            "category": NodeRegistry.category_for(cls),
+            "tags": list(getattr(cls, 'tags', [])),
+            "params_schema": params_schema,
+        })
+    return entries
+
+
+def _load(path: Path) -> Dict[str, Dict]:
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable node manifest {path}: {str(e)}")
+        return {}
+
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("modules", {})
+
+
+def _save(path: Path, modules: Dict[str, Dict]):
+    """Atomically write the manifest; failures only cost the cache"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "modules": modules}, f, default=str)
+        os.replace(tmp_path, path)
+        logger.debug(f"Node manifest written to {path}")
+    except OSError as e:
+        logger.warning(f"Could not write node manifest {path}: {str(e)}")
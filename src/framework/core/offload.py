@@ -0,0 +1,191 @@
+# framework/core/offload.py
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+from framework.data.data_packet import DataPacket
+
+logger = logging.getLogger('offload')
+
+# Packet content at least this large travels through shared memory
+SHM_THRESHOLD = 64 * 1024
+
+
+# ==============
+# Worker Process
+# ==============
+class _CaptureBus:
+    """Stand-in DataBus for node replicas: collects what they publish"""
+
+    def __init__(self):
+        self.published: List[Tuple[str, Any]] = []
+
+    def publish(self, channel: str, data: Any):
+        self.published.append((channel, data))
+
+
+_replicas: Dict[str, Any] = {}
+
+
+def _init_worker():
+    import framework.nodes  # noqa: F401 - register node types
+
+
+def _get_replica(spec: Dict):
+    replica = _replicas.get(spec['key'])
+    if replica is None:
+        from framework.core.registry import NodeRegistry
+        replica = NodeRegistry.get_class(spec['type'])(spec['config'])
+        replica.inputs = list(spec['inputs'])
+        replica.outputs = list(spec['outputs'])
+        replica.input_buffers = {channel: [] for channel in replica.inputs}
+        replica.trusted_inputs = set(spec['trusted_inputs'])
+        replica.pipeline = SimpleNamespace(id=spec['pipeline_id'], in_frame=False)
+        replica.data_bus = _CaptureBus()
+        # Drop replicas of older configs of the same node
+        for key in [k for k in _replicas if k.startswith(spec['node_id'] + ":")]:
+            del _replicas[key]
+        _replicas[spec['key']] = replica
+    return replica
+
+
+def _run_in_worker(spec: Dict, payload: Dict, channel: str) -> List[Tuple[str, Any]]:
+    """Deliver one packet to this worker's replica of a node and return its output"""
+    replica = _get_replica(spec)
+    replica.data_bus.published = []
+    replica.on_data(_unpack(payload), channel)
+    return [
+        (out_channel, data.model_dump() if isinstance(data, DataPacket) else data)
+        for out_channel, data in replica.data_bus.published
+    ]
+
+
+# =================
+# Payload Transport
+# =================
+def _pack(data: Any, threshold: int) -> Tuple[Dict, Optional[shared_memory.SharedMemory]]:
+    """Prepare a delivery for pickling, moving large content to shared memory"""
+    is_packet = isinstance(data, DataPacket)
+    body = data.model_dump() if is_packet else {"content": data}
+    content = body['content']
+    raw = content.encode() if isinstance(content, str) else content
+    if isinstance(raw, (bytes, bytearray)) and len(raw) >= threshold:
+        shm = shared_memory.SharedMemory(create=True, size=len(raw))
+        shm.buf[:len(raw)] = raw
+        body['content'] = None
+        body['shm'] = (shm.name, len(raw), isinstance(content, str))
+        return {"packet": is_packet, "body": body}, shm
+    return {"packet": is_packet, "body": body}, None
+
+
+def _unpack(payload: Dict) -> Any:
+    body = payload['body']
+    if 'shm' in body:
+        name, size, is_text = body.pop('shm')
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            raw = bytes(shm.buf[:size])
+        finally:
+            shm.close()
+            # The parent owns and unlinks the block
+            resource_tracker.unregister(shm._name, "shared_memory")
+        body['content'] = raw.decode() if is_text else raw
+    return DataPacket.model_validate(body) if payload['packet'] else body['content']
+
+
+# =============
+# Parent Side
+# =============
+class ProcessOffload:
+    """Warm process pool that runs deliveries for nodes with execution "process".
+
+    Each worker keeps a replica of the node built from its config, so node
+    code runs unchanged; whatever the replica publishes is republished on
+    the real DataBus. Replicas hold their own state, which makes this a fit
+    for stateless, CPU-bound nodes (regex over large text, similarity,
+    parsing) rather than nodes that aggregate across packets.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_queue: int = 100,
+                 shm_threshold: int = SHM_THRESHOLD):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shm_threshold = shm_threshold
+        self._executor = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_workers + max_queue)
+        self.rejected = 0
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker
+                )
+            return self._executor
+
+    @staticmethod
+    def _spec(node) -> Dict:
+        config_key = hashlib.sha1(
+            json.dumps(node.config, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return {
+            "key": f"{node.node_id}:{config_key}",
+            "node_id": node.node_id,
+            "type": node.node_type,
+            "config": node.config,
+            "inputs": node.inputs,
+            "outputs": node.outputs,
+            "trusted_inputs": sorted(node.trusted_inputs),
+            "pipeline_id": getattr(getattr(node, 'pipeline', None), 'id', None),
+        }
+
+    def submit(self, node, data: Any, channel: str) -> Optional[Future]:
+        """Run node.on_data(data, channel) in the pool; None if the pool is saturated"""
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            return None
+        shm = None
+        try:
+            payload, shm = _pack(data, self.shm_threshold)
+            future = self.executor.submit(_run_in_worker, self._spec(node), payload, channel)
+        except Exception:
+            self._slots.release()
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            raise
+
+        def _done(f: Future):
+            self._slots.release()
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            if f.cancelled() or f.exception() is not None:
+                return
+            for out_channel, result in f.result():
+                if isinstance(result, dict) and 'data_type' in result:
+                    result = DataPacket.model_validate(result)
+                node.data_bus.publish(out_channel, result)
+
+        future.add_done_callback(_done)
+        return future
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+process_offload = ProcessOffload(
+    max_workers=int(os.environ.get("STREAMLET_PROCESS_WORKERS", 0)) or None
+)
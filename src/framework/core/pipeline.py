@@ -1,40 +1,98 @@
 import logging
 from pathlib import Path
-from .data_bus import DataBus
+from .data_bus import DataBus, FrameSyncBus
 from .registry import NodeRegistry
+from .graph import compile_plan, TYPE_CHECK_MODES
+from .spill_queue import SpillQueue
+from .state_store import StateStore
+from .scheduler import Scheduler
+from .bulkhead import create_bulkheads
+from .offload import process_offload
+from .rate_control import AdaptiveRateController
+from .quota import ResourceQuota
+from .watchdog import StallLimits, watchdog
+from .flow_control import FlowControl
 from .telemetry import telemetry  # Import telemetry
 from pydantic import ValidationError
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import json
+import inspect
+import multiprocessing
 import threading
 import time
 import copy
 import re
 
+# How packets travel between nodes:
+#   threaded   - each publish is delivered on a worker thread (default)
+#   frame_sync - deliveries run on the frame thread in topological order
+DELIVERY_MODES = ("threaded", "frame_sync")
+
 class Pipeline:
-    def __init__(self, config_source: Union[str, Dict], pipeline_id: str):
+    def __init__(self, config_source: Union[str, Dict], pipeline_id: str,
+                 state_store: Optional[StateStore] = None,
+                 executor=None, scheduler: Optional[Scheduler] = None):
         self.id = pipeline_id
         self._running = threading.Event()
         self._thread = None
         self.nodes = []
-        self.data_bus = DataBus(max_workers=20)
+        # Shared executor/scheduler when hosted by PipelineManager, else our own threads
+        self.executor = executor
+        self.scheduler = scheduler
         self.config = self._load_config(config_source)
+        self.quota = ResourceQuota.from_settings(self.config.get('settings', {}).get('quota'))
+        self.data_bus = self._create_data_bus()
         self.logger = logging.getLogger('pipeline')
         self.logger.setLevel(logging.DEBUG)
         self.node_map = {}
+        self.frame_nodes = []  # Nodes in topological order, processed each frame
+        self.plan = None
+        self.template = None  # Set by PipelineTemplate.instantiate
+        self.bulkheads = None  # io/cpu executors, created when a node needs one
+        self.flow_control = None  # Credit-based backpressure (settings.flow_control)
         self._config_lock = threading.RLock()
         self._build_lock = threading.Lock()
         
         # FPS configuration and tracking
-        self.fps_limit = self._get_fps_limit()
-        self.frame_duration = 1.0 / self.fps_limit if self.fps_limit > 0 else 0
+        self._configure_frame_rate()
         self.frame_count = 0
         self.last_fps_report = time.time()
         self.current_fps = 0
         self.fps_telemetry_interval = 1.0  # Report FPS every second
+        self.frame_overruns = 0  # Frames over budget since the last report
+
+        # Resource usage, sampled every quota interval (settings.quota)
+        self.usage: Dict[str, Any] = {}
+        self.quota_action = None  # Policy in force while over quota
+        self._frame_cpu = 0.0
+        self._last_usage_sample = time.time()
+
+        # Upper bound for draining in-flight packets on shutdown
+        self.shutdown_timeout = float(self.config.get('settings', {}).get('shutdown_timeout', 5.0))
 
         self.in_frame = False
 
+        # Node state snapshots
+        settings = self.config.get('settings', {})
+        # A store opened from settings.state_store is ours: closed on shutdown, reopened by run
+        self._owns_state_store = state_store is None
+        self.state_store = state_store
+        self._open_state_store()
+        self.state_key = settings.get('state_key', pipeline_id)
+        self.snapshot_interval = float(settings.get('snapshot_interval', 10.0))
+        self._last_snapshot = time.time()
+
+    def _configure_frame_rate(self):
+        """Set the configured fps_limit and the rate frames actually run at from settings"""
+        self.fps_limit = self._get_fps_limit()
+        # Optional load-aware frame rate (settings.adaptive_fps) moves effective_fps only
+        self.rate_controller = AdaptiveRateController.from_settings(
+            self.fps_limit, self.config.get('settings', {}).get('adaptive_fps')
+        )
+        self.effective_fps = self.rate_controller.fps if self.rate_controller else self.fps_limit
+        self.frame_duration = 1.0 / self.effective_fps if self.effective_fps > 0 else 0
+
     def _get_fps_limit(self) -> float:
         """Extract FPS limit from configuration"""
         try:
@@ -53,6 +111,14 @@ class Pipeline:
             
         return 60.0  # Default value
 
+    def _get_type_check_mode(self) -> str:
+        """Extract build-time type check mode from configuration"""
+        mode = self.config.get('settings', {}).get('type_check', 'strict')
+        if mode not in TYPE_CHECK_MODES:
+            self.logger.warning(f"Invalid type_check value '{mode}', using 'strict'")
+            return 'strict'
+        return mode
+
     def _send_fps_telemetry(self):
         """Send FPS telemetry data"""
         telemetry.broadcast_sync({
@@ -64,44 +130,245 @@ class Pipeline:
         })
         self.logger.debug(f"FPS telemetry sent: {self.current_fps:.2f}")
 
-    def shutdown(self):
-        """Safe thread termination with ownership check"""
+    def _send_overrun_telemetry(self):
+        """Report frames that exceeded their time budget since the last report"""
+        telemetry.broadcast_sync({
+            "pipeline_id": self.id,
+            "node_id": None,
+            "metric": "frame_overrun",
+            "value": {
+                "overruns": self.frame_overruns,
+                "frames": self.frame_count,
+                "budget_ms": self.frame_duration * 1000,
+                "fps_limit": self.fps_limit,
+                "effective_fps": self.effective_fps,
+                "backlog": self.data_bus.pending_count()
+            },
+            "timestamp": time.time()
+        })
+        self.frame_overruns = 0
+
+    def sample_usage(self) -> Dict[str, Any]:
+        """Measure resource use since the last sample and report it as telemetry"""
+        now = time.time()
+        elapsed = max(now - self._last_usage_sample, 1e-6)
+        cpu_seconds = self._frame_cpu + self.data_bus.take_cpu_time()
+        self._frame_cpu = 0.0
+        self._last_usage_sample = now
+        self.usage = {
+            "threads": self.data_bus.running_workers(),
+            "buffered_bytes": sum(node.buffered_bytes() for node in self.nodes),
+            "queued_deliveries": self.data_bus.pending_count(),
+            "cpu_seconds": cpu_seconds,
+            "cpu_percent": 100.0 * cpu_seconds / elapsed,
+            "quota_action": self.quota_action,
+        }
+        telemetry.broadcast_sync({
+            "pipeline_id": self.id,
+            "node_id": None,
+            "metric": "resource_usage",
+            "value": self.usage,
+            "timestamp": now
+        })
+        return self.usage
+
+    def _enforce_quota(self):
+        """Apply the quota policy while usage is over budget"""
+        exceeded = self.quota.exceeded(self.usage)
+        if not exceeded:
+            if self.quota_action:
+                self.logger.info(f"Pipeline {self.id} back under quota")
+                self.quota_action = None
+            return
+
+        self.logger.warning(f"Pipeline {self.id} over quota ({', '.join(exceeded)}), applying {self.quota.policy}")
+        telemetry.broadcast_sync({
+            "pipeline_id": self.id,
+            "node_id": None,
+            "metric": "quota_exceeded",
+            "value": {"exceeded": exceeded, "policy": self.quota.policy},
+            "timestamp": time.time()
+        })
+        if self.quota.policy == "shed":
+            self.data_bus.discard_pending()
+            for node in self.nodes:
+                node.shed_buffered()
+        else:
+            self.quota_action = self.quota.policy
+
+    # =====================
+    # Stall Handling
+    # =====================
+    def check_stalls(self) -> List[str]:
+        """Apply the watchdog policy to stalled nodes and release recovered ones.
+
+        Called periodically by the watchdog thread; returns the names of
+        nodes found stalled in this check.
+        """
+        now = time.monotonic()
+        stalled = []
+        for node in list(self.nodes):
+            if node.stall_limits is None:
+                continue
+            reason = node.stall_limits.check(node, now)
+            if reason and not node.stalled:
+                stalled.append(node.name)
+                self._handle_stall(node, reason, now)
+            elif not reason and node.stalled:
+                self.logger.info(f"Node {node.name} recovered")
+                node.recover()
+                self._send_stall_telemetry(node, "node_recovered", {})
+        return stalled
+
+    def _handle_stall(self, node, reason: str, now: float):
+        policy = node.stall_limits.policy
+        self.logger.warning(f"Node {node.name} stalled ({reason}), applying {policy}")
+        self._send_stall_telemetry(node, "node_stalled", {
+            "reason": reason,
+            "busy_s": node.busy_for(now),
+            "backlog": node.backlog(),
+            "policy": policy,
+        })
+        if policy == "restart":
+            self.restart_node(node.name)
+            return
+        node.stalled = True
+        if policy == "skip":
+            node.shed_buffered()
+        else:
+            dropped = node.shed_to_latest()
+            if dropped:
+                node.shed_count += dropped
+                node.emit_telemetry("packet_shed", {"reason": "stalled", "total": node.shed_count})
+
+    def _send_stall_telemetry(self, node, metric: str, value: Dict[str, Any]):
+        telemetry.broadcast_sync({
+            "pipeline_id": self.id,
+            "node_id": node.name,
+            "metric": metric,
+            "value": value,
+            "timestamp": time.time()
+        })
+
+    def restart_node(self, node_name: str):
+        """Replace a node with a fresh instance wired to the same channels.
+
+        The old instance is stopped in the background, since a stalled node
+        may never return from the call it is stuck in.
+        """
+        with self._config_lock:
+            old = self.node_map.get(node_name)
+            if old is None:
+                raise ValueError(f"Node {node_name} not found")
+            new, error = self._construct_node(getattr(old, 'node_class', type(old)), old.config)
+            if error:
+                raise ValueError(f"Failed to restart node {error}")
+
+            for attr in ('data_bus', 'pipeline', 'inputs', 'outputs', 'trusted_inputs',
+                         'execution_class', 'bulkhead', 'offload', 'stall_limits', 'flow'):
+                setattr(new, attr, getattr(old, attr))
+            new.input_buffers = {channel: new.new_input_buffer() for channel in new.inputs}
+            self.data_bus.replace_subscriber(old, new)
+            self.nodes[self.nodes.index(old)] = new
+            self.node_map[node_name] = new
+            self.frame_nodes = [new if n is old else n for n in self.frame_nodes]
+
+            if self._running.is_set() and hasattr(new, 'start'):
+                new.start()
+        old.stalled = True  # Anything still holding the old instance is shed
+        threading.Thread(target=self._stop_node, args=(old,), daemon=True).start()
+        self.logger.info(f"Node {node_name} restarted")
+        return new
+
+    def shutdown(self, timeout: Optional[float] = None):
+        """Stop sources, drain in-flight packets until a deadline, then stop the rest"""
         if self._running.is_set():
-            self.logger.info(f"Shutting down pipeline {self.id}")
+            timeout = self.shutdown_timeout if timeout is None else timeout
+            deadline = time.monotonic() + timeout
+            self.logger.info(f"Shutting down pipeline {self.id} (deadline {timeout:.1f}s)")
             self._running.clear()
-            self.data_bus.set_enabled(False)
+            watchdog.unwatch(self)
 
-            # First stop all nodes to release resources
-            for node in self.nodes:
-                try:
-                    if hasattr(node, 'stop'):
-                        node.stop()
-                    elif hasattr(node, 'cleanup'):
-                        node.cleanup()
-                except Exception as e:
-                    self.logger.error(f"Error stopping node {node.name}: {str(e)}")
-            
-            # Then handle the main thread
+            # 1. Stop producing frames
+            if self.scheduler:
+                if not self.scheduler.remove(self, timeout=max(0, deadline - time.monotonic())):
+                    self.logger.warning("Pipeline frame did not finish in time")
+                self._report_final_fps()
             pipeline_thread = self._thread
             self._thread = None
-            
             if pipeline_thread and pipeline_thread != threading.current_thread():
                 try:
-                    self.logger.info("Waiting for pipeline thread to finish...")
-                    pipeline_thread.join(timeout=5)
+                    pipeline_thread.join(timeout=max(0, deadline - time.monotonic()))
                     if pipeline_thread.is_alive():
-                        self.logger.warning("Pipeline thread did not terminate in time")
-                        try:
-                            import ctypes
-                            ctypes.pythonapi.PyThreadState_SetAsyncExc(
-                                ctypes.c_long(pipeline_thread.ident), 
-                                ctypes.py_object(SystemExit)
-                            )
-                        except:
-                            pass
+                        self.logger.warning("Pipeline thread did not finish its frame in time")
                 except RuntimeError as e:
                     self.logger.error(f"Error joining thread: {str(e)}")
 
+            ordered = self._nodes_in_order()
+            sources = [n for n in ordered if self._is_source(n)]
+            others = [n for n in ordered if not self._is_source(n)]
+
+            # 2. Stop sources so nothing new enters the graph
+            for node in sources:
+                self._stop_node(node)
+
+            # 3. Let in-flight packets flow through the graph
+            completed = self.data_bus.completed
+            drained = self.data_bus.drain(max(0, deadline - time.monotonic()))
+            delivered = self.data_bus.completed - completed
+
+            # 4. Discard what is left, but let running deliveries finish
+            self.data_bus.set_enabled(False)
+            discarded = 0 if drained else self.data_bus.discard_pending()
+            if not drained:
+                self.data_bus.drain(max(0, deadline - time.monotonic()))
+                self.logger.warning(f"Shutdown deadline reached, {discarded} packets discarded")
+
+            telemetry.broadcast_sync({
+                "pipeline_id": self.id,
+                "node_id": None,
+                "metric": "shutdown",
+                "value": {"drained": delivered, "discarded": discarded, "timed_out": not drained},
+                "timestamp": time.time()
+            })
+
+            # 5. Stop the remaining nodes in topological order
+            for node in others:
+                self._stop_node(node)
+
+            # Persist final node state so the next start resumes warm
+            self.snapshot_state()
+
+        if self._owns_state_store and self.state_store is not None:
+            self.state_store.close()
+            self.state_store = None
+
+    def _open_state_store(self):
+        path = self.config.get('settings', {}).get('state_store')
+        if self._owns_state_store and self.state_store is None and path:
+            self.state_store = StateStore(path)
+
+    def _nodes_in_order(self):
+        """Nodes in topological order (config order if not built from a plan)"""
+        if not self.plan:
+            return list(self.nodes)
+        ordered = [self.node_map[name] for name in self.plan.order if name in self.node_map]
+        return ordered + [n for n in self.nodes if n not in ordered]
+
+    @staticmethod
+    def _is_source(node) -> bool:
+        return node.IS_GENERATOR or node.MIN_INPUTS == 0
+
+    def _stop_node(self, node):
+        """Release node resources"""
+        try:
+            if hasattr(node, 'stop'):
+                node.stop()
+            elif hasattr(node, 'cleanup'):
+                node.cleanup()
+        except Exception as e:
+            self.logger.error(f"Error stopping node {node.name}: {str(e)}")
+
     def _load_config(self, source: Union[str, Dict]) -> Dict:
         """Load config from file path or dict"""
         if isinstance(source, str):
@@ -126,27 +393,32 @@ class Pipeline:
             # Clear existing nodes and node map
             self.nodes = []
             self.node_map = {}
+            self.frame_nodes = []
             
             """Instantiate and connect nodes using declarative names"""
             self.logger.info("Building pipeline with %d nodes", len(self.config['nodes']))
-            
-            # First pass: create all nodes
-            for node_config in self.config['nodes']:
-                if 'name' not in node_config:
-                    raise ValueError("All nodes must have a 'name' field")
-                    
-                node_name = node_config['name']
-                if node_name in self.node_map:
-                    raise ValueError(f"Duplicate node name: {node_name}")
-                
-                node = NodeRegistry.create(
-                    node_type=node_config['type'],
-                    config=node_config
+
+            # Statically check the graph before instantiating anything
+            if self.template is not None:
+                self.plan = self.template.plan
+                resolve = self.template.classes.__getitem__
+            else:
+                self.plan = compile_plan(
+                    self.config,
+                    resolve=NodeRegistry.get_class,
+                    mode=self._get_type_check_mode()
                 )
+                resolve = NodeRegistry.get_class
+            if self.plan.errors:
+                raise ValueError("Pipeline graph check failed:\n  - " +
+                                 "\n  - ".join(self.plan.errors))
+            
+            # First pass: create all nodes (constructors run concurrently)
+            for node in self._construct_nodes(resolve):
                 node.data_bus = self.data_bus
                 node.pipeline = self
                 self.nodes.append(node)
-                self.node_map[node_name] = node
+                self.node_map[node.name] = node
 
             # Second pass: connect nodes by name
             for node in self.nodes:
@@ -156,6 +428,9 @@ class Pipeline:
                 output_channel = f"{node_name}_out"
                 node.outputs = [output_channel]
                 self.data_bus.register_channel(output_channel)
+                if node.config.get('spill_output'):
+                    # Bound in-flight deliveries on this edge, spilling the rest to disk
+                    self.data_bus.set_spill(output_channel, **node.config['spill_output'])
                 
                 # Resolve inputs to upstream outputs
                 node.inputs = []
@@ -168,18 +443,121 @@ class Pipeline:
                     self.data_bus.subscribe(node, upstream_channel)
                     node.inputs.append(upstream_channel)
 
+                # Edges proven safe skip runtime validation
+                node.trusted_inputs = self.plan.safe_inputs(node_name)
+
+                # Route blocking nodes to their bulkhead, CPU-heavy ones to worker processes
+                if node.execution_class == "process" and multiprocessing.current_process().daemon:
+                    # Daemonic processes (ProcessPipeline workers) can't start a process pool
+                    self.logger.warning(f"Node {node_name} runs in the cpu bulkhead: "
+                                        "process offload is unavailable inside a daemon process")
+                    node.execution_class = "cpu"
+                node.bulkhead = self._get_bulkhead(node)
+                node.offload = process_offload if node.execution_class == "process" else None
+
+                # Stall detection (settings.watchdog, overridable per node)
+                node.stall_limits = StallLimits.from_settings(
+                    self.config.get('settings', {}).get('watchdog'), node.config.get('watchdog')
+                )
+
             # Third pass: initialize input buffers
             for node in self.nodes:
                 node.input_buffers = {}
                 for input_channel in node.inputs:
-                    node.input_buffers[input_channel] = []
+                    node.input_buffers[input_channel] = node.new_input_buffer()
 
             # Fourth pass: setup reference subscriptions
             for node in self.nodes:
                 self._setup_reference_subscriptions(node)
 
+            self.frame_nodes = self._nodes_in_order()
+            self.flow_control = FlowControl.from_settings(
+                self.config.get('settings', {}).get('flow_control'), self.data_bus
+            )
+            for node in self.nodes:
+                node.flow = self.flow_control
+            if isinstance(self.data_bus, FrameSyncBus):
+                self.data_bus.set_ranks({name: rank for rank, name in enumerate(self.plan.order)})
+
+            # Fifth pass: resume from the last durable snapshot
+            self._open_state_store()
+            if self.state_store:
+                self._apply_node_states(self.state_store.load(self.state_key))
+
             self.logger.debug("Pipeline construction completed")
 
+    def _construct_nodes(self, resolve) -> List[Any]:
+        """Instantiate every configured node, in config order.
+
+        Constructors may block (model loading, client setup, connecting),
+        so they run on a build pool of settings.build_workers threads. All
+        failures are collected into one error; nodes that were created are
+        stopped again.
+        """
+        names = set()
+        for node_config in self.config['nodes']:
+            if 'name' not in node_config:
+                raise ValueError("All nodes must have a 'name' field")
+            if node_config['name'] in names:
+                raise ValueError(f"Duplicate node name: {node_config['name']}")
+            names.add(node_config['name'])
+
+        # Resolve classes up front so lazy module imports stay on this thread
+        classes = [resolve(node_config['type']) for node_config in self.config['nodes']]
+
+        workers = int(self.config.get('settings', {}).get('build_workers', 8))
+        workers = max(1, min(workers, len(classes)))
+        jobs = list(zip(classes, self.config['nodes']))
+        if workers == 1:
+            results = [self._construct_node(cls, cfg) for cls, cfg in jobs]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"build-{self.id}") as pool:
+                results = list(pool.map(lambda job: self._construct_node(*job), jobs))
+
+        errors = [error for _, error in results if error]
+        nodes = [node for node, _ in results if node is not None]
+        if errors:
+            for node in nodes:
+                self._stop_node(node)
+            raise ValueError("Failed to construct nodes:\n  - " + "\n  - ".join(errors))
+        return nodes
+
+    @staticmethod
+    def _construct_node(node_class, node_config: Dict) -> Tuple[Any, Optional[str]]:
+        try:
+            if node_config.get('key_by') or int(node_config.get('parallelism', 1)) > 1:
+                # One instance per key, partitioned over parallel lanes
+                from framework.nodes.keyed import KeyedNode
+                return KeyedNode(node_config, node_class), None
+            return node_class(node_config), None
+        except Exception as e:
+            return None, f"{node_config['name']} ({node_config['type']}): {str(e)}"
+
+    def _get_bulkhead(self, node):
+        execution_class = node.execution_class
+        if execution_class in ("inline", "process"):
+            return None
+        if self.bulkheads is None:
+            self.bulkheads = create_bulkheads(self.config.get('settings', {}))
+        return self.bulkheads[execution_class]
+
+    def close(self):
+        """Stop the pipeline and release its executors"""
+        self.shutdown()
+        self._release_data_bus()
+        if self.bulkheads:
+            for bulkhead in self.bulkheads.values():
+                bulkhead.shutdown(wait=False)
+            self.bulkheads = None
+
+    def _release_data_bus(self):
+        """Shut down the DataBus and delete the spill files of its edges and node inputs"""
+        self.data_bus.shutdown(wait=False)
+        for node in self.nodes:
+            for buffer in node.input_buffers.values():
+                if isinstance(buffer, SpillQueue):
+                    buffer.close()
+
     def _setup_reference_subscriptions(self, node):
         """Subscribe to reference nodes for dynamic parameters"""
         if not hasattr(node, 'references') or not node.references:
@@ -203,41 +581,88 @@ class Pipeline:
                 node.logger.debug(f"Already subscribed to {ref_node_name} via inputs")
 
     
+    # =====================
+    # State Snapshots
+    # =====================
+    def _collect_node_states(self) -> Dict[str, Tuple[str, Any]]:
+        """Gather {node_name: (node_type, state)} from stateful nodes"""
+        states = {}
+        for node in self.nodes:
+            try:
+                state = node.save_state()
+            except Exception as e:
+                self.logger.error(f"Failed to snapshot node {node.name}: {str(e)}")
+                continue
+            if state is not None:
+                states[node.name] = (node.node_type, state)
+        return states
+
+    def _apply_node_states(self, states: Dict[str, Tuple[str, Any]]):
+        """Restore snapshots onto nodes with matching name and type"""
+        for node in self.nodes:
+            if node.name not in states:
+                continue
+            node_type, state = states[node.name]
+            if node_type != node.node_type:
+                self.logger.debug(f"Skipping snapshot for {node.name}: type changed")
+                continue
+            try:
+                node.restore_state(state)
+            except Exception as e:
+                self.logger.error(f"Failed to restore node {node.name}: {str(e)}")
+
+    def snapshot_state(self) -> int:
+        """Write node state to the durable store, returning the node count"""
+        self._last_snapshot = time.time()
+        if not self.state_store:
+            return 0
+        states = self._collect_node_states()
+        try:
+            self.state_store.save(self.state_key, states)
+        except Exception as e:
+            self.logger.error(f"State snapshot failed: {str(e)}")
+            return 0
+        self.logger.debug(f"Snapshot of {len(states)} node states written")
+        return len(states)
+
     def update_config(self, new_config: dict):
         """Update pipeline configuration"""
         with self._config_lock:
             # Preserve node states if possible
-            node_states = {}
-            for node in self.nodes:
-                if hasattr(node, 'save_state'):
-                    node_states[node.name] = node.save_state()
+            node_states = self._collect_node_states()
             
             # Stop and clean up current pipeline
             self.shutdown()
             
-            # Create a new DataBus instance
-            self.data_bus = DataBus(max_workers=20)
+            # Update configuration
+            self.config = new_config
+            self.template = None
+            self.quota = ResourceQuota.from_settings(new_config.get('settings', {}).get('quota'))
+            self._configure_frame_rate()
+
+            # Replace the DataBus; the old one has drained, so release its workers
+            self._release_data_bus()
+            self.data_bus = self._create_data_bus()
             self.logger.debug("Created new DataBus instance")
             
             # Clear existing nodes and node map
             self.nodes = []
             self.node_map = {}
             
-            # Update configuration
-            self.config = new_config
-            
             # Rebuild pipeline
             self.build()
             
             # Restore node states
-            for node in self.nodes:
-                if node.name in node_states:
-                    node.restore_state(node_states[node.name])
+            self._apply_node_states(node_states)
                     
             # Restart if was running
             if self._running.is_set():
                 self.run()
     
+    def get_node(self, node_name: str):
+        """Get a built node by name"""
+        return self.node_map.get(node_name)
+
     def update_node_params(self, node_id: str, new_params: dict):
         """Update parameters for a specific node"""
         with self._config_lock:
@@ -275,6 +700,7 @@ class Pipeline:
             return
             
         self._running.set()
+        self._open_state_store()
         self.data_bus.set_enabled(True)  # Enable data flow
 
         # Initialize FPS tracking
@@ -289,88 +715,144 @@ class Pipeline:
             except Exception as e:
                 self.logger.error(f"Failed to start node {node.name}: {str(e)}")
 
-        self._thread = threading.Thread(target=self._run_loop)
-        self._thread.start()
+        if any(node.stall_limits for node in self.nodes):
+            watchdog.watch(self)
+
+        if self.scheduler:
+            self.logger.info("Starting pipeline execution on shared scheduler")
+            self.scheduler.add(self)
+        else:
+            self._thread = threading.Thread(target=self._run_loop)
+            self._thread.start()
+
+    def _create_data_bus(self) -> DataBus:
+        settings = self.config.get('settings', {})
+        delivery = settings.get('delivery', 'threaded')
+        if delivery not in DELIVERY_MODES:
+            raise ValueError(f"Unknown delivery mode '{delivery}'")
+        bus_class = FrameSyncBus if delivery == "frame_sync" else DataBus
+        if self.executor is not None:
+            return bus_class(executor=self.executor)
+        # Standalone pipelines get an elastic pool sized by settings
+        max_workers = settings.get('bus_max_workers', 20)
+        if self.quota and self.quota.max_threads:
+            max_workers = min(max_workers, self.quota.max_threads)
+        return bus_class(
+            max_workers=max_workers,
+            min_workers=settings.get('bus_min_workers', 1),
+            idle_timeout=settings.get('bus_idle_timeout', 30.0),
+        )
+
+    def _run_frame(self) -> float:
+        """Process one frame and return its processing time"""
+        # Start frame processing
+        self.in_frame = True
+        frame_start = time.time()
+        cpu_start = time.thread_time()
+        # Over quota, sources are paused or run every other frame
+        hold_sources = (self.quota_action == "pause" or
+                        (self.quota_action == "throttle" and self.frame_count % 2))
 
-    def _run_loop(self):
-        """Main processing loop for background execution"""
-        self.logger.info("Starting pipeline execution")
-        self.logger.debug(f"FPS limit: {self.fps_limit} (frame duration: {self.frame_duration:.4f}s)")
-        
         try:
-            while self._running.is_set():
-                # Start frame timer
-                frame_start = time.time()
-                
-                # Process active nodes only
-                for node in self.nodes:
-                    try:
-                        if node.should_process() and not node.IS_ASYNC_CAPABLE:
+            if self.flow_control:
+                self.flow_control.refresh(self.frame_nodes)
+            # Process active nodes only
+            for node in self.frame_nodes:
+                try:
+                    if self.flow_control and self._is_source(node) and not self._source_has_credit(node):
+                        continue
+                    if not node.should_process():
+                        continue
+                    if node.stalled or (hold_sources and node.IS_GENERATOR):
+                        continue
+                    if inspect.iscoroutinefunction(node.process):
+                        # Frames beyond max_in_flight are skipped while coroutines are busy
+                        node.run_async(node.process, shed=False)
+                    else:
+                        with node.activity():
                             node.process()
-                    except Exception as e:
-                        self.logger.error(f"Error processing node {node.name}: {str(e)}")
-                
-                # Calculate frame processing time
-                processing_time = time.time() - frame_start
-                
-                # FPS limiting logic
-                if self.fps_limit > 0:
-                    # Calculate sleep time to maintain FPS
-                    sleep_time = max(0, self.frame_duration - processing_time)
-                    if sleep_time > 0:
-                        time.sleep(sleep_time)
-                else:
-                    # Minimal sleep to prevent CPU hogging
-                    time.sleep(0.001)
-                
-                # Update FPS counters
-                self.frame_count += 1
-                current_time = time.time()
-                time_since_report = current_time - self.last_fps_report
-                
-                # Report FPS at regular intervals
-                if time_since_report >= self.fps_telemetry_interval:
-                    self.current_fps = self.frame_count / time_since_report
-                    self._send_fps_telemetry()
-                    self.frame_count = 0
-                    self.last_fps_report = current_time
-                
-        except Exception as e:
-            self.logger.error(f"Pipeline failed: {str(e)}", exc_info=True)
+                except Exception as e:
+                    self.logger.error(f"Error processing node {node.name}: {str(e)}")
+            # Frame-synchronous delivery: settle the graph before the frame ends
+            if isinstance(self.data_bus, FrameSyncBus):
+                self.data_bus.run_pending()
         finally:
-            # Send final FPS report
-            if self.frame_count > 0:
-                current_time = time.time()
-                self.current_fps = self.frame_count / (current_time - self.last_fps_report)
+            # End frame processing
+            self.in_frame = False
+            self._frame_cpu += time.thread_time() - cpu_start
+
+        # Calculate frame processing time
+        current_time = time.time()
+        processing_time = current_time - frame_start
+        if self.frame_duration > 0 and processing_time > self.frame_duration:
+            self.frame_overruns += 1
+
+        # Slow down under load, speed back up when there is headroom
+        if self.rate_controller:
+            fps = self.rate_controller.update(processing_time, self.data_bus.pending_count())
+            if fps != self.effective_fps:
+                self.effective_fps = fps
+                self.frame_duration = 1.0 / fps
+
+        # Update FPS counters
+        self.frame_count += 1
+        time_since_report = current_time - self.last_fps_report
+
+        # Report FPS at regular intervals
+        if time_since_report >= self.fps_telemetry_interval:
+            self.current_fps = self.frame_count / time_since_report
+            self._send_fps_telemetry()
+            if self.frame_overruns:
+                self._send_overrun_telemetry()
+            self.frame_count = 0
+            self.last_fps_report = current_time
+
+        # Sample resource usage and enforce the quota
+        if self.quota and current_time - self._last_usage_sample >= self.quota.interval:
+            self.sample_usage()
+            self._enforce_quota()
+
+        # Periodic durable snapshot of node state
+        if (self.state_store and self.snapshot_interval > 0 and
+                current_time - self._last_snapshot >= self.snapshot_interval):
+            self.snapshot_state()
+
+        return processing_time
+
+    def _source_has_credit(self, node) -> bool:
+        """Pause a source while downstream has no credit, reporting each transition"""
+        has_credit = node.has_credit()
+        if has_credit != (not node.credit_blocked):
+            node.credit_blocked = not has_credit
+            telemetry.broadcast_sync({
+                "pipeline_id": self.id,
+                "node_id": node.name,
+                "metric": "backpressure",
+                "value": {"blocked": node.credit_blocked, "can_pause": node.CAN_PAUSE},
+                "timestamp": time.time()
+            })
+        if has_credit:
+            node.release_held()
+        return has_credit
+
+    def _report_final_fps(self):
+        """Send the FPS of the last partial reporting interval"""
+        if self.frame_count > 0:
+            elapsed = time.time() - self.last_fps_report
+            if elapsed > 0:
+                self.current_fps = self.frame_count / elapsed
                 self._send_fps_telemetry()
-                
-            self.logger.info("Pipeline run loop exiting")
+            self.frame_count = 0
 
     def _run_loop(self):
-        """Main processing loop for background execution"""
+        """Dedicated-thread processing loop, used when no scheduler is shared"""
         self.logger.info("Starting pipeline execution")
         self.logger.debug(f"FPS limit: {self.fps_limit} (frame duration: {self.frame_duration:.4f}s)")
-        
+
         try:
             while self._running.is_set():
-                # Start frame processing
-                self.in_frame = True
-                frame_start = time.time()
-                
-                # Process active nodes only
-                for node in self.nodes:
-                    try:
-                        if node.should_process() and not node.IS_ASYNC_CAPABLE:
-                            node.process()
-                    except Exception as e:
-                        self.logger.error(f"Error processing node {node.name}: {str(e)}")
-                
-                # End frame processing
-                self.in_frame = False
-                
-                # Calculate frame processing time
-                processing_time = time.time() - frame_start
-                
+                processing_time = self._run_frame()
+
                 # FPS limiting logic
                 if self.fps_limit > 0:
                     # Calculate sleep time to maintain FPS
@@ -380,29 +862,9 @@ class Pipeline:
                 else:
                     # Minimal sleep to prevent CPU hogging
                     time.sleep(0.001)
-                
-                # Update FPS counters
-                self.frame_count += 1
-                current_time = time.time()
-                time_since_report = current_time - self.last_fps_report
-                
-                # Report FPS at regular intervals
-                if time_since_report >= self.fps_telemetry_interval:
-                    self.current_fps = self.frame_count / time_since_report
-                    self._send_fps_telemetry()
-                    self.frame_count = 0
-                    self.last_fps_report = current_time
-                
+
         except Exception as e:
             self.logger.error(f"Pipeline failed: {str(e)}", exc_info=True)
         finally:
-            # Ensure we clear the frame flag
-            self.in_frame = False
-            
-            # Send final FPS report
-            if self.frame_count > 0:
-                current_time = time.time()
-                self.current_fps = self.frame_count / (current_time - self.last_fps_report)
-                self._send_fps_telemetry()
-                
-            self.logger.info("Pipeline run loop exiting")
\ No newline at end of file
+            self._report_final_fps()
+            self.logger.info("Pipeline run loop exiting")
@@ -1,10 +1,21 @@
 # framework/core/pipeline_manager.py
+import os
 import uuid
 import logging
 from typing import Dict, Optional, Union
 from pathlib import Path
 from .pipeline import Pipeline
+from .process_pipeline import ProcessPipeline
+from .template import template_cache
+from .pipeline_store import PipelineStore
+from .state_store import StateStore
+from .event_loop import shared_loop
+from .executors import FairExecutor
+from .offload import process_offload
+from .watchdog import watchdog
+from .scheduler import Scheduler
 from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 import json
 
 class PipelineManager:
@@ -17,20 +28,176 @@ class PipelineManager:
                 cls._instance = super().__new__(cls)
                 cls._instance.pipelines = {}
                 cls._instance.logger = logging.getLogger('pipeline_manager')
+                # One worker pool and one frame scheduler shared by all pipelines
+                max_workers = int(os.environ.get("STREAMLET_MAX_WORKERS", 0)) or None
+                cls._instance.executor = FairExecutor(max_workers=max_workers)
+                cls._instance.scheduler = Scheduler()
+                # Durable storage, enabled with open_store()
+                cls._instance.store = None
+                cls._instance.state_store = None
             return cls._instance
+
+    @staticmethod
+    def _get_weight(config: dict) -> int:
+        """Scheduling weight of a pipeline relative to the others"""
+        try:
+            return max(1, int(config.get('settings', {}).get('weight', 1)))
+        except (ValueError, TypeError):
+            return 1
+
+    @staticmethod
+    def _get_max_threads(config: dict) -> Optional[int]:
+        """Concurrent deliveries allowed by the pipeline's quota, if any"""
+        return (config.get('settings', {}).get('quota') or {}).get('max_threads')
+
+    def _tenant(self, pipeline_id: str, config: dict):
+        """Register a pipeline with the shared pool using its weight and thread quota"""
+        return self.executor.tenant(pipeline_id, self._get_weight(config),
+                                    max_running=self._get_max_threads(config))
     
-    def create_pipeline(self, config: dict) -> str:
-        """Create a new pipeline and return its ID"""
+    def open_store(self, path: Union[str, Path]):
+        """Persist pipeline configs, run state and node snapshots in a SQLite file"""
+        self.close_store()
+        self.store = PipelineStore(path)
+        self.state_store = StateStore(path)
+        self.logger.info(f"Pipeline store opened at {path}")
+
+    def close_store(self):
+        if self.store:
+            self.store.close()
+            self.state_store.close()
+        self.store = None
+        self.state_store = None
+
+    def create_pipeline(self, config: dict, isolation: Optional[str] = None,
+                        pipeline_id: Optional[str] = None) -> str:
+        """Create a new pipeline and return its ID.
+
+        isolation="process" runs the pipeline in a dedicated worker process
+        (default from settings.isolation, otherwise "thread").
+        """
+        pipeline_id = pipeline_id or str(uuid.uuid4())
+        isolation = isolation or config.get('settings', {}).get('isolation', 'thread')
+        if isolation not in ("thread", "process"):
+            raise ValueError(f"Unknown isolation mode '{isolation}'")
+
+        self.pipelines[pipeline_id] = self._build_pipeline(config, pipeline_id, isolation)
+        if self.store:
+            self.store.save(pipeline_id, config, isolation)
+        self.logger.info(f"Created pipeline {pipeline_id} ({isolation})")
+        return pipeline_id
+
+    def _build_pipeline(self, config: dict, pipeline_id: str, isolation: str):
+        if isolation == "process":
+            pipeline = ProcessPipeline(config, pipeline_id)
+            try:
+                pipeline.build()
+            except Exception:
+                pipeline.close()
+                raise
+            return pipeline
+
+        tenant = self._tenant(pipeline_id, config)
+        pipeline = Pipeline(config, pipeline_id, state_store=self.state_store,
+                            executor=tenant, scheduler=self.scheduler)
+        try:
+            pipeline.build()
+        except Exception:
+            self.executor.remove_tenant(pipeline_id)
+            raise
+        return pipeline
+
+    def restore(self, auto_start: bool = True, max_workers: int = 8) -> Dict[str, str]:
+        """Rebuild every stored pipeline in parallel.
+
+        Pipelines that were running when the process stopped are started
+        again if auto_start is set. Returns {pipeline_id: error} for
+        pipelines that failed to rebuild.
+        """
+        if not self.store:
+            return {}
+        records = [r for r in self.store.load_all() if r.pipeline_id not in self.pipelines]
+        if not records:
+            return {}
+
+        def restore_one(record):
+            pipeline = self._build_pipeline(record.config, record.pipeline_id, record.isolation)
+            self.pipelines[record.pipeline_id] = pipeline
+            if auto_start and record.running:
+                pipeline.run()
+
+        failures = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(records))) as pool:
+            futures = {pool.submit(restore_one, r): r.pipeline_id for r in records}
+            for future, pipeline_id in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    failures[pipeline_id] = str(e)
+                    self.logger.error(f"Failed to restore pipeline {pipeline_id}: {str(e)}")
+
+        self.logger.info(f"Restored {len(records) - len(failures)}/{len(records)} pipelines")
+        return failures
+
+    def start_pipeline(self, pipeline_id: str) -> bool:
+        pipeline = self.get_pipeline(pipeline_id)
+        if not pipeline:
+            return False
+        pipeline.run()
+        if self.store:
+            self.store.set_running(pipeline_id, True)
+        return True
+
+    def stop_pipeline(self, pipeline_id: str) -> bool:
+        pipeline = self.get_pipeline(pipeline_id)
+        if not pipeline:
+            return False
+        pipeline.shutdown()
+        if self.store:
+            self.store.set_running(pipeline_id, False)
+        return True
+
+    def shutdown_all(self):
+        """Stop every pipeline, keeping their stored run state for the next restore"""
+        for pipeline_id, pipeline in list(self.pipelines.items()):
+            try:
+                pipeline.close()
+            except Exception as e:
+                self.logger.error(f"Error stopping pipeline {pipeline_id}: {str(e)}")
+            self.executor.remove_tenant(pipeline_id)
+        self.pipelines.clear()
+
+        # Process-wide helpers; each starts again on first use
+        for name, stop in (("process pool", process_offload.shutdown),
+                           ("event loop", shared_loop.stop),
+                           ("watchdog", watchdog.stop)):
+            try:
+                stop()
+            except Exception as e:
+                self.logger.error(f"Error stopping {name}: {str(e)}")
+    
+    def create_from_template(self, config: dict, overrides: Optional[Dict[str, dict]] = None) -> str:
+        """Create a pipeline from a cached, precompiled template of config.
+
+        overrides maps node names to params replacing the template's values.
+        """
+        template = template_cache.get(config)
         pipeline_id = str(uuid.uuid4())
-        pipeline = Pipeline(config, pipeline_id)
-        
-        pipeline.build()
-        
+        tenant = self._tenant(pipeline_id, config)
+        try:
+            pipeline = template.instantiate(pipeline_id, overrides, state_store=self.state_store,
+                                            executor=tenant, scheduler=self.scheduler)
+        except Exception:
+            self.executor.remove_tenant(pipeline_id)
+            raise
+
         self.pipelines[pipeline_id] = pipeline
-        self.logger.info(f"Created pipeline {pipeline_id}")
+        if self.store:
+            self.store.save(pipeline_id, pipeline.config)
+        self.logger.info(f"Created pipeline {pipeline_id} from template {template.key[:8]}")
         return pipeline_id
-    
-    def get_pipeline(self, pipeline_id: str) -> Optional[Pipeline]:
+
+    def get_pipeline(self, pipeline_id: str) -> Optional[Union[Pipeline, ProcessPipeline]]:
         """Get pipeline by ID"""
         return self.pipelines.get(pipeline_id)
     
@@ -54,6 +221,7 @@ class PipelineManager:
                 config_data = new_config
             
             # Continue with update process
+            self._tenant(pipeline_id, config_data)
             was_running = pipeline._running.is_set()
             if was_running:
                 pipeline.shutdown()
@@ -62,6 +230,10 @@ class PipelineManager:
             
             if was_running:
                 pipeline.run()
+
+            if self.store:
+                isolation = "process" if isinstance(pipeline, ProcessPipeline) else "thread"
+                self.store.save(pipeline_id, config_data, isolation)
             
             return True
         except Exception as e:
@@ -75,8 +247,12 @@ class PipelineManager:
         if not pipeline:
             return False
         
-        pipeline.shutdown()
+        pipeline.close()
         del self.pipelines[pipeline_id]
+        self.executor.remove_tenant(pipeline_id)
+        if self.store:
+            self.store.delete(pipeline_id)
+            self.state_store.delete(pipeline_id)
         return True
 
 # Singleton instance
@@ -0,0 +1,98 @@
+# framework/core/pipeline_store.py
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Union
+
+logger = logging.getLogger('pipeline_store')
+
+
+def default_store_path() -> Path:
+    """Location of the pipeline database (override with STREAMLET_PIPELINE_DB)"""
+    override = os.environ.get("STREAMLET_PIPELINE_DB")
+    if override:
+        return Path(override)
+    data_home = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(data_home) / "streamlet" / "pipelines.db"
+
+
+@dataclass
+class PipelineRecord:
+    pipeline_id: str
+    config: Dict
+    isolation: str
+    running: bool
+    updated_at: float
+
+
+class PipelineStore:
+    """SQLite-backed registry of pipeline configs and their run state.
+
+    Node state snapshots live in the same database file through StateStore,
+    keyed by pipeline id.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pipelines ("
+                " pipeline_id TEXT PRIMARY KEY,"
+                " config TEXT NOT NULL,"
+                " isolation TEXT NOT NULL,"
+                " running INTEGER NOT NULL DEFAULT 0,"
+                " updated_at REAL NOT NULL)"
+            )
+
+    def save(self, pipeline_id: str, config: Dict, isolation: str = "thread"):
+        """Insert or replace a pipeline config, keeping its run state"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO pipelines (pipeline_id, config, isolation, running, updated_at)"
+                " VALUES (?, ?, ?, 0, ?)"
+                " ON CONFLICT(pipeline_id) DO UPDATE SET"
+                " config = excluded.config, isolation = excluded.isolation,"
+                " updated_at = excluded.updated_at",
+                (pipeline_id, json.dumps(config), isolation, time.time())
+            )
+
+    def set_running(self, pipeline_id: str, running: bool):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE pipelines SET running = ?, updated_at = ? WHERE pipeline_id = ?",
+                (int(running), time.time(), pipeline_id)
+            )
+
+    def load_all(self) -> List[PipelineRecord]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT pipeline_id, config, isolation, running, updated_at"
+                " FROM pipelines ORDER BY updated_at"
+            ).fetchall()
+        records = []
+        for pipeline_id, config, isolation, running, updated_at in rows:
+            try:
+                records.append(PipelineRecord(
+                    pipeline_id, json.loads(config), isolation, bool(running), updated_at
+                ))
+            except ValueError as e:
+                logger.error(f"Corrupt config for pipeline {pipeline_id}: {str(e)}")
+        return records
+
+    def delete(self, pipeline_id: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM pipelines WHERE pipeline_id = ?", (pipeline_id,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
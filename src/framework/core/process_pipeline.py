@@ -0,0 +1,185 @@
+# framework/core/process_pipeline.py
+import itertools
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional
+from .telemetry import TelemetrySink, telemetry
+
+logger = logging.getLogger('process_pipeline')
+
+# Spawn gives workers a clean interpreter (no inherited threads or locks)
+_mp = multiprocessing.get_context("spawn")
+
+
+class QueueSink(TelemetrySink):
+    """Forward telemetry from a worker process to its parent, dropping on overflow"""
+
+    def __init__(self, message_queue):
+        self.queue = message_queue
+        self.dropped = 0
+
+    def emit(self, message: dict):
+        try:
+            self.queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _worker_main(config: Dict, pipeline_id: str, conn, telemetry_queue):
+    """Entry point of the worker process: serve commands for one pipeline"""
+    from framework.core.pipeline import Pipeline
+    import framework.nodes  # noqa: F401 - register node types
+
+    telemetry.set_sink(QueueSink(telemetry_queue))
+    pipeline = Pipeline(config, pipeline_id)
+
+    while True:
+        try:
+            seq, method, args, kwargs = conn.recv()
+        except (EOFError, OSError):
+            # Parent went away
+            pipeline.close()
+            break
+
+        if method == "close":
+            pipeline.close()
+            conn.send((seq, "ok", None))
+            break
+
+        # Replies carry the request's sequence id so the parent can skip late ones
+        try:
+            result = getattr(pipeline, method)(*args, **kwargs)
+            conn.send((seq, "ok", result))
+        except Exception as e:
+            try:
+                conn.send((seq, "error", e))
+            except Exception:
+                conn.send((seq, "error", RuntimeError(str(e))))
+
+    telemetry_queue.put(None)  # Stop the parent's relay thread
+    conn.close()
+
+
+class ProcessPipeline:
+    """Proxy for a Pipeline running in a dedicated worker process.
+
+    Exposes the lifecycle methods PipelineManager and the API use (build,
+    run, shutdown, update_config, update_node_params). Calls are forwarded
+    over a pipe and exceptions raised in the worker are re-raised here.
+    Telemetry emitted in the worker is relayed to this process's telemetry
+    sink.
+    """
+
+    def __init__(self, config: Dict, pipeline_id: str, call_timeout: float = 60.0):
+        self.id = pipeline_id
+        self.config = config
+        self.call_timeout = call_timeout
+        self._running = threading.Event()
+        self._call_lock = threading.Lock()
+        self._call_ids = itertools.count()
+        self.logger = logging.getLogger('pipeline')
+
+        fps_limit = config.get('settings', {}).get('fps_limit', 60.0)
+        self.fps_limit = float(fps_limit)
+
+        self._conn, child_conn = _mp.Pipe()
+        self._telemetry_queue = _mp.Queue(maxsize=10000)
+        self.process = _mp.Process(
+            target=_worker_main,
+            args=(config, pipeline_id, child_conn, self._telemetry_queue),
+            name=f"pipeline-{pipeline_id}",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+        self._relay = threading.Thread(
+            target=self._relay_telemetry, name=f"telemetry-relay-{pipeline_id}", daemon=True
+        )
+        self._relay.start()
+        self.logger.info(f"Started worker process {self.process.pid} for pipeline {pipeline_id}")
+
+    def _relay_telemetry(self):
+        while True:
+            try:
+                message = self._telemetry_queue.get()
+            except (EOFError, OSError):
+                break
+            if message is None:
+                break
+            telemetry.broadcast_sync(message)
+
+    def _call(self, method: str, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        timeout = self.call_timeout if timeout is None else timeout
+        with self._call_lock:
+            if not self.process.is_alive():
+                raise RuntimeError(f"Worker process for pipeline {self.id} is not running")
+            seq = next(self._call_ids)
+            self._conn.send((seq, method, args, kwargs))
+            deadline = time.monotonic() + timeout
+            while True:
+                if not self._conn.poll(max(0.0, deadline - time.monotonic())):
+                    raise TimeoutError(f"Pipeline {self.id} did not answer '{method}' in {timeout}s")
+                try:
+                    reply_seq, status, result = self._conn.recv()
+                except EOFError:
+                    raise RuntimeError(f"Worker process for pipeline {self.id} exited")
+                if reply_seq == seq:
+                    break
+                # Answer to an earlier call that timed out
+                self.logger.debug(f"Discarding late reply {reply_seq} from pipeline {self.id}")
+        if status == "error":
+            raise result
+        return result
+
+    # ==================
+    # Pipeline Interface
+    # ==================
+    def build(self):
+        self._call("build")
+
+    def run(self):
+        self._call("run")
+        self._running.set()
+
+    def shutdown(self, timeout: Optional[float] = None):
+        # Leave headroom for the worker's own drain deadline
+        call_timeout = None if timeout is None else timeout + self.call_timeout
+        self._call("shutdown", timeout, timeout=call_timeout)
+        self._running.clear()
+
+    def update_config(self, new_config: dict):
+        self._call("update_config", new_config)
+        self.config = new_config
+        self.fps_limit = float(new_config.get('settings', {}).get('fps_limit', 60.0))
+
+    def update_node_params(self, node_id: str, new_params: dict) -> bool:
+        return self._call("update_node_params", node_id, new_params)
+
+    def snapshot_state(self) -> int:
+        return self._call("snapshot_state")
+
+    def close(self, timeout: float = 10.0):
+        """Stop the pipeline and terminate the worker process"""
+        if self.process.is_alive():
+            try:
+                self._call("close", timeout=timeout)
+            except Exception as e:
+                self.logger.error(f"Error closing worker for {self.id}: {str(e)}")
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.logger.warning(f"Killing unresponsive worker for pipeline {self.id}")
+                self.process.kill()
+                self.process.join()
+        self._running.clear()
+        self._conn.close()
+        if self._relay.is_alive():
+            try:
+                self._telemetry_queue.put_nowait(None)
+            except queue.Full:
+                pass
+            self._relay.join(timeout)
+        self._telemetry_queue.close()
@@ -0,0 +1,77 @@
+# framework/core/quota.py
+from typing import Any, Dict, List, Optional
+
+# What a pipeline does while over budget:
+#   throttle - sources run every other frame
+#   shed     - queued deliveries and buffered node input are dropped
+#   pause    - sources stop until usage is back under budget
+QUOTA_POLICIES = ("throttle", "shed", "pause")
+
+# Cost assumed for objects whose size isn't walked (numbers, None, ...)
+_SCALAR_BYTES = 8
+
+
+def estimate_size(obj: Any, _depth: int = 0) -> int:
+    """Cheap estimate of the bytes an object holds in memory.
+
+    Walks strings, bytes, containers and pydantic models a few levels deep;
+    this is for budgeting, not exact accounting.
+    """
+    if isinstance(obj, (str, bytes, bytearray)):
+        return len(obj)
+    if _depth >= 4:
+        return _SCALAR_BYTES
+    if isinstance(obj, dict):
+        return sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+                   for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sum(estimate_size(item, _depth + 1) for item in obj)
+    content = getattr(obj, 'content', None)
+    if content is not None:
+        # DataPacket and similar: the payload dominates
+        return 64 + estimate_size(content, _depth + 1)
+    return _SCALAR_BYTES
+
+
+class ResourceQuota:
+    """Per-pipeline budget for worker threads, buffered bytes and CPU time.
+
+    max_threads caps concurrent deliveries, max_buffered_bytes bounds what
+    the nodes hold in memory, and max_cpu_seconds is the CPU time allowed
+    per interval (0.5 per 1.0s interval is half a core). Limits left as
+    None are not enforced.
+    """
+
+    def __init__(self, max_threads: Optional[int] = None,
+                 max_buffered_bytes: Optional[int] = None,
+                 max_cpu_seconds: Optional[float] = None,
+                 interval: float = 1.0, policy: str = "throttle"):
+        if policy not in QUOTA_POLICIES:
+            raise ValueError(f"Unknown quota policy '{policy}'")
+        if interval <= 0:
+            raise ValueError("Quota interval must be positive")
+        self.max_threads = max_threads
+        self.max_buffered_bytes = max_buffered_bytes
+        self.max_cpu_seconds = max_cpu_seconds
+        self.interval = interval
+        self.policy = policy
+
+    @classmethod
+    def from_settings(cls, setting: Optional[Dict]) -> Optional["ResourceQuota"]:
+        """Build from settings.quota; None if no quota is configured"""
+        if not setting:
+            return None
+        return cls(**setting)
+
+    def exceeded(self, usage: Dict[str, float]) -> List[str]:
+        """Names of the limits the usage is over"""
+        over = []
+        if self.max_threads is not None and usage.get("threads", 0) > self.max_threads:
+            over.append("threads")
+        if (self.max_buffered_bytes is not None and
+                usage.get("buffered_bytes", 0) > self.max_buffered_bytes):
+            over.append("buffered_bytes")
+        if (self.max_cpu_seconds is not None and
+                usage.get("cpu_seconds", 0) > self.max_cpu_seconds):
+            over.append("cpu_seconds")
+        return over
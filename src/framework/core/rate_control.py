@@ -0,0 +1,60 @@
+# framework/core/rate_control.py
+from typing import Dict, Optional, Union
+
+
+class AdaptiveRateController:
+    """Adjust a pipeline's frame rate to the load it can sustain.
+
+    Frame processing time is smoothed with an EWMA and checked together
+    with the DataBus backlog. When frames use more than high_water of their
+    budget, or the backlog exceeds max_backlog, the rate is cut
+    multiplicatively; when frames use less than low_water and the backlog
+    is small it recovers additively. Each new rate is observed for
+    cooldown frames before it changes again, and it always stays within
+    [min_fps, max_fps].
+    """
+
+    def __init__(self, target_fps: float, min_fps: Optional[float] = None,
+                 max_fps: Optional[float] = None, max_backlog: int = 100,
+                 high_water: float = 0.9, low_water: float = 0.5,
+                 decrease: float = 0.8, increase_step: Optional[float] = None,
+                 smoothing: float = 0.2, cooldown: int = 10):
+        self.target_fps = target_fps
+        self.max_fps = max_fps or target_fps
+        self.min_fps = min(min_fps or max(1.0, target_fps / 4), self.max_fps)
+        self.max_backlog = max_backlog
+        self.high_water = high_water
+        self.low_water = low_water
+        self.decrease = decrease
+        self.increase_step = increase_step or max(1.0, self.max_fps * 0.05)
+        self.smoothing = smoothing
+        self.cooldown = cooldown
+        self.fps = min(max(target_fps, self.min_fps), self.max_fps)
+        self.avg_processing = 0.0
+        self._hold = 0
+
+    @classmethod
+    def from_settings(cls, fps_limit: float,
+                      setting: Union[bool, Dict, None]) -> Optional["AdaptiveRateController"]:
+        """Build from settings.adaptive_fps (true or a dict of options); None if disabled"""
+        if not setting or fps_limit <= 0:
+            return None
+        options = setting if isinstance(setting, dict) else {}
+        return cls(fps_limit, **options)
+
+    def update(self, processing_time: float, backlog: int = 0) -> float:
+        """Feed one frame's processing time and bus backlog, returning the new fps"""
+        self.avg_processing += self.smoothing * (processing_time - self.avg_processing)
+        if self._hold > 0:
+            self._hold -= 1
+            return self.fps
+
+        load = self.avg_processing * self.fps  # Fraction of the frame budget used
+        previous = self.fps
+        if load > self.high_water or backlog > self.max_backlog:
+            self.fps = max(self.min_fps, self.fps * self.decrease)
+        elif load < self.low_water and backlog <= self.max_backlog // 2:
+            self.fps = min(self.max_fps, self.fps + self.increase_step)
+        if self.fps != previous:
+            self._hold = self.cooldown
+        return self.fps
@@ -1,48 +1,98 @@
 # framework/core/registry.py
+import importlib
+import threading
 from typing import Type, Dict, Any, List
 
 class NodeRegistry:
     _nodes: Dict[str, Type] = {}
     _categories: Dict[str, str] = {}  # Track node categories
     _tags: Dict[str, List[str]] = {}
+    _lazy: Dict[str, Dict[str, Any]] = {}  # Manifest entries for not-yet-imported types
+    _import_lock = threading.RLock()
 
     @classmethod
     def register(cls, node_type: str, node_class: Type):
         """Register a new node type with category"""
         if node_type in cls._nodes:
+            if cls._nodes[node_type] is node_class:
+                return
             raise ValueError(f"Node type {node_type} already registered")
-        
-        # Extract category from class module path
-        module_parts = node_class.__module__.split('.')
-        category = module_parts[-2] if len(module_parts) >= 2 else 'other'
-        cls._categories[node_type] = category
+
+        cls._categories[node_type] = cls.category_for(node_class)
         cls._tags[node_type] = getattr(node_class, 'tags', [])
-        
+
         cls._nodes[node_type] = node_class
 
+    @classmethod
+    def register_lazy(cls, entry: Dict[str, Any]):
+        """Register a node type from a manifest entry without importing it"""
+        node_type = entry['type']
+        if node_type in cls._nodes:
+            return
+        cls._lazy[node_type] = entry
+
+    @staticmethod
+    def category_for(node_class: Type) -> str:
+        """Extract category from class module path"""
+        module_parts = node_class.__module__.split('.')
+        return module_parts[-2] if len(module_parts) >= 2 else 'other'
+
     @classmethod
     def create(cls, node_type: str, config: Dict[str, Any]) -> Any:
         """Instantiate a node with its configuration"""
+        return cls.get_class(node_type)(config)
+
+    @classmethod
+    def get_class(cls, node_type: str) -> Type:
+        """Get the node class registered for a type, importing it on first use"""
         if node_type not in cls._nodes:
-            raise ValueError(f"Unknown node type: {node_type}")
-        return cls._nodes[node_type](config)
+            if node_type not in cls._lazy:
+                raise ValueError(f"Unknown node type: {node_type}")
+            cls._import_lazy(node_type)
+        return cls._nodes[node_type]
+
+    @classmethod
+    def _import_lazy(cls, node_type: str):
+        """Import the module declared in the manifest for a node type"""
+        with cls._import_lock:
+            if node_type in cls._nodes:
+                return
+            entry = cls._lazy[node_type]
+            module = importlib.import_module(entry['module'])
+            # Node classes register themselves through NodeMeta on import
+            if node_type not in cls._nodes:
+                node_class = getattr(module, entry['class'], None)
+                if node_class is None:
+                    raise ValueError(f"Node type {node_type} not found in {entry['module']}")
+                cls.register(node_type, node_class)
+
+    @classmethod
+    def is_loaded(cls, node_type: str) -> bool:
+        """Whether the module providing a node type has been imported"""
+        return node_type in cls._nodes
 
     @classmethod
     def list_available(cls) -> list:
         """Get list of registered node types"""
-        return list(cls._nodes.keys())
+        return list(cls._nodes.keys()) + [t for t in cls._lazy if t not in cls._nodes]
 
     @classmethod
     def get_category(cls, node_type: str) -> str:
         """Get category for a node type"""
-        return cls._categories.get(node_type, 'uncategorized')
-    
+        if node_type in cls._categories:
+            return cls._categories[node_type]
+        return cls._lazy.get(node_type, {}).get('category', 'uncategorized')
+
     @classmethod
     def get_params_schema(cls, node_type: str) -> dict:
         """Get parameter schema for node type"""
-        return cls._nodes[node_type].get_param_schema()
-    
+        if node_type in cls._nodes:
+            return cls._nodes[node_type].get_param_schema()
+        return cls._lazy[node_type]['params_schema']
+
     @classmethod
     def get_tags(cls, node_type: str) -> List[str]:
         """Return developer-defined tags for this node type"""
-        return cls._tags.get(node_type, [])
+        if node_type in cls._tags:
+            return cls._tags[node_type]
+        return cls._lazy.get(node_type, {}).get('tags', [])
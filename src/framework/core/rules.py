@@ -0,0 +1,95 @@
+# framework/core/rules.py
+import math
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+RULE_OPERATORS = ("gt", "ge", "lt", "le", "eq", "ne")
+
+
+class _Thresholds:
+    """Rules with one operator on one path, sorted by threshold.
+
+    The rules a value matches form a prefix or suffix of the sorted list,
+    so one binary search finds them all.
+    """
+
+    def __init__(self, rules: List[Tuple[float, str]]):
+        rules = sorted(rules)
+        self.thresholds = [threshold for threshold, _ in rules]
+        self.ids = [rule_id for _, rule_id in rules]
+
+    def match(self, op: str, value: float) -> List[str]:
+        if op == "gt":  # threshold < value
+            return self.ids[:bisect_left(self.thresholds, value)]
+        if op == "ge":  # threshold <= value
+            return self.ids[:bisect_right(self.thresholds, value)]
+        if op == "lt":  # threshold > value
+            return self.ids[bisect_right(self.thresholds, value):]
+        # le: threshold >= value
+        return self.ids[bisect_left(self.thresholds, value):]
+
+
+class RuleSet:
+    """Many (path, operator, threshold) rules evaluated in one pass per value.
+
+    Rules are grouped by path so each path is read once per packet, then
+    by operator: range operators keep sorted thresholds and match by
+    binary search, eq/ne use a hash of thresholds. Evaluating a packet
+    costs O(paths * log n) plus the matches, not O(n).
+    """
+
+    def __init__(self, rules: Iterable[Mapping[str, Any]]):
+        grouped: Dict[str, Dict[str, List[Tuple[float, str]]]] = defaultdict(lambda: defaultdict(list))
+        seen = set()
+        for rule in rules:
+            rule_id, op = str(rule["id"]), rule.get("op", "gt")
+            if op not in RULE_OPERATORS:
+                raise ValueError(f"Unknown operator '{op}' in rule '{rule_id}'")
+            if rule_id in seen:
+                raise ValueError(f"Duplicate rule id '{rule_id}'")
+            seen.add(rule_id)
+            grouped[rule.get("path", "")][op].append((float(rule["threshold"]), rule_id))
+        self.size = len(seen)
+
+        self._ranges: Dict[str, List[Tuple[str, _Thresholds]]] = {}
+        self._equal: Dict[str, Dict[float, List[str]]] = {}
+        self._not_equal: Dict[str, Tuple[List[str], Dict[float, set]]] = {}
+        for path, by_op in grouped.items():
+            self._ranges[path] = [(op, _Thresholds(by_op[op]))
+                                  for op in ("gt", "ge", "lt", "le") if by_op.get(op)]
+            if by_op.get("eq"):
+                equal = defaultdict(list)
+                for threshold, rule_id in by_op["eq"]:
+                    equal[threshold].append(rule_id)
+                self._equal[path] = dict(equal)
+            if by_op.get("ne"):
+                excluded = defaultdict(set)
+                for threshold, rule_id in by_op["ne"]:
+                    excluded[threshold].add(rule_id)
+                self._not_equal[path] = ([rule_id for _, rule_id in by_op["ne"]], dict(excluded))
+
+    @property
+    def paths(self) -> List[str]:
+        return list(self._ranges)
+
+    def match(self, values: Mapping[str, Optional[float]]) -> List[str]:
+        """Ids of every rule matched by the value at its path.
+
+        Paths without a value, or with a non-finite one, match nothing:
+        NaN would otherwise bisect to an end and match every ge/le rule.
+        """
+        matched: List[str] = []
+        for path, ranges in self._ranges.items():
+            value = values.get(path)
+            if value is None or not math.isfinite(value):
+                continue
+            for op, thresholds in ranges:
+                matched.extend(thresholds.match(op, value))
+            if path in self._equal:
+                matched.extend(self._equal[path].get(value, ()))
+            if path in self._not_equal:
+                rule_ids, excluded = self._not_equal[path]
+                skip = excluded.get(value)
+                matched.extend(rule_ids if not skip else [r for r in rule_ids if r not in skip])
+        return matched
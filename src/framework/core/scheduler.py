@@ -0,0 +1,121 @@
+# framework/core/scheduler.py
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, wait
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger('scheduler')
+
+# Frame interval used for pipelines without an fps limit
+MIN_FRAME_INTERVAL = 0.001
+
+
+class Scheduler:
+    """Single timer thread that drives the frames of many pipelines.
+
+    Instead of one sleeping run-loop thread per pipeline, due frames are
+    kept in a heap and each frame is submitted to the pipeline's executor
+    (usually its tenant view of the shared FairExecutor). A pipeline never
+    has more than one frame in flight; a frame that overruns its slot
+    delays the next one instead of piling up.
+    """
+
+    def __init__(self):
+        # Re-entrant: a frame that finishes before add_done_callback returns
+        # runs _frame_done on the scheduler thread while it holds the lock
+        self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._pipelines: Dict[str, object] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._seq = itertools.count()
+        self._thread = None
+        self._stopped = False
+
+    def add(self, pipeline):
+        """Start scheduling frames for a pipeline"""
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("Scheduler is stopped")
+            # The token invalidates heap entries left from an earlier add()
+            token = next(self._seq)
+            self._pipelines[pipeline.id] = (pipeline, token)
+            heapq.heappush(self._heap, (time.monotonic(), token, pipeline.id, token))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="pipeline-scheduler", daemon=True
+                )
+                self._thread.start()
+            self._wakeup.notify()
+        logger.debug(f"Scheduling pipeline {pipeline.id}")
+
+    def remove(self, pipeline, timeout: Optional[float] = None) -> bool:
+        """Stop scheduling a pipeline and wait for its running frame.
+
+        Returns False if the frame was still running when the timeout expired.
+        """
+        with self._lock:
+            self._pipelines.pop(pipeline.id, None)
+            future = self._in_flight.get(pipeline.id)
+        if future is None:
+            return True
+        done, _ = wait([future], timeout=timeout)
+        return bool(done)
+
+    def is_scheduled(self, pipeline) -> bool:
+        with self._lock:
+            return pipeline.id in self._pipelines
+
+    def stop(self):
+        with self._lock:
+            self._stopped = True
+            self._pipelines.clear()
+            self._wakeup.notify()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _loop(self):
+        with self._lock:
+            while not self._stopped:
+                if not self._heap:
+                    self._wakeup.wait()
+                    continue
+                due, _, pipeline_id, token = self._heap[0]
+                now = time.monotonic()
+                if due > now:
+                    self._wakeup.wait(due - now)
+                    continue
+                heapq.heappop(self._heap)
+
+                entry = self._pipelines.get(pipeline_id)
+                if entry is None or entry[1] != token:
+                    continue  # Removed (or re-added) since it was queued
+                pipeline = entry[0]
+
+                interval = max(pipeline.frame_duration, MIN_FRAME_INTERVAL)
+                # Fixed-rate slots; fall back to now when we are behind
+                next_due = max(due + interval, now)
+                heapq.heappush(self._heap, (next_due, next(self._seq), pipeline_id, token))
+
+                running = self._in_flight.get(pipeline_id)
+                if running is not None and not running.done():
+                    continue  # Previous frame overran its slot
+
+                try:
+                    future = pipeline.executor.submit(pipeline._run_frame)
+                except RuntimeError as e:
+                    logger.error(f"Cannot schedule frame for {pipeline_id}: {str(e)}")
+                    self._pipelines.pop(pipeline_id, None)
+                    continue
+                self._in_flight[pipeline_id] = future
+                future.add_done_callback(
+                    lambda f, pid=pipeline_id: self._frame_done(pid, f)
+                )
+
+    def _frame_done(self, pipeline_id: str, future: Future):
+        with self._lock:
+            if self._in_flight.get(pipeline_id) is future:
+                del self._in_flight[pipeline_id]
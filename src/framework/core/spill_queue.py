@@ -0,0 +1,281 @@
+# framework/core/spill_queue.py
+import logging
+import os
+import queue
+import shutil
+import struct
+import tempfile
+import threading
+import weakref
+from collections import deque
+from typing import Any, Optional
+import msgpack
+from framework.data.data_packet import DataPacket
+from .quota import estimate_size
+
+logger = logging.getLogger('spill_queue')
+
+_LENGTH = struct.Struct(">I")  # Record header: payload length
+
+
+def _to_plain(item: Any) -> Any:
+    if isinstance(item, DataPacket):
+        return {"__packet__": item.model_dump(mode='json')}
+    if isinstance(item, (list, tuple)):
+        return [_to_plain(i) for i in item]
+    return item
+
+
+def _from_plain(item: Any) -> Any:
+    if isinstance(item, dict) and "__packet__" in item:
+        return DataPacket.model_validate(item["__packet__"])
+    if isinstance(item, list):
+        return [_from_plain(i) for i in item]
+    return item
+
+
+class SpillQueue:
+    """FIFO queue that keeps its head in memory and spills overflow to disk.
+
+    Items stay in memory until max_memory_items (or max_memory_bytes) is
+    reached; after that they are appended to segment files and replayed
+    in order, a batch at a time, once the in-memory part has been
+    consumed. Segments are deleted as soon as they have been read. With
+    max_disk_bytes set, put() refuses items once the spill is that big.
+
+    DataPackets (also inside lists and tuples) survive the round trip;
+    tuples come back as lists. Supports both the queue.Queue calls used by
+    worker threads and the list calls nodes use on their input buffers
+    (append, pop(0), [0], [-1], len, clear).
+    """
+
+    def __init__(self, max_memory_items: int = 1000, max_memory_bytes: Optional[int] = None,
+                 segment_bytes: int = 4 * 1024 * 1024, directory: Optional[str] = None,
+                 max_disk_bytes: Optional[int] = None):
+        if max_memory_items < 1:
+            raise ValueError("max_memory_items must be at least 1")
+        self.max_memory_items = max_memory_items
+        self.max_memory_bytes = max_memory_bytes
+        self.segment_bytes = segment_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._directory = directory
+        self._path: Optional[str] = None  # Created on first spill
+        self._finalizer = None
+
+        self._memory = deque()  # (item, estimated size)
+        self._memory_bytes = 0
+        self._tail = None  # Newest item, for [-1]
+
+        self._segments = deque()  # Segment paths, oldest first
+        self._segment_ids = 0
+        self._writer = None
+        self._writer_size = 0
+        self._reader = None
+        self._disk_count = 0
+        self._disk_bytes = 0
+
+        self.spilled_total = 0  # Items ever written to disk
+        self.dropped = 0  # Items refused because max_disk_bytes was reached
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    # ===========
+    # Queue API
+    # ===========
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> bool:
+        """Add an item; never blocks. False if the disk limit refused it"""
+        size = estimate_size(item) if self.max_memory_bytes else 0
+        with self._lock:
+            if self._disk_count == 0 and self._fits_in_memory(size):
+                self._memory.append((item, size))
+                self._memory_bytes += size
+            elif not self._spill(item):
+                self.dropped += 1
+                return False
+            self._tail = item
+            self._not_empty.notify()
+        return True
+
+    def put_nowait(self, item: Any) -> bool:
+        return self.put(item, block=False)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Remove and return the oldest item; raises queue.Empty like queue.Queue"""
+        with self._not_empty:
+            if block:
+                if not self._not_empty.wait_for(self._has_items, timeout):
+                    raise queue.Empty
+            elif not self._has_items():
+                raise queue.Empty
+            return self._pop()
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        with self._lock:
+            return len(self._memory) + self._disk_count
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    # ===================
+    # List-style access
+    # ===================
+    def append(self, item: Any):
+        self.put(item)
+
+    def pop(self, index: int = 0) -> Any:
+        if index != 0:
+            raise ValueError("SpillQueue only pops from the head")
+        try:
+            return self.get_nowait()
+        except queue.Empty:
+            raise IndexError("pop from empty SpillQueue") from None
+
+    def __getitem__(self, index: int) -> Any:
+        with self._lock:
+            if not self._has_items():
+                raise IndexError("SpillQueue index out of range")
+            if index == -1:
+                return self._tail
+            if index != 0:
+                raise IndexError("SpillQueue only supports [0] and [-1]")
+            if not self._memory:
+                self._refill()
+            return self._memory[0][0]
+
+    def __len__(self) -> int:
+        return self.qsize()
+
+    def __bool__(self) -> bool:
+        return self.qsize() > 0
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._tail = None
+            self._reset_disk()
+
+    def keep_latest(self) -> int:
+        """Drop everything but the newest item, returning how many were dropped"""
+        with self._lock:
+            count = len(self._memory) + self._disk_count
+            if count <= 1:
+                return 0
+            tail = self._tail
+            self._memory.clear()
+            self._reset_disk()
+            size = estimate_size(tail) if self.max_memory_bytes else 0
+            self._memory.append((tail, size))
+            self._memory_bytes = size
+            return count - 1
+
+    def memory_bytes(self) -> int:
+        """Estimated bytes held in memory (the spilled part is on disk)"""
+        with self._lock:
+            if self.max_memory_bytes:
+                return self._memory_bytes
+            return sum(estimate_size(item) for item, _ in self._memory)
+
+    def disk_bytes(self) -> int:
+        with self._lock:
+            return self._disk_bytes
+
+    def close(self):
+        """Discard queued items and delete the spill directory"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._reset_disk()
+            if self._finalizer is not None:
+                self._finalizer()
+                self._finalizer = None
+                self._path = None
+
+    # ==========
+    # Internals
+    # ==========
+    def _has_items(self) -> bool:
+        return bool(self._memory) or self._disk_count > 0
+
+    def _fits_in_memory(self, size: int) -> bool:
+        if len(self._memory) >= self.max_memory_items:
+            return False
+        return not self.max_memory_bytes or self._memory_bytes + size <= self.max_memory_bytes
+
+    def _pop(self) -> Any:
+        if not self._memory:
+            self._refill()
+        item, size = self._memory.popleft()
+        self._memory_bytes -= size
+        if not self._has_items():
+            self._tail = None
+        return item
+
+    def _spill(self, item: Any) -> bool:
+        record = msgpack.packb(_to_plain(item))
+        length = _LENGTH.size + len(record)
+        if self.max_disk_bytes and self._disk_bytes + length > self.max_disk_bytes:
+            return False
+        if self._writer is None or self._writer_size >= self.segment_bytes:
+            self._open_segment()
+        self._writer.write(_LENGTH.pack(len(record)))
+        self._writer.write(record)
+        self._writer.flush()  # Readers open the same file separately
+        self._writer_size += length
+        self._disk_count += 1
+        self._disk_bytes += length
+        self.spilled_total += 1
+        return True
+
+    def _open_segment(self):
+        if self._path is None:
+            self._path = tempfile.mkdtemp(prefix="streamlet-spill-", dir=self._directory)
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self._path, ignore_errors=True)
+            logger.info(f"Spilling queue overflow to {self._path}")
+        if self._writer is not None:
+            self._writer.close()
+        path = os.path.join(self._path, f"{self._segment_ids:08d}.seg")
+        self._segment_ids += 1
+        self._writer = open(path, "ab")
+        self._writer_size = 0
+        self._segments.append(path)
+
+    def _refill(self):
+        """Move the next batch of spilled items into memory, oldest first"""
+        while self._disk_count and len(self._memory) < self.max_memory_items:
+            if self._reader is None:
+                self._reader = open(self._segments[0], "rb")
+            header = self._reader.read(_LENGTH.size)
+            if not header:
+                # Segment exhausted; the writer has already moved on
+                self._reader.close()
+                self._reader = None
+                os.remove(self._segments.popleft())
+                continue
+            (length,) = _LENGTH.unpack(header)
+            item = _from_plain(msgpack.unpackb(self._reader.read(length)))
+            self._disk_count -= 1
+            self._disk_bytes -= _LENGTH.size + length
+            size = estimate_size(item) if self.max_memory_bytes else 0
+            self._memory.append((item, size))
+            self._memory_bytes += size
+        if self._disk_count == 0:
+            self._reset_disk()
+
+    def _reset_disk(self):
+        for handle in (self._reader, self._writer):
+            if handle is not None:
+                handle.close()
+        self._reader = self._writer = None
+        self._writer_size = 0
+        for path in self._segments:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._segments.clear()
+        self._disk_count = 0
+        self._disk_bytes = 0
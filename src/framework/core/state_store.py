@@ -0,0 +1,112 @@
+# framework/core/state_store.py
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+import msgpack
+from framework.data import data_types
+
+logger = logging.getLogger('state_store')
+
+# Enums that may appear in node state (e.g. packets stored by accumulator/storage)
+_ENUMS = {
+    name: getattr(data_types, name)
+    for name in ("DataType", "DataFormat", "DataCategory",
+                 "LifecycleState", "SensitivityLevel", "DataSource")
+}
+
+
+def _encode(obj: Any) -> Any:
+    if isinstance(obj, Enum):
+        return {"__enum__": type(obj).__name__, "value": obj.value}
+    if isinstance(obj, datetime):
+        return {"__datetime__": obj.isoformat()}
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Unserializable state type {type(obj)}")
+
+
+def _decode(obj: dict) -> Any:
+    if "__enum__" in obj:
+        enum_cls = _ENUMS.get(obj["__enum__"])
+        return enum_cls(obj["value"]) if enum_cls else obj["value"]
+    if "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+def pack_state(state: Any) -> bytes:
+    """Serialize a node state snapshot"""
+    return msgpack.packb(state, default=_encode, use_bin_type=True)
+
+
+def unpack_state(data: bytes) -> Any:
+    """Deserialize a node state snapshot"""
+    return msgpack.unpackb(data, object_hook=_decode, raw=False, strict_map_key=False)
+
+
+class StateStore:
+    """SQLite-backed storage for node state snapshots.
+
+    Snapshots are grouped under a key (usually the pipeline id) and replaced
+    atomically, so a crash mid-write leaves the previous snapshot intact.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS node_state ("
+                " pipeline_key TEXT NOT NULL,"
+                " node_name TEXT NOT NULL,"
+                " node_type TEXT NOT NULL,"
+                " state BLOB NOT NULL,"
+                " updated_at REAL NOT NULL,"
+                " PRIMARY KEY (pipeline_key, node_name))"
+            )
+
+    def save(self, key: str, snapshots: Dict[str, Tuple[str, Any]]):
+        """Replace all snapshots for a key with {node_name: (node_type, state)}"""
+        now = time.time()
+        rows = [
+            (key, name, node_type, pack_state(state), now)
+            for name, (node_type, state) in snapshots.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM node_state WHERE pipeline_key = ?", (key,))
+            self._conn.executemany(
+                "INSERT INTO node_state VALUES (?, ?, ?, ?, ?)", rows
+            )
+
+    def load(self, key: str) -> Dict[str, Tuple[str, Any]]:
+        """Return {node_name: (node_type, state)} for a key"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT node_name, node_type, state FROM node_state WHERE pipeline_key = ?",
+                (key,)
+            ).fetchall()
+        snapshots = {}
+        for name, node_type, blob in rows:
+            try:
+                snapshots[name] = (node_type, unpack_state(blob))
+            except Exception as e:
+                logger.error(f"Corrupt snapshot for {key}/{name}: {str(e)}")
+        return snapshots
+
+    def delete(self, key: str):
+        """Remove all snapshots for a key"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM node_state WHERE pipeline_key = ?", (key,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,96 +1,83 @@
 # src/framework/core/telemetry.py
-import janus
-import asyncio
 import logging
-from fastapi import WebSocket
-from fastapi.websockets import WebSocketDisconnect
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import List, Optional
 
 # Set up logger
 telemetry_logger = logging.getLogger("telemetry")
 telemetry_logger.setLevel(logging.DEBUG)
 
+class TelemetrySink(ABC):
+    """Destination for telemetry messages emitted by pipelines and nodes.
+
+    Sinks are called synchronously from node and pipeline threads, so
+    emit() must never block.
+    """
+    enabled = True
+
+    @abstractmethod
+    def emit(self, message: dict):
+        ...
+
+    def close(self):
+        """Release resources held by the sink"""
+        pass
+
+class NullSink(TelemetrySink):
+    """Discard everything - the default for headless workers"""
+    enabled = False
+
+    def emit(self, message: dict):
+        pass
+
+class RingBufferSink(TelemetrySink):
+    """Keep the most recent messages in memory, dropping the oldest"""
+
+    def __init__(self, max_messages: int = 10000):
+        self._messages = deque(maxlen=max_messages)
+        self._lock = threading.Lock()
+
+    def emit(self, message: dict):
+        with self._lock:
+            self._messages.append(message)
+
+    def snapshot(self) -> List[dict]:
+        """Copy of buffered messages, oldest first"""
+        with self._lock:
+            return list(self._messages)
+
+    def drain(self) -> List[dict]:
+        """Return and clear buffered messages"""
+        with self._lock:
+            messages = list(self._messages)
+            self._messages.clear()
+            return messages
+
 class Telemetry:
-    def __init__(self):
-        self.active_connections = set()
-        self.async_lock = asyncio.Lock()
-        self.queue = janus.Queue()
-        self.is_running = False
+    """Process-wide telemetry front end that forwards to a pluggable sink"""
+
+    def __init__(self, sink: Optional[TelemetrySink] = None):
+        self.sink = sink or NullSink()
         telemetry_logger.debug("Telemetry system initialized")
 
-    async def add_connection(self, websocket: WebSocket):
-        async with self.async_lock:
-            self.active_connections.add(websocket)
-            client = f"{websocket.client.host}:{websocket.client.port}"
-            telemetry_logger.debug(f"➕ Added connection: {client}. Total: {len(self.active_connections)}")
+    @property
+    def enabled(self) -> bool:
+        return self.sink.enabled
 
-    async def remove_connection(self, websocket: WebSocket):
-        async with self.async_lock:
-            if websocket in self.active_connections:
-                self.active_connections.discard(websocket)
-                client = f"{websocket.client.host}:{websocket.client.port}"
-                telemetry_logger.debug(f"➖ Removed connection: {client}. Total: {len(self.active_connections)}")
+    def set_sink(self, sink: Optional[TelemetrySink]) -> TelemetrySink:
+        """Install a new sink (None restores the no-op sink), returning the old one"""
+        previous = self.sink
+        self.sink = sink or NullSink()
+        telemetry_logger.debug(f"Telemetry sink set to {type(self.sink).__name__}")
+        return previous
 
     def broadcast_sync(self, message: dict):
-        """Called from sync nodes to queue messages"""
+        """Called from sync nodes to hand messages to the sink"""
         try:
-            self.queue.sync_q.put(message)
-            #telemetry_logger.debug(f"📦 Queued telemetry: {message} | Queue size: {self.queue.sync_q.qsize()}")
+            self.sink.emit(message)
         except Exception as e:
-            telemetry_logger.error(f"❌ Queue error: {str(e)}")
+            telemetry_logger.error(f"❌ Sink error: {str(e)}")
 
-    async def _async_broadcaster(self):
-        """Process messages from the queue"""
-        self.is_running = True
-        #telemetry_logger.info("🚀 Starting telemetry broadcaster")
-        
-        try:
-            while self.is_running:
-                try:
-                    message = await asyncio.wait_for(
-                        self.queue.async_q.get(), 
-                        timeout=1.0
-                    )
-                    
-                    #telemetry_logger.debug(f"📡 Processing message: {message}")
-                    
-                    async with self.async_lock:
-                        dead_connections = []
-                        conn_count = len(self.active_connections)
-                        telemetry_logger.debug(f"Broadcasting to {conn_count} connections")
-                        
-                        for conn in self.active_connections:
-                            try:
-                                await conn.send_json(message)
-                                #telemetry_logger.debug(f"  ✅ Sent to {conn.client}")
-                            except (WebSocketDisconnect, RuntimeError) as e:
-                                dead_connections.append(conn)
-                                #telemetry_logger.debug(f"  ❌ Dead connection: {conn.client} - {str(e)}")
-                            except Exception as e:
-                                telemetry_logger.error(f"  ⚠️ Send error to {conn.client}: {str(e)}")
-                                
-                        for conn in dead_connections:
-                            self.active_connections.discard(conn)
-                            
-                    self.queue.async_q.task_done()
-                    
-                except asyncio.TimeoutError:
-                    # Normal timeout - log periodically
-                    #telemetry_logger.debug("⏳ Queue timeout (no messages)")
-                    continue
-                except Exception as e:
-                    telemetry_logger.error(f"Broadcaster error: {str(e)}")
-                    await asyncio.sleep(0.1)
-                    
-        except asyncio.CancelledError:
-            telemetry_logger.info("🔌 Broadcaster task cancelled")
-        finally:
-            self.is_running = False
-            telemetry_logger.info("🛑 Telemetry broadcaster stopped")
-
-    def stop(self):
-        """Gracefully stop the broadcaster"""
-        if self.is_running:
-            telemetry_logger.info("🛑 Stopping telemetry broadcaster")
-            self.is_running = False
-
-telemetry = Telemetry()
\ No newline at end of file
+telemetry = Telemetry()
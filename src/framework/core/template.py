@@ -0,0 +1,132 @@
+# framework/core/template.py
+import copy
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Type
+from pydantic import ValidationError
+from .graph import compile_plan, GraphPlan, TYPE_CHECK_MODES
+from .pipeline import Pipeline
+from .registry import NodeRegistry
+
+logger = logging.getLogger('template')
+
+REF_PREFIX = "@ref:"
+
+
+def config_hash(config: Dict) -> str:
+    """Stable hash of a whole pipeline config"""
+    raw = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+class PipelineTemplate:
+    """A validated, type-checked pipeline config ready to be stamped out.
+
+    Compiling resolves every node class, checks node params and compiles
+    the graph plan once. instantiate() then only copies the config, applies
+    per-node param overrides and builds with the precompiled plan and
+    classes. Overrides may change params but never the graph shape.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = copy.deepcopy(config)
+        self.key = config_hash(self.config)
+        self.node_names = [n.get('name') for n in self.config.get('nodes', [])]
+
+        mode = self.config.get('settings', {}).get('type_check', 'strict')
+        if mode not in TYPE_CHECK_MODES:
+            mode = 'strict'
+
+        errors: List[str] = []
+        self.classes: Dict[str, Type] = {}
+        for node_config in self.config.get('nodes', []):
+            node_type = node_config.get('type')
+            try:
+                self.classes[node_type] = NodeRegistry.get_class(node_type)
+            except ValueError as e:
+                errors.append(str(e))
+        if errors:
+            raise ValueError("Pipeline template is invalid:\n  - " + "\n  - ".join(errors))
+
+        self.plan: GraphPlan = compile_plan(self.config, resolve=self.classes.__getitem__, mode=mode)
+        errors.extend(self.plan.errors)
+        for node_config in self.config.get('nodes', []):
+            errors.extend(self._check_params(node_config, node_config.get('params', {})))
+        if errors:
+            raise ValueError("Pipeline template is invalid:\n  - " + "\n  - ".join(errors))
+
+    def _check_params(self, node_config: Dict, params: Dict) -> List[str]:
+        """Validate params against the node's Params model, ignoring @ref values"""
+        node_class = self.classes[node_config['type']]
+        if not node_class.Params:
+            return []
+        refs = {k for k, v in params.items() if isinstance(v, str) and v.startswith(REF_PREFIX)}
+        try:
+            node_class.Params(**{k: v for k, v in params.items() if k not in refs})
+        except ValidationError as e:
+            return [
+                f"{node_config['name']}.{'.'.join(str(p) for p in err['loc'])}: {err['msg']}"
+                for err in e.errors()
+                if not (err['loc'] and err['loc'][0] in refs)
+            ]
+        return []
+
+    def instantiate(self, pipeline_id: str, overrides: Optional[Dict[str, Dict]] = None,
+                    **pipeline_kwargs) -> Pipeline:
+        """Build a new pipeline from the template.
+
+        overrides maps node names to params merged over the template's.
+        """
+        config = copy.deepcopy(self.config)
+        if overrides:
+            nodes = {n['name']: n for n in config['nodes']}
+            errors = []
+            for node_name, params in overrides.items():
+                if node_name not in nodes:
+                    errors.append(f"Unknown node '{node_name}' in overrides")
+                    continue
+                merged = {**nodes[node_name].get('params', {}), **params}
+                errors.extend(self._check_params(nodes[node_name], merged))
+                nodes[node_name]['params'] = merged
+            if errors:
+                raise ValueError("Invalid template overrides:\n  - " + "\n  - ".join(errors))
+
+        pipeline = Pipeline(config, pipeline_id, **pipeline_kwargs)
+        pipeline.template = self
+        pipeline.build()
+        return pipeline
+
+
+class _TemplateCache:
+    """LRU of compiled templates keyed by config hash"""
+
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        self._templates: "OrderedDict[str, PipelineTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, config: Dict) -> PipelineTemplate:
+        key = config_hash(config)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                return template
+
+        template = PipelineTemplate(config)
+        with self._lock:
+            self._templates[key] = template
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+        logger.debug(f"Compiled pipeline template {key[:8]}")
+        return template
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+
+
+template_cache = _TemplateCache()
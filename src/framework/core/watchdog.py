@@ -0,0 +1,109 @@
+# framework/core/watchdog.py
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger('watchdog')
+
+# What happens to a stalled node:
+#   skip        - its queued input is dropped and new packets are shed until it recovers
+#   shed_latest - its input is cut to the newest packet per channel; the newest
+#                 packet seen while stalled is delivered once it recovers
+#   restart     - it is replaced with a fresh instance
+WATCHDOG_POLICIES = ("skip", "shed_latest", "restart")
+
+
+class StallLimits:
+    """When a node counts as stalled, and what to do about it.
+
+    A node is stalled when one call into it (on_data or process) has run
+    longer than stall_timeout, or when its input backlog is above
+    max_backlog and it has made no progress for stall_timeout.
+    """
+
+    def __init__(self, stall_timeout: float = 5.0, max_backlog: int = 50,
+                 policy: str = "skip"):
+        if policy not in WATCHDOG_POLICIES:
+            raise ValueError(f"Unknown watchdog policy '{policy}'")
+        if stall_timeout <= 0:
+            raise ValueError("stall_timeout must be positive")
+        self.stall_timeout = stall_timeout
+        self.max_backlog = max_backlog
+        self.policy = policy
+
+    @classmethod
+    def from_settings(cls, setting: Optional[Dict],
+                      node_setting: Optional[Dict] = None) -> Optional["StallLimits"]:
+        """Build from settings.watchdog, overridden by a node's own `watchdog` config"""
+        if not setting and not node_setting:
+            return None
+        options = dict(setting or {})
+        options.update(node_setting or {})
+        return cls(**options)
+
+    def check(self, node, now: Optional[float] = None) -> Optional[str]:
+        """Reason the node is stalled ("hung" or "backlog"), or None"""
+        now = time.monotonic() if now is None else now
+        if node.busy_for(now) > self.stall_timeout:
+            return "hung"
+        if (node.backlog() > self.max_backlog and
+                now - node.last_progress > self.stall_timeout):
+            return "backlog"
+        return None
+
+
+class Watchdog:
+    """One background thread that periodically checks watched pipelines for stalls.
+
+    It runs apart from frame threads and bus workers, so it still fires
+    when a stuck node has blocked those.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._pipelines = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def watch(self, pipeline):
+        with self._lock:
+            self._pipelines[pipeline.id] = pipeline
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._loop, name="watchdog", daemon=True)
+                self._thread.start()
+
+    def unwatch(self, pipeline):
+        with self._lock:
+            if self._pipelines.get(pipeline.id) is pipeline:
+                del self._pipelines[pipeline.id]
+
+    def is_watching(self, pipeline) -> bool:
+        with self._lock:
+            return self._pipelines.get(pipeline.id) is pipeline
+
+    def check_all(self):
+        with self._lock:
+            pipelines = list(self._pipelines.values())
+        for pipeline in pipelines:
+            try:
+                pipeline.check_stalls()
+            except Exception as e:
+                logger.error(f"Stall check failed for pipeline {pipeline.id}: {str(e)}", exc_info=True)
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.check_all()
+
+    def stop(self):
+        self._stop.set()
+        thread = self._thread
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=self.interval * 2)
+        self._thread = None
+
+
+watchdog = Watchdog(float(os.environ.get("STREAMLET_WATCHDOG_INTERVAL", 0.5)))
@@ -0,0 +1,403 @@
+# framework/core/windowing.py
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+WINDOW_MODES = ("tumbling", "sliding", "session")
+WINDOW_MEASURES = ("count", "time")
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO of numbers in a preallocated NumPy array.
+
+    append() is O(1) and, once the buffer is full, returns the value it
+    overwrote so incremental aggregates can retract it.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("RingBuffer capacity must be at least 1")
+        self._data = np.zeros(int(capacity), dtype=dtype)
+        self._start = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def append(self, value: float) -> Optional[float]:
+        capacity = len(self._data)
+        if self._size < capacity:
+            self._data[(self._start + self._size) % capacity] = value
+            self._size += 1
+            return None
+        evicted = self._data[self._start].item()
+        self._data[self._start] = value
+        self._start = (self._start + 1) % capacity
+        return evicted
+
+    def values(self) -> np.ndarray:
+        """Copy of the contents, oldest first"""
+        end = self._start + self._size
+        if end <= len(self._data):
+            return self._data[self._start:end].copy()
+        return np.concatenate((self._data[self._start:], self._data[:end - len(self._data)]))
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+
+# ============
+# Aggregators
+# ============
+class Aggregator(ABC):
+    """Aggregate maintained incrementally over a FIFO window.
+
+    add() takes each new value; remove() retracts the oldest value still
+    in the window (values leave in the order they arrived). Both are O(1)
+    (amortized for min/max).
+    """
+
+    @abstractmethod
+    def add(self, value: float):
+        ...
+
+    @abstractmethod
+    def remove(self, value: float):
+        ...
+
+    @abstractmethod
+    def value(self) -> Optional[float]:
+        ...
+
+    def reset(self):
+        self.__init__()
+
+
+class Count(Aggregator):
+    def __init__(self):
+        self.n = 0
+
+    def add(self, value: float):
+        self.n += 1
+
+    def remove(self, value: float):
+        self.n -= 1
+
+    def value(self) -> Optional[float]:
+        return self.n
+
+
+class Sum(Aggregator):
+    def __init__(self):
+        self.total = 0.0
+
+    def add(self, value: float):
+        self.total += value
+
+    def remove(self, value: float):
+        self.total -= value
+
+    def value(self) -> Optional[float]:
+        return self.total
+
+
+class Mean(Aggregator):
+    def __init__(self):
+        self.n = 0
+        self.total = 0.0
+
+    def add(self, value: float):
+        self.n += 1
+        self.total += value
+
+    def remove(self, value: float):
+        self.n -= 1
+        self.total = self.total - value if self.n else 0.0
+
+    def value(self) -> Optional[float]:
+        return self.total / self.n if self.n else None
+
+
+class Variance(Aggregator):
+    """Population variance by Welford's method, with retraction"""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float):
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float):
+        if self.n <= 1:
+            self.reset()
+            return
+        old_mean = self.mean
+        self.n -= 1
+        self.mean = (old_mean * (self.n + 1) - value) / self.n
+        self.m2 = max(0.0, self.m2 - (value - old_mean) * (value - self.mean))
+
+    def value(self) -> Optional[float]:
+        return self.m2 / self.n if self.n else None
+
+
+class StdDev(Variance):
+    def value(self) -> Optional[float]:
+        variance = super().value()
+        return math.sqrt(variance) if variance is not None else None
+
+
+class _Extremum(Aggregator):
+    """Min or max over a sliding window via a monotonic deque"""
+
+    def __init__(self):
+        self._deque = deque()
+
+    @abstractmethod
+    def _dominates(self, a: float, b: float) -> bool:
+        ...
+
+    def add(self, value: float):
+        while self._deque and self._dominates(value, self._deque[-1]):
+            self._deque.pop()
+        self._deque.append(value)
+
+    def remove(self, value: float):
+        if self._deque and self._deque[0] == value:
+            self._deque.popleft()
+
+    def value(self) -> Optional[float]:
+        return self._deque[0] if self._deque else None
+
+
+class Min(_Extremum):
+    def _dominates(self, a: float, b: float) -> bool:
+        return a < b
+
+
+class Max(_Extremum):
+    def _dominates(self, a: float, b: float) -> bool:
+        return a > b
+
+
+AGGREGATORS = {
+    "count": Count,
+    "sum": Sum,
+    "mean": Mean,
+    "min": Min,
+    "max": Max,
+    "variance": Variance,
+    "std": StdDev,
+}
+
+
+def make_aggregators(names: Sequence[str]) -> Dict[str, Aggregator]:
+    unknown = [name for name in names if name not in AGGREGATORS]
+    if unknown:
+        raise ValueError(f"Unknown aggregation(s): {', '.join(unknown)}")
+    return {name: AGGREGATORS[name]() for name in names}
+
+
+def _result(start: float, end: float, count: int, aggregators: Dict[str, Aggregator]) -> Dict:
+    result = {"start": start, "end": end, "count": count}
+    result.update({name: agg.value() for name, agg in aggregators.items()})
+    return result
+
+
+# ========
+# Windows
+# ========
+class Watermark:
+    """Event-time progress: the latest event time seen, minus allowed_lateness.
+
+    Windows ending at or before the watermark are complete; events older
+    than it are late.
+    """
+
+    def __init__(self, allowed_lateness: float = 0.0):
+        self.allowed_lateness = allowed_lateness
+        self.max_event_time = -math.inf
+
+    @property
+    def current(self) -> float:
+        return self.max_event_time - self.allowed_lateness
+
+    def observe(self, event_time: float):
+        if event_time > self.max_event_time:
+            self.max_event_time = event_time
+
+
+class CountWindow:
+    """Windows over the last `size` elements, emitted every `slide` elements.
+
+    Tumbling windows are the case slide == size. Values live in a ring
+    buffer and evicted values are retracted from the aggregates, so each
+    element costs O(1) whatever the window size.
+    """
+
+    def __init__(self, size: int, slide: Optional[int] = None,
+                 aggregations: Sequence[str] = ("mean",)):
+        size = int(size)
+        self.slide = size if slide is None else int(slide)
+        if not 1 <= self.slide <= size:
+            raise ValueError("Count windows need 1 <= slide <= size")
+        self.buffer = RingBuffer(size)
+        self.aggregators = make_aggregators(aggregations)
+        self.seen = 0
+        self._since_emit = 0
+
+    def add(self, value: float, timestamp: Optional[float] = None) -> List[Dict]:
+        evicted = self.buffer.append(value)
+        for agg in self.aggregators.values():
+            if evicted is not None:
+                agg.remove(evicted)
+            agg.add(value)
+        self.seen += 1
+        self._since_emit += 1
+        if len(self.buffer) == self.buffer.capacity and self._since_emit >= self.slide:
+            self._since_emit = 0
+            return [self.current()]
+        return []
+
+    def current(self) -> Dict:
+        """Aggregates of the elements currently in the window"""
+        count = len(self.buffer)
+        return _result(self.seen - count, self.seen, count, self.aggregators)
+
+    def advance(self, event_time: float) -> List[Dict]:
+        return []  # Count windows don't depend on time
+
+
+class TimeWindow:
+    """Event-time tumbling (slide == size) or sliding windows of `size` seconds.
+
+    Each element is added to the ceil(size / slide) windows that contain
+    it. A window is emitted once the watermark passes its end; elements
+    for windows already emitted are counted as late and dropped.
+    """
+
+    def __init__(self, size: float, slide: Optional[float] = None,
+                 aggregations: Sequence[str] = ("mean",), allowed_lateness: float = 0.0):
+        self.size = float(size)
+        self.slide = self.size if slide is None else float(slide)
+        if self.size <= 0 or not 0 < self.slide <= self.size:
+            raise ValueError("Time windows need 0 < slide <= size")
+        self.aggregations = tuple(aggregations)
+        make_aggregators(self.aggregations)  # Validate names up front
+        self.watermark = Watermark(allowed_lateness)
+        self.windows: Dict[float, Dict[str, Aggregator]] = {}
+        self.late = 0
+
+    def add(self, value: float, timestamp: float) -> List[Dict]:
+        last_start = math.floor(timestamp / self.slide) * self.slide
+        if last_start + self.size <= self.watermark.current:
+            self.late += 1
+        else:
+            start = last_start
+            while start + self.size > timestamp:
+                if start + self.size > self.watermark.current:
+                    window = self.windows.get(start)
+                    if window is None:
+                        window = self.windows[start] = make_aggregators(("count",) + self.aggregations)
+                    for agg in window.values():
+                        agg.add(value)
+                start -= self.slide
+        self.watermark.observe(timestamp)
+        return self._emit_complete()
+
+    def advance(self, event_time: float) -> List[Dict]:
+        """Move event time forward without data (e.g. to close windows on an idle stream)"""
+        self.watermark.observe(event_time)
+        return self._emit_complete()
+
+    def _emit_complete(self) -> List[Dict]:
+        complete = sorted(start for start in self.windows
+                          if start + self.size <= self.watermark.current)
+        results = []
+        for start in complete:
+            window = self.windows.pop(start)
+            count = window.pop("count").value()
+            results.append(_result(start, start + self.size, count, window))
+        return results
+
+
+class SessionWindow:
+    """Event-time sessions that end after `gap` seconds without data.
+
+    A session is emitted once the watermark passes its last event plus
+    the gap. Events older than the watermark are counted as late.
+    """
+
+    def __init__(self, gap: float, aggregations: Sequence[str] = ("mean",),
+                 allowed_lateness: float = 0.0):
+        if gap <= 0:
+            raise ValueError("Session gap must be positive")
+        self.gap = float(gap)
+        self.aggregations = tuple(aggregations)
+        make_aggregators(self.aggregations)
+        self.watermark = Watermark(allowed_lateness)
+        self.session: Optional[Dict[str, Aggregator]] = None
+        self.first = self.last = 0.0
+        self.late = 0
+
+    def add(self, value: float, timestamp: float) -> List[Dict]:
+        results = []
+        if timestamp < self.watermark.current:
+            self.late += 1
+            return results
+        if self.session is not None and timestamp - self.last > self.gap:
+            results.append(self._close())
+        if self.session is None:
+            self.session = make_aggregators(("count",) + self.aggregations)
+            self.first = self.last = timestamp
+        for agg in self.session.values():
+            agg.add(value)
+        self.first = min(self.first, timestamp)
+        self.last = max(self.last, timestamp)
+        self.watermark.observe(timestamp)
+        return results + self.advance(timestamp)
+
+    def advance(self, event_time: float) -> List[Dict]:
+        self.watermark.observe(event_time)
+        if self.session is not None and self.watermark.current >= self.last + self.gap:
+            return [self._close()]
+        return []
+
+    def _close(self) -> Dict:
+        session, self.session = self.session, None
+        count = session.pop("count").value()
+        return _result(self.first, self.last + self.gap, count, session)
+
+
+def create_window(mode: str = "tumbling", by: str = "count", size: float = 10,
+                  slide: Optional[float] = None, gap: Optional[float] = None,
+                  aggregations: Sequence[str] = ("mean",), allowed_lateness: float = 0.0):
+    """Window for a mode (tumbling/sliding/session) measured by count or event time"""
+    if mode not in WINDOW_MODES:
+        raise ValueError(f"Unknown window mode '{mode}'")
+    if by not in WINDOW_MEASURES:
+        raise ValueError(f"Unknown window measure '{by}'")
+    if mode == "session":
+        if by != "time":
+            raise ValueError("Session windows are measured by time")
+        if gap is None:
+            raise ValueError("Session windows need a gap")
+        return SessionWindow(gap, aggregations, allowed_lateness)
+    if mode == "tumbling":
+        slide = None
+    elif slide is None:
+        raise ValueError("Sliding windows need a slide")
+    if by == "count":
+        return CountWindow(int(size), None if slide is None else int(slide), aggregations)
+    return TimeWindow(size, slide, aggregations, allowed_lateness)
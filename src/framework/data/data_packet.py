@@ -14,7 +14,7 @@ class DataPacket(BaseModel):
     sensitivity: SensitivityLevel = SensitivityLevel.PUBLIC
     source: DataSource
     content: Any
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     sequence_id: Optional[int] = None
     processing_chain: List[str] = Field(
         default_factory=list,
@@ -1,40 +1,34 @@
 # framework/nodes/__init__.py
-import importlib
-import pkgutil
 import logging
+import os
 from framework.core.registry import NodeRegistry
+from framework.core import manifest
 from framework.nodes.base_node import BaseNode
 
 logger = logging.getLogger(__name__)
 
-def _autoload_nodes():
-    """Smart node discovery with duplicate protection"""
+def _discover_nodes():
+    """Register node types from the cached manifest without importing them.
+
+    Node modules (and their heavy dependencies) are imported only when
+    NodeRegistry first creates or resolves that type. Set
+    STREAMLET_EAGER_NODES=1 to import every node module up front.
+    """
+    entries = manifest.discover(__path__, prefix=__name__ + ".")
+    eager = os.environ.get("STREAMLET_EAGER_NODES") == "1"
     loaded_types = set()
-    
-    for _, module_name, _ in pkgutil.walk_packages(
-        __path__,
-        prefix=__name__ + "."
-    ):
-        if "__" in module_name or "base_node" in module_name:
+
+    for entry in entries:
+        if entry['type'] in loaded_types:
+            logger.warning(f"Skipping duplicate: {entry['type']}")
             continue
-            
-        try:
-            module = importlib.import_module(module_name)
-            if not hasattr(module, 'NODE_CLASSES'):
-                continue
-                
-            for cls in module.NODE_CLASSES:
-                if (issubclass(cls, BaseNode) and 
-                    cls != BaseNode and
-                    cls.node_type not in loaded_types):
-                    
-                    NodeRegistry.register(cls.node_type, cls)
-                    loaded_types.add(cls.node_type)
-                    logger.debug(f"Registered node: {cls.node_type}")
-                else:
-                    logger.warning(f"Skipping duplicate: {cls.node_type}")
-                    
-        except Exception as e:
-            logger.error(f"Failed to load {module_name}: {str(e)}")
+        NodeRegistry.register_lazy(entry)
+        loaded_types.add(entry['type'])
+        logger.debug(f"Discovered node: {entry['type']} ({entry['module']})")
+        if eager:
+            try:
+                NodeRegistry.get_class(entry['type'])
+            except Exception as e:
+                logger.error(f"Failed to load {entry['module']}: {str(e)}")
 
-_autoload_nodes()
\ No newline at end of file
+_discover_nodes()
@@ -1,9 +1,19 @@
 from abc import ABCMeta
+from concurrent.futures import Future
+from contextlib import contextmanager
 from typing import Type, Set, Any, Optional, List
 from pydantic import BaseModel
 from framework.data import *
 from framework.core.telemetry import telemetry
 from framework.core.decorators import node_telemetry
+from framework.core.bulkhead import CircuitBreaker, EXECUTION_CLASSES
+from framework.core.event_loop import shared_loop
+from framework.core.quota import estimate_size
+from framework.core.spill_queue import SpillQueue
+from framework.core.flow_control import INGRESS_POLICIES
+import inspect
+import itertools
+import threading
 import uuid
 import logging
 import time
@@ -18,6 +28,11 @@ class NodeMeta(ABCMeta):
         # Create the class
         new_class = super().__new__(cls, name, bases, namespace, **kwargs)
 
+        # Nodes with coroutine on_data/process run on the shared event loop
+        if (inspect.iscoroutinefunction(getattr(new_class, 'on_data', None)) or
+                inspect.iscoroutinefunction(getattr(new_class, 'process', None))):
+            new_class.IS_ASYNC_CAPABLE = True
+
         # Register node type if it has one
         if hasattr(new_class, 'node_type'):
             from framework.core.registry import NodeRegistry
@@ -37,11 +52,20 @@ class BaseNode(metaclass=NodeMeta):
     accepted_formats: Set[DataFormat] = set()  # Allowed data formats
     accepted_categories: Set[DataCategory] = set()  # Allowed data categories
 
+    # Output envelope - leave as None when it depends on runtime data
+    output_data_types: Optional[Set[DataType]] = None
+    output_formats: Optional[Set[DataFormat]] = None
+    output_categories: Optional[Set[DataCategory]] = None
+    PASSTHROUGH_OUTPUT = False  # Node re-emits its input packets unchanged
+
     Params: Type[BaseModel] = None
 
     IS_GENERATOR = False  # Node generates data itself / Waits for data to process
-    IS_ASYNC_CAPABLE = False  # Node supports async processing
+    IS_ASYNC_CAPABLE = False  # Set automatically for async on_data/process
+    MAX_IN_FLIGHT = 100  # Concurrent coroutines per async node
     MAX_BUFFER_SIZE = 100 # Packet overflow limit
+    EXECUTION_CLASS = "inline"  # inline / io / cpu / process (see framework.core.bulkhead)
+    CAN_PAUSE = True  # Sources that can't (network listeners) apply ingress_policy instead
 
 
     # Input Configuration
@@ -77,8 +101,50 @@ class BaseNode(metaclass=NodeMeta):
         if self.MAX_INPUTS is not None and len(self.inputs) > self.MAX_INPUTS:
             raise ValueError(f"{self.node_type} allows at most {self.MAX_INPUTS} inputs")
             
-        # Initialize input storage
-        self.input_buffers = {channel: [] for channel in self.inputs}
+        # Initialize input storage (config `spill` makes buffers overflow to disk)
+        self.spill = config.get('spill')
+        self.input_buffers = {channel: self.new_input_buffer() for channel in self.inputs}
+
+        # Input channels proven type-safe at build time (see Pipeline.build)
+        self.trusted_inputs: Set[str] = set()
+
+        # Execution class can be overridden per node in the config
+        self.execution_class = config.get('execution', self.EXECUTION_CLASS)
+        if self.execution_class not in EXECUTION_CLASSES:
+            raise ValueError(f"Unknown execution class '{self.execution_class}' "
+                             f"for node '{self.name}'")
+        self.bulkhead = None  # Set by Pipeline.build for io/cpu nodes
+        self.offload = None  # Set by Pipeline.build for process nodes
+        # Only nodes that call out (io/cpu/process) or opt in via config get a breaker;
+        # an exception from an inline node is a bug, not an unhealthy dependency
+        self.breaker = None
+        if self.execution_class != "inline" or 'circuit_breaker' in config:
+            self.breaker = CircuitBreaker(
+                **config.get('circuit_breaker', {}),
+                on_state_change=self._on_circuit_change
+            )
+        self.shed_count = 0
+
+        # Progress tracking for the stall watchdog (see framework.core.watchdog)
+        self.stall_limits = None  # Set by Pipeline.build when a watchdog is configured
+        self.stalled = False
+        self.last_progress = time.monotonic()
+        self._active = {}  # Running calls: token -> start time
+        self._activity_ids = itertools.count()
+        self._held = {}  # Newest packet per channel while stalled (shed_latest)
+
+        # Credit-based backpressure (see framework.core.flow_control)
+        self.flow = None  # Set by Pipeline.build when settings.flow_control is on
+        self.ingress_policy = config.get('ingress_policy', 'drop')
+        if self.ingress_policy not in INGRESS_POLICIES:
+            raise ValueError(f"Unknown ingress policy '{self.ingress_policy}' "
+                             f"for node '{self.name}'")
+        self._ingress_held = None
+        self.credit_blocked = False
+
+        # Bounded concurrency for coroutines on the shared event loop
+        self.max_in_flight = int(config.get('max_in_flight', self.MAX_IN_FLIGHT))
+        self._in_flight = threading.BoundedSemaphore(self.max_in_flight)
         
         if self.Params:
             # Create params with proper types for references
@@ -128,12 +194,12 @@ class BaseNode(metaclass=NodeMeta):
             self.logger.error(f"Unregistered input channel: {input_channel}")
             return
             
-        if not self.validate_input(packet):
+        if not self.validate_input(packet, input_channel):
             self.log_rejection(packet)
             return
             
         # Create packet buffer storage for every input channel
-        if len(self.input_buffers[input_channel]) < self.MAX_BUFFER_SIZE:
+        if self.spill or len(self.input_buffers[input_channel]) < self.MAX_BUFFER_SIZE:
             self.input_buffers[input_channel].append(packet)
         else:
             self.logger.warning(f"Buffer overflow on {input_channel}, packet dropped")
@@ -278,8 +344,12 @@ class BaseNode(metaclass=NodeMeta):
     # Validation Functions
     # ====================
     # Validate incoming packets by accepted data types, formats, and categories
-    def validate_input(self, packet: DataPacket) -> bool:
+    def validate_input(self, packet: DataPacket, input_channel: Optional[str] = None) -> bool:
             """Check if node can process this data type with telemetry"""
+            # Edges proven safe at build time skip the per-packet check
+            if self._is_trusted(input_channel):
+                return True
+
             is_valid = (
                 packet.data_type in self.accepted_data_types and
                 packet.format in self.accepted_formats and
@@ -302,6 +372,13 @@ class BaseNode(metaclass=NodeMeta):
             
             return is_valid
 
+    def _is_trusted(self, input_channel: Optional[str]) -> bool:
+            """Whether packets from this channel were type-checked at build time"""
+            if input_channel is not None:
+                return input_channel in self.trusted_inputs
+            # Callers without channel info: trust only if every input is proven safe
+            return bool(self.inputs) and all(ch in self.trusted_inputs for ch in self.inputs)
+
     # Packet rejection logging
     def log_rejection(self, packet: DataPacket):
             """Log detailed rejection reasons"""
@@ -359,6 +436,33 @@ class BaseNode(metaclass=NodeMeta):
     def should_process(self):
         return self.IS_GENERATOR
 
+    # Send a packet to every output channel
+    def publish(self, packet: DataPacket):
+        self.last_output = packet
+        for output_channel in self.outputs:
+            self.data_bus.publish(output_channel, packet)
+
+    # ======================
+    # Async Node Functions
+    # ======================
+    def run_async(self, coro_fn, *args, shed: bool = True) -> Optional[Future]:
+        """Schedule coro_fn(*args) on the shared event loop.
+
+        Returns None (and sheds, if requested) when max_in_flight coroutines
+        are already running for this node.
+        """
+        if not self._in_flight.acquire(blocking=False):
+            if shed:
+                self.record_shed("in_flight_full")
+            return None
+        try:
+            future = shared_loop.submit(coro_fn(*args))
+        except Exception:
+            self._in_flight.release()
+            raise
+        future.add_done_callback(lambda _: self._in_flight.release())
+        return future
+
     # ========================
     # Node Parameter Functions
     # ========================
@@ -377,11 +481,151 @@ class BaseNode(metaclass=NodeMeta):
         if hasattr(self, 'on_params_updated'):
             self.on_params_updated()
 
+    # ========================
+    # State Snapshot Functions
+    # ========================
+    # Override in stateful nodes so restarts can resume warm
+    def save_state(self) -> Optional[dict]:
+        """Return a serializable snapshot of runtime state, or None if stateless"""
+        return None
+
+    def restore_state(self, state: dict):
+        """Restore runtime state captured by save_state"""
+        pass
+
+    # ==========================
+    # Failure Isolation Functions
+    # ==========================
+    # Nodes that swallow dependency errors report them so the breaker can open
+    def report_failure(self, error: Any = None):
+        """Record a failed call to this node's dependency"""
+        if self.breaker is not None:
+            self.breaker.record_failure()
+
+    def report_success(self):
+        """Record a successful call to this node's dependency"""
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def record_shed(self, reason: str):
+        """Count a packet dropped before delivery (open circuit or full bulkhead)"""
+        self.shed_count += 1
+        self.emit_telemetry("packet_shed", {"reason": reason, "total": self.shed_count})
+
+    # ======================
+    # Resource Quota Support
+    # ======================
+    def new_input_buffer(self):
+        """A plain list, or a SpillQueue when the node config asks for `spill`"""
+        if not self.spill:
+            return []
+        return SpillQueue(**(self.spill if isinstance(self.spill, dict) else {}))
+
+    def buffered_bytes(self) -> int:
+        """Estimated bytes held by this node; nodes that keep more state should extend this"""
+        return sum(buffer.memory_bytes() if isinstance(buffer, SpillQueue) else estimate_size(buffer)
+                   for buffer in self.input_buffers.values())
+
+    def shed_buffered(self) -> int:
+        """Drop buffered input to get back under a memory quota, returning packets dropped"""
+        dropped = 0
+        for buffer in self.input_buffers.values():
+            dropped += len(buffer)
+            buffer.clear()
+        if dropped:
+            self.shed_count += dropped
+            self.emit_telemetry("packet_shed", {"reason": "quota", "total": self.shed_count})
+        return dropped
+
+    # =============
+    # Flow Control
+    # =============
+    def has_credit(self) -> bool:
+        """Whether downstream can take more packets from this node"""
+        return self.flow is None or self.flow.credit(self.name) > 0
+
+    def admit(self, packet: DataPacket) -> bool:
+        """For sources that can't pause: may a received packet enter the graph?"""
+        if self.has_credit():
+            return True
+        if self.ingress_policy == "latest":
+            if self._ingress_held is not None:
+                self.record_shed("no_credit")
+            self._ingress_held = packet
+        else:
+            self.record_shed("no_credit")
+        return False
+
+    def release_held(self):
+        """Publish the packet held back under the 'latest' ingress policy"""
+        held, self._ingress_held = self._ingress_held, None
+        if held is not None:
+            self.publish(held)
+
+    # ================
+    # Stall Detection
+    # ================
+    @contextmanager
+    def activity(self):
+        """Mark a call into this node as running, for stall detection"""
+        token = next(self._activity_ids)
+        self._active[token] = time.monotonic()
+        try:
+            yield
+        finally:
+            self._active.pop(token, None)
+            self.last_progress = time.monotonic()
+
+    def busy_for(self, now: Optional[float] = None) -> float:
+        """Seconds the longest running call into this node has taken so far"""
+        started = list(self._active.values())
+        if not started:
+            return 0.0
+        return (time.monotonic() if now is None else now) - min(started)
+
+    def backlog(self) -> int:
+        """Packets waiting for this node; nodes with internal queues should extend this"""
+        return sum(len(buffer) for buffer in self.input_buffers.values())
+
+    def shed_to_latest(self) -> int:
+        """Keep only the newest packet of each input buffer, returning packets dropped"""
+        dropped = 0
+        for buffer in self.input_buffers.values():
+            if isinstance(buffer, SpillQueue):
+                dropped += buffer.keep_latest()
+            else:
+                dropped += max(0, len(buffer) - 1)
+                del buffer[:-1]
+        return dropped
+
+    def hold_while_stalled(self, packet: Any, input_channel: str):
+        """Called instead of on_data while the node is stalled"""
+        if self.stall_limits is not None and self.stall_limits.policy == "shed_latest":
+            # Only the packet being replaced is lost
+            if input_channel in self._held:
+                self.record_shed("stalled")
+            self._held[input_channel] = packet
+        else:
+            self.record_shed("stalled")
+
+    def recover(self):
+        """Leave the stalled state, delivering packets held under shed_latest"""
+        self.stalled = False
+        held, self._held = self._held, {}
+        for input_channel, packet in held.items():
+            self.data_bus.redeliver(self, packet, input_channel)
+
+    def _on_circuit_change(self, state: str):
+        self.logger.warning(f"Circuit {state} for node {self.name}")
+        self.emit_telemetry("circuit_state", state)
+
     # ===================
     # Telemetry Functions
     # ===================
     def emit_telemetry(self, metric: str, value: Any):
         """Non-blocking telemetry emission"""
+        if not self.telemetry.enabled:
+            return
         try:
             self.telemetry.broadcast_sync({
                 "pipeline_id": self.pipeline.id,
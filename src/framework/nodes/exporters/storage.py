@@ -5,6 +5,7 @@ from framework.nodes.base_node import BaseNode
 from framework.data.data_packet import DataPacket
 from framework.data.data_types import DataType, DataFormat, DataCategory
 from framework.core.decorators import node_telemetry
+from framework.core.quota import estimate_size
 
 class StorageNode(BaseNode):
     node_type = "storage"
@@ -12,6 +13,7 @@ class StorageNode(BaseNode):
     accepted_data_types = set(DataType)
     accepted_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL, DataFormat.BINARY}
     accepted_categories = set(DataCategory)
+    PASSTHROUGH_OUTPUT = True
     IS_GENERATOR = False
     MIN_INPUTS = 1
     MAX_INPUTS = 1
@@ -19,6 +21,7 @@ class StorageNode(BaseNode):
     class Params(BaseModel):
         filter_by_type: Optional[str] = None    # only store packets of this DataType
         include_metadata: bool = True           # add packet.metadata to stored record
+        max_saved_records: int = 1000           # newest records kept in state snapshots (0 = none)
 
     def __init__(self, config):
         super().__init__(config)
@@ -52,6 +55,24 @@ class StorageNode(BaseNode):
         for out_ch in self.outputs:
             self.data_bus.publish(out_ch, packet)
 
+    def save_state(self):
+        # Snapshots are rewritten every interval, so only the newest records are kept
+        limit = max(0, self.params.max_saved_records)
+        return {"records": self._storage[-limit:] if limit else []}
+
+    def restore_state(self, state):
+        self._storage = list(state.get("records", []))
+        self.last_entry = self._storage[-1] if self._storage else None
+
+    def buffered_bytes(self) -> int:
+        return super().buffered_bytes() + estimate_size(self._storage)
+
+    def shed_buffered(self) -> int:
+        """Keep only the newest half of the stored records"""
+        dropped = len(self._storage) - len(self._storage) // 2
+        del self._storage[:dropped]
+        return super().shed_buffered() + dropped
+
     def get_all(self) -> List[Dict[str, Any]]:
         """Optionally expose the full session storage in code."""
         return list(self._storage)
@@ -0,0 +1,287 @@
+# framework/nodes/keyed.py
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from framework.core.executors import SerialExecutor
+from framework.core.spill_queue import SpillQueue
+from framework.data.data_packet import DataPacket
+from framework.nodes.base_node import BaseNode
+
+# Config keys consumed by KeyedNode rather than the wrapped node
+KEYED_OPTIONS = ("parallelism", "key_by", "max_keys", "lane_queue")
+
+_NO_KEY = object()  # Returned for packets shed because their key can't be used
+
+
+def extract_key(data: Any, path: str) -> Any:
+    """Follow a dot path (e.g. content.sensor_id) through attributes and dict keys"""
+    current = data
+    for part in path.split('.'):
+        if isinstance(current, dict):
+            current = current.get(part)
+        elif isinstance(current, list) and part.isdigit() and int(part) < len(current):
+            current = current[int(part)]
+        else:
+            current = getattr(current, part, None)
+        if current is None:
+            return None
+    return current
+
+
+def hashable_key(key: Any) -> Any:
+    """Normalize a key so it can index instances: lists become tuples, dicts sorted item tuples.
+
+    Raises TypeError for keys that remain unhashable.
+    """
+    if isinstance(key, (list, tuple)):
+        return tuple(hashable_key(item) for item in key)
+    if isinstance(key, dict):
+        return tuple(sorted(((hashable_key(k), hashable_key(v)) for k, v in key.items()), key=repr))
+    if isinstance(key, (set, frozenset)):
+        return frozenset(hashable_key(item) for item in key)
+    hash(key)
+    return key
+
+
+class KeyedNode(BaseNode):
+    """Runs one instance of a node per key, spread over `parallelism` lanes.
+
+    Packets are routed when they are published, by a stable hash of the
+    value at `key_by`, to one of N serial lanes. Lanes run on the
+    pipeline's executor, so they share its weight and thread quota with
+    the rest of its work. Every key always lands on the same lane and the
+    same instance, so per-key order and state are kept while different
+    keys run in parallel. Instances are created on first use; beyond
+    max_keys the least recently used one is stopped and dropped.
+    """
+    ROUTES_AT_PUBLISH = True  # DataBus calls route() instead of on_data()
+
+    def __init__(self, config: Dict, node_class):
+        # Mirror the wrapped node's shape so build-time checks apply to it
+        self.node_class = node_class
+        self.node_type = node_class.node_type
+        for attr in ('MIN_INPUTS', 'MAX_INPUTS', 'IS_GENERATOR', 'EXECUTION_CLASS',
+                     'accepted_data_types', 'accepted_formats', 'accepted_categories'):
+            setattr(self, attr, getattr(node_class, attr))
+        if node_class.IS_GENERATOR or node_class.MIN_INPUTS == 0:
+            raise ValueError(f"Source node '{config['name']}' cannot be partitioned by key")
+        if not config.get('key_by'):
+            raise ValueError(f"Node '{config['name']}' sets parallelism without key_by")
+        super().__init__(config)
+
+        self.parallelism = int(config.get('parallelism', 1))
+        if self.parallelism < 1:
+            raise ValueError(f"parallelism must be at least 1 for node '{self.name}'")
+        self.key_by = config['key_by']
+        self.max_keys = int(config.get('max_keys', 10000))
+        self.lane_queue = int(config.get('lane_queue', 1000))
+        self.instance_config = {k: v for k, v in config.items() if k not in KEYED_OPTIONS}
+
+        self.instances: "OrderedDict[Any, BaseNode]" = OrderedDict()
+        self._instances_lock = threading.Lock()
+        self._lanes: Optional[List[SerialExecutor]] = None
+        self._queued = 0  # Packets waiting on or running in lanes
+        # Re-entrant: a lane that can't take work cancels it, and the done callback locks again
+        self._queued_lock = threading.RLock()
+        self._overflow: Optional[SpillQueue] = None  # Lane overflow from spilling edges
+
+    # ========
+    # Routing
+    # ========
+    def route(self, data: Any, input_channel: str):
+        """Queue a published packet on its key's lane, in publish order"""
+        if self.breaker is not None and not self.breaker.allow():
+            self.record_shed("circuit_open")
+            return
+        try:
+            # Each delivery gets its own copy, as DataBus subscribers do
+            payload = self.data_bus.private_copy(data)
+        except Exception as e:
+            self.logger.error(f"Delivery failed: {str(e)}", exc_info=True)
+            return
+        if self.stalled:
+            self.hold_while_stalled(payload, input_channel)
+            return
+
+        with self._queued_lock:
+            if self._queued < self.lane_queue * self.parallelism and not self._overflow:
+                self._queued += 1
+                self._enqueue(payload, input_channel)
+                return
+            # Lanes full: spill in order when the channel has a spilling edge, else shed
+            if self._overflow is None:
+                self._overflow = self.data_bus.new_spill_queue(input_channel)
+            if self._overflow is not None and self._overflow.put_nowait([payload, input_channel]):
+                return
+        self.record_shed("lane_full")
+
+    def _enqueue(self, payload: Any, input_channel: str):
+        """Submit a packet to its key's lane (with _queued_lock held, so lanes get publish order)"""
+        key = self._key_of(payload)
+        if key is _NO_KEY:
+            self._queued -= 1
+            return
+        try:
+            future = self._get_lanes()[self._lane_index(key)].submit(
+                self._deliver, key, payload, input_channel)
+        except RuntimeError:
+            self._queued -= 1
+            return
+        future.add_done_callback(self._on_lane_done)
+        self.data_bus.track_delivery(input_channel, future)
+
+    def on_data(self, packet: DataPacket, input_channel: str):
+        # Reached directly under frame-synchronous delivery
+        key = self._key_of(packet)
+        if key is not _NO_KEY:
+            self._deliver(key, packet, input_channel)
+
+    def _key_of(self, packet: Any) -> Any:
+        """The packet's normalized key, or _NO_KEY after shedding a packet whose key can't be used"""
+        key = extract_key(packet, self.key_by)
+        try:
+            return hashable_key(key)
+        except TypeError:
+            self.logger.warning(f"Shedding packet for {self.name}: "
+                                f"unhashable {type(key).__name__} key at '{self.key_by}'")
+            self.record_shed("unhashable_key")
+            return _NO_KEY
+
+    def _on_lane_done(self, _):
+        with self._queued_lock:
+            self._queued -= 1
+            if self._overflow and self._lanes is not None and self.data_bus.enabled:
+                payload, input_channel = self._overflow.get_nowait()
+                self._queued += 1
+                self._enqueue(payload, input_channel)
+
+    def _deliver(self, key: Any, data: Any, input_channel: str):
+        instance = self.instance_for(key)
+        with self.activity():
+            self.data_bus._invoke(instance.on_data, data, input_channel, self.breaker)
+
+    def recover(self):
+        if not self.data_bus.routes_at_publish:
+            super().recover()
+            return
+        # Held packets go back through the lanes so they stay in key order
+        self.stalled = False
+        held, self._held = self._held, {}
+        for input_channel, packet in held.items():
+            self.route(packet, input_channel)
+
+    def _get_lanes(self) -> List[SerialExecutor]:
+        if self._lanes is None:
+            with self._instances_lock:
+                if self._lanes is None:
+                    self._lanes = [SerialExecutor(self.data_bus.executor)
+                                   for _ in range(self.parallelism)]
+        return self._lanes
+
+    def _lane_index(self, key: Any) -> int:
+        return zlib.crc32(repr(key).encode()) % self.parallelism
+
+    # ==========
+    # Instances
+    # ==========
+    def instance_for(self, key: Any) -> BaseNode:
+        """The instance owning a key, created on first use"""
+        key = hashable_key(key)
+        with self._instances_lock:
+            instance = self.instances.get(key)
+            if instance is not None:
+                self.instances.move_to_end(key)
+                return instance
+            instance = self._create_instance()
+            self.instances[key] = instance
+            evicted = self.instances.popitem(last=False)[1] if len(self.instances) > self.max_keys else None
+        if evicted is not None:
+            self._stop_instance(evicted)
+        return instance
+
+    def _create_instance(self) -> BaseNode:
+        instance = self.node_class(self.instance_config)
+        instance.data_bus = self.data_bus
+        instance.pipeline = getattr(self, 'pipeline', None)
+        instance.inputs = list(self.inputs)
+        instance.outputs = list(self.outputs)
+        instance.input_buffers = {channel: instance.new_input_buffer() for channel in self.inputs}
+        instance.trusted_inputs = set(self.trusted_inputs)
+        running = getattr(instance.pipeline, '_running', None)
+        if running is not None and running.is_set() and hasattr(instance, 'start'):
+            instance.start()
+        return instance
+
+    def _stop_instance(self, instance: BaseNode):
+        try:
+            if hasattr(instance, 'stop'):
+                instance.stop()
+            elif hasattr(instance, 'cleanup'):
+                instance.cleanup()
+        except Exception as e:
+            self.logger.error(f"Error stopping keyed instance of {self.name}: {str(e)}")
+
+    def _snapshot_instances(self):
+        with self._instances_lock:
+            return list(self.instances.items())
+
+    # ==========================
+    # Frame and Lifecycle Hooks
+    # ==========================
+    def should_process(self):
+        return any(instance.should_process() for _, instance in self._snapshot_instances())
+
+    def process(self):
+        lanes = self._get_lanes()
+        for key, instance in self._snapshot_instances():
+            if instance.should_process():
+                lanes[self._lane_index(key)].submit(instance.process)
+
+    def start(self):
+        for _, instance in self._snapshot_instances():
+            if hasattr(instance, 'start'):
+                instance.start()
+
+    def stop(self):
+        for _, instance in self._snapshot_instances():
+            self._stop_instance(instance)
+        with self._instances_lock:
+            lanes, self._lanes = self._lanes, None
+        for lane in lanes or ():
+            lane.shutdown(wait=False, cancel_futures=True)
+        with self._queued_lock:
+            overflow, self._overflow = self._overflow, None
+        if overflow is not None:
+            overflow.close()
+
+    def save_state(self):
+        states = [[key, instance.save_state()] for key, instance in self._snapshot_instances()]
+        return {"instances": [entry for entry in states if entry[1] is not None]}
+
+    def restore_state(self, state):
+        for key, instance_state in state.get("instances", []):
+            # Tuple keys come back from the state store as lists; instance_for normalizes them
+            try:
+                instance = self.instance_for(key)
+            except TypeError:
+                self.logger.warning(f"Skipping saved state of {self.name} for unhashable key {key!r}")
+                continue
+            instance.restore_state(instance_state)
+
+    # =======================
+    # Load and Stall Metrics
+    # =======================
+    def backlog(self) -> int:
+        # Packets on lanes count as in flight on their channel, like bus deliveries
+        overflow = len(self._overflow) if self._overflow is not None else 0
+        return overflow + sum(i.backlog() for _, i in self._snapshot_instances())
+
+    def buffered_bytes(self) -> int:
+        return sum(i.buffered_bytes() for _, i in self._snapshot_instances())
+
+    def shed_buffered(self) -> int:
+        return sum(i.shed_buffered() for _, i in self._snapshot_instances())
+
+    def shed_to_latest(self) -> int:
+        return sum(i.shed_to_latest() for _, i in self._snapshot_instances())
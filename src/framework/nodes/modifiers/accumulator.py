@@ -1,11 +1,15 @@
 import time
 import logging
-from typing import List, Dict, Any
-from pydantic import BaseModel
+import threading
+from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, field_validator
 from framework.nodes.base_node import BaseNode
 from framework.data.data_packet import DataPacket
 from framework.data.data_types import *
 from framework.core.decorators import node_telemetry
+from framework.core.quota import estimate_size
+
+BATCH_FORMATS = (DataFormat.NUMERICAL, DataFormat.TEXTUAL, DataFormat.BINARY)
 
 class AccumulatorNode(BaseNode):
     node_type = "accumulator"
@@ -13,21 +17,34 @@ class AccumulatorNode(BaseNode):
     accepted_data_types = {DataType.STREAM, DataType.EVENT}
     accepted_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL, DataFormat.BINARY}
     accepted_categories = set(DataCategory)
+    output_data_types = {DataType.DERIVED}
+    output_formats = set(BATCH_FORMATS)
     IS_GENERATOR = False  # Passive node - only processes when data arrives
     
     class Params(BaseModel):
         flush_by: str = "size"  # "size" or "count"
         chunk_size: int = 1024  # in bytes (for "size" mode)
         packet_count: int = 10  # number of packets (for "count" mode)
+        max_chunk_age: Optional[float] = None  # seconds; flush a partial chunk once its oldest packet is this old
         include_metadata: bool = True
         output_format: DataFormat = DataFormat.BINARY
         strict_typing: bool = False
 
+        @field_validator("output_format")
+        @classmethod
+        def _batch_format(cls, value: DataFormat) -> DataFormat:
+            # Edges are type-checked against output_formats, so nothing else may be emitted
+            if value not in BATCH_FORMATS:
+                raise ValueError(f"output_format must be one of {', '.join(f.value for f in BATCH_FORMATS)}")
+            return value
+
     def __init__(self, config):
         super().__init__(config)
         self.params = self.Params(**config.get('params', {}))
         self.buffer: List[DataPacket] = []
         self.current_size = 0
+        self.first_buffered_at: Optional[float] = None  # Monotonic time the oldest packet arrived
+        self._buffer_lock = threading.RLock()  # on_data runs on bus workers, age flushes on frames
         self.logger = logging.getLogger('accumulator')
         self.logger.setLevel(logging.DEBUG)
         
@@ -52,34 +69,61 @@ class AccumulatorNode(BaseNode):
                 elif self.params.output_format == DataFormat.NUMERICAL and not isinstance(packet.content, (int, float)):
                     raise ValueError(f"Expected numerical value, got {type(packet.content)}")
 
-            # Add packet to buffer
-            self.buffer.append(packet)
-            self.current_size += self._get_content_size(packet.content)
-            
-            self.logger.debug("Buffered packet from %s. Current: %d/%s", 
-                            input_channel, 
-                            self.current_size if self.params.flush_by == "size" else len(self.buffer),
-                            self.params.chunk_size if self.params.flush_by == "size" else self.params.packet_count)
-
-            # Check if we should flush
-            should_flush = False
-            if self.params.flush_by == "size":
-                should_flush = self.current_size >= self.params.chunk_size
-            elif self.params.flush_by == "count":
-                should_flush = len(self.buffer) >= self.params.packet_count
-                
-            if should_flush:
-                flush_reason = "size" if self.params.flush_by == "size" else "count"
-                self.logger.info("%s threshold reached (%s), flushing", 
-                               flush_reason.capitalize(),
-                               self.current_size if flush_reason == "size" else len(self.buffer))
-                self.flush()
+            with self._buffer_lock:
+                self._buffer_packet(packet, input_channel)
 
         except Exception as e:
             self.logger.error("Buffer error from %s: %s", input_channel, str(e), exc_info=True)
 
+    def _buffer_packet(self, packet: DataPacket, input_channel: str):
+        # Add packet to buffer
+        if not self.buffer:
+            self.first_buffered_at = time.monotonic()
+        self.buffer.append(packet)
+        self.current_size += self._get_content_size(packet.content)
+        
+        self.logger.debug("Buffered packet from %s. Current: %d/%s", 
+                        input_channel, 
+                        self.current_size if self.params.flush_by == "size" else len(self.buffer),
+                        self.params.chunk_size if self.params.flush_by == "size" else self.params.packet_count)
+
+        # Check if we should flush
+        should_flush = False
+        if self.params.flush_by == "size":
+            should_flush = self.current_size >= self.params.chunk_size
+        elif self.params.flush_by == "count":
+            should_flush = len(self.buffer) >= self.params.packet_count
+            
+        if should_flush:
+            flush_reason = "size" if self.params.flush_by == "size" else "count"
+            self.logger.info("%s threshold reached (%s), flushing", 
+                           flush_reason.capitalize(),
+                           self.current_size if flush_reason == "size" else len(self.buffer))
+            self.flush()
+        elif self._chunk_expired():
+            self.logger.info("Chunk age limit reached, flushing")
+            self.flush()
+
+    def _chunk_expired(self) -> bool:
+        return (self.params.max_chunk_age is not None and self.first_buffered_at is not None and
+                time.monotonic() - self.first_buffered_at >= self.params.max_chunk_age)
+
+    def should_process(self):
+        # Frames only matter for flushing partial chunks on a quiet input
+        return self.params.max_chunk_age is not None and bool(self.buffer)
+
+    def process(self):
+        with self._buffer_lock:
+            if self._chunk_expired():
+                self.logger.info("Chunk age limit reached, flushing")
+                self.flush()
+
     def flush(self):
         """Emit accumulated data"""
+        with self._buffer_lock:
+            self._flush()
+
+    def _flush(self):
         if not self.buffer:
             self.logger.debug("Flush called with empty buffer")
             return
@@ -167,6 +211,21 @@ class AccumulatorNode(BaseNode):
         
         return content, metadata
 
+    def save_state(self):
+        return {
+            "buffer": [packet.model_dump() for packet in list(self.buffer)],
+            "current_size": self.current_size
+        }
+
+    def restore_state(self, state):
+        self.buffer = [DataPacket.model_validate(p) for p in state.get("buffer", [])]
+        self.current_size = state.get("current_size", 0)
+        self.first_buffered_at = time.monotonic() if self.buffer else None
+        self.logger.debug("Restored %d buffered packets", len(self.buffer))
+
+    def buffered_bytes(self) -> int:
+        return super().buffered_bytes() + estimate_size(self.buffer)
+
     def _get_content_size(self, content) -> int:
         """Calculate size in bytes for quota tracking"""
         if isinstance(content, bytes):
@@ -191,6 +250,7 @@ class AccumulatorNode(BaseNode):
         prev_count = len(self.buffer)
         self.buffer.clear()
         self.current_size = 0
+        self.first_buffered_at = None
         self.logger.debug("Buffer reset (cleared %d items)", prev_count)
 
 NODE_CLASSES = [AccumulatorNode]
\ No newline at end of file
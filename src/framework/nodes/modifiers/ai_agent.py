@@ -16,7 +16,10 @@ class AIAgentNode(BaseNode):
     accepted_data_types = {DataType.DERIVED, DataType.STREAM, DataType.STATIC, DataType.EVENT}
     accepted_formats = {DataFormat.TEXTUAL}
     accepted_categories = set(DataCategory)
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.TEXTUAL}
     IS_GENERATOR = False
+    EXECUTION_CLASS = "io"  # Blocking LLM call
     MIN_INPUTS = 1
     MAX_INPUTS = 1
 
@@ -92,7 +95,9 @@ class AIAgentNode(BaseNode):
             raw = self.FENCE_RE.sub("", raw).strip()
         except Exception as e:
             self.logger.error(f"Groq API error: {e}")
+            self.report_failure(e)
             return {"error": str(e)}
+        self.report_success()
 
         if self.params.output_format == "json":
             try:
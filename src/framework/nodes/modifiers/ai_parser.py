@@ -16,7 +16,11 @@ class AIParserNode(BaseNode):
     accepted_data_types = {DataType.DERIVED, DataType.STREAM, DataType.EVENT}
     accepted_formats = {DataFormat.TEXTUAL, DataFormat.NUMERICAL}
     accepted_categories = set(DataCategory)
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL}
+    output_categories = {DataCategory.GENERIC}
     IS_GENERATOR = False
+    EXECUTION_CLASS = "io"  # Blocking LLM call
     MIN_INPUTS = 1
     MAX_INPUTS = 1  # exactly one input
 
@@ -76,7 +80,9 @@ class AIParserNode(BaseNode):
                 self.logger.debug(f"Raw LLM output:\n{raw}")
             except Exception as e:
                 self.logger.error(f"LLM generation error: {e}")
+                self.report_failure(e)
                 return
+            self.report_success()
 
             # Strip thought blocks and extract code
             code = self.THINK_RE.sub("", raw)
@@ -12,6 +12,7 @@ class Annotator(BaseNode):
     accepted_data_types = {DataType.STREAM, DataType.EVENT, DataType.DERIVED}
     accepted_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL, DataFormat.BINARY, DataFormat}
     accepted_categories = {DataCategory.GENERIC}
+    PASSTHROUGH_OUTPUT = True
     IS_GENERATOR = False  # Passive processor
     MIN_INPUTS = 1
     MAX_INPUTS = 1
@@ -1,5 +1,6 @@
-from typing import List, Optional
+from typing import List
 from pydantic import BaseModel
+from framework.core.windowing import Mean, RingBuffer
 from framework.nodes.base_node import BaseNode
 from framework.data.data_packet import DataPacket
 from framework.data.data_types import DataType, DataFormat, DataCategory, LifecycleState
@@ -11,6 +12,9 @@ class Average(BaseNode):
     accepted_data_types = {DataType.STREAM, DataType.EVENT}
     accepted_formats = {DataFormat.NUMERICAL}
     accepted_categories = {DataCategory.GENERIC}
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.NUMERICAL}
+    output_categories = {DataCategory.GENERIC}
     IS_GENERATOR = False  # passive node
 
     class Params(BaseModel):
@@ -19,7 +23,8 @@ class Average(BaseNode):
     def __init__(self, config):
         super().__init__(config)
         self.params = self.Params(**config.get("params", {}))
-        self.values: List[float] = []
+        self.window = RingBuffer(self.params.window_size)
+        self.mean = Mean()  # Running mean over the window, O(1) per value
 
     def on_data(self, packet: DataPacket, input_channel: str):
         try:
@@ -28,11 +33,11 @@ class Average(BaseNode):
             self.logger.warning("Non-numeric input received: %s", packet.content)
             return
 
-        self.values.append(value)
-        if len(self.values) > self.params.window_size:
-            self.values.pop(0)
-
-        avg = sum(self.values) / len(self.values)
+        evicted = self.window.append(value)
+        if evicted is not None:
+            self.mean.remove(evicted)
+        self.mean.add(value)
+        avg = self.mean.value()
 
         out_packet = self.create_packet(
             content=avg,
@@ -43,5 +48,23 @@ class Average(BaseNode):
         )
         self.data_bus.publish(self.outputs[0], out_packet)
 
+    @property
+    def values(self) -> List[float]:
+        return self.window.values().tolist()
+
+    @values.setter
+    def values(self, values: List[float]):
+        self.window.clear()
+        self.mean.reset()
+        for value in values[-self.params.window_size:]:
+            self.window.append(float(value))
+            self.mean.add(float(value))
+
+    def save_state(self):
+        return {"values": self.values}
+
+    def restore_state(self, state):
+        self.values = state.get("values", [])
+
 
 NODE_CLASSES = [Average]
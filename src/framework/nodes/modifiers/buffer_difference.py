@@ -12,6 +12,9 @@ class BufferDifferenceNode(BaseNode):
     accepted_data_types = {DataType.STREAM, DataType.EVENT, DataType.DERIVED}
     accepted_formats = {DataFormat.NUMERICAL}
     accepted_categories = {DataCategory.GENERIC}
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.NUMERICAL}
+    output_categories = {DataCategory.GENERIC}
     IS_GENERATOR = False
     MIN_INPUTS = 1
     MAX_INPUTS = 1
@@ -56,4 +59,10 @@ class BufferDifferenceNode(BaseNode):
         # Update last value
         self._last_value = current
 
+    def save_state(self):
+        return {"last_value": self._last_value}
+
+    def restore_state(self, state):
+        self._last_value = state.get("last_value")
+
 NODE_CLASSES = [BufferDifferenceNode]
@@ -8,6 +8,7 @@ from framework.nodes.base_node import BaseNode
 from framework.data.data_packet import DataPacket
 from framework.data.data_types import *
 from framework.core.decorators import node_telemetry
+from framework.core.spill_queue import SpillQueue
 
 class DelayNode(BaseNode):
     node_type = "delay"
@@ -15,6 +16,7 @@ class DelayNode(BaseNode):
     accepted_data_types = set(DataType)
     accepted_formats = set(DataFormat)
     accepted_categories = set(DataCategory)
+    PASSTHROUGH_OUTPUT = True
     MIN_INPUTS = 1
     MAX_INPUTS = 1
 
@@ -22,13 +24,17 @@ class DelayNode(BaseNode):
         delay_ms: int = 1000
         max_queue_size: int = 1000
         drop_on_overflow: bool = False
+        spill_to_disk: bool = False  # past max_queue_size, spill to disk instead of blocking/dropping
 
     def __init__(self, config):
         super().__init__(config)
         self.params = self.Params(**config.get('params', {}))
         
         # Thread-safe queue for buffering packets
-        self.queue = queue.Queue(maxsize=self.params.max_queue_size)
+        if self.params.spill_to_disk:
+            self.queue = SpillQueue(max_memory_items=self.params.max_queue_size)
+        else:
+            self.queue = queue.Queue(maxsize=self.params.max_queue_size)
         
         # Worker thread for delayed processing
         self.worker_thread = threading.Thread(target=self._process_queue)
@@ -81,6 +87,21 @@ class DelayNode(BaseNode):
             except Exception as e:
                 self.logger.error(f"Queue processing error: {str(e)}")
 
+    def backlog(self) -> int:
+        return super().backlog() + self.queue.qsize()
+
+    def shed_to_latest(self) -> int:
+        """Drop all but the newest queued packet as well"""
+        queued = []
+        while True:
+            try:
+                queued.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        if queued:
+            self.queue.put_nowait(queued[-1])
+        return super().shed_to_latest() + max(0, len(queued) - 1)
+
     def cleanup(self):
         """Graceful shutdown"""
         self.running = False
@@ -92,6 +113,8 @@ class DelayNode(BaseNode):
                 self.queue.get_nowait()
             except queue.Empty:
                 break
+        if isinstance(self.queue, SpillQueue):
+            self.queue.close()
         self.logger.info("Delay node shutdown complete")
 
 # Register the node
@@ -0,0 +1,159 @@
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Literal, Optional
+from pydantic import BaseModel
+from framework.core.alignment import StreamAligner
+from framework.core.quota import estimate_size
+from framework.nodes.base_node import BaseNode
+from framework.nodes.keyed import extract_key
+from framework.data.data_packet import DataPacket
+from framework.data.data_types import DataType, DataFormat, DataCategory, LifecycleState
+
+
+class JoinNode(BaseNode):
+    """Aligns several input streams by event time or sequence number.
+
+    Every packet of the primary input (the first by default) is joined
+    with the packet of each other input nearest to it within `tolerance`,
+    or a value interpolated between the two around it. Rows are emitted
+    in key order once every input has moved past them, so out-of-order
+    arrival within allowed_lateness doesn't change the result. An input
+    silent for idle_timeout seconds stops holding rows back.
+    """
+    node_type = "join"
+    tags = ["data flow"]
+    accepted_data_types = {DataType.STREAM, DataType.EVENT, DataType.DERIVED}
+    accepted_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL, DataFormat.BINARY}
+    accepted_categories = set(DataCategory)
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.TEXTUAL}
+    IS_GENERATOR = False
+    MIN_INPUTS = 2
+    MAX_INPUTS = None
+
+    class Params(BaseModel):
+        align_by: Literal["timestamp", "sequence_id"] = "timestamp"
+        key_path: Optional[str] = None  # dot path to a numeric join key, overriding align_by
+        tolerance: float = 0.05  # seconds, or sequence steps
+        method: Literal["nearest", "interpolate"] = "nearest"
+        primary: Optional[str] = None  # input node that drives output rows
+        allowed_lateness: float = 0.0
+        idle_timeout: Optional[float] = 2.0  # wall-clock seconds
+        emit_partial: bool = False  # emit rows with None for unmatched inputs instead of dropping them
+        max_buffer: int = 10000  # packets kept per input
+        output_as: Literal["list", "dict"] = "list"
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.params = self.Params(**config.get("params", {}))
+        self.aligner: Optional[StreamAligner] = None
+        self.last_seen: Dict[str, float] = {}
+        self._started = 0.0
+        self._join_lock = threading.Lock()
+
+    def _get_aligner(self) -> StreamAligner:
+        # Inputs are resolved to channels when the pipeline is built
+        if self.aligner is None:
+            primary = self.params.primary
+            if primary is not None and primary not in self.inputs:
+                primary = f"{primary}_out"
+            self.aligner = StreamAligner(
+                self.inputs,
+                primary=primary,
+                tolerance=self.params.tolerance,
+                method=self.params.method,
+                allowed_lateness=self.params.allowed_lateness,
+                max_buffer=self.params.max_buffer,
+                emit_partial=self.params.emit_partial,
+            )
+            self._started = time.monotonic()  # Inputs that never send go idle from here
+        return self.aligner
+
+    def on_data(self, packet: DataPacket, input_channel: str):
+        key = self._key(packet)
+        if key is None:
+            self.logger.warning("Packet from %s has no join key", input_channel)
+            return
+        with self._join_lock:
+            aligner = self._get_aligner()
+            if input_channel not in aligner.buffers:
+                return
+            self.last_seen[input_channel] = time.monotonic()
+            aligner.set_idle(input_channel, False)
+            rows = aligner.add(input_channel, key, packet.content)
+        self._emit(rows)
+
+    def _key(self, packet: DataPacket) -> Optional[float]:
+        if self.params.key_path:
+            raw = extract_key(packet, self.params.key_path)
+        elif self.params.align_by == "sequence_id":
+            raw = packet.sequence_id
+        else:
+            return packet.timestamp.timestamp()
+        try:
+            return float(raw)
+        except (TypeError, ValueError):
+            return None
+
+    def should_process(self):
+        return self.params.idle_timeout is not None and self.aligner is not None
+
+    def process(self):
+        now = time.monotonic()
+        with self._join_lock:
+            aligner = self._get_aligner()
+            for channel in aligner.streams:
+                if now - self.last_seen.get(channel, self._started) > self.params.idle_timeout:
+                    aligner.set_idle(channel, True)
+            rows = aligner.resolve()
+        self._emit(rows)
+
+    def _emit(self, rows):
+        for key, row in rows:
+            if self.params.output_as == "list":
+                content = [row[channel] for channel in self.inputs]
+            else:
+                content = {channel[:-len("_out")] if channel.endswith("_out") else channel: value
+                           for channel, value in row.items()}
+            key_field = {}
+            if self.params.key_path is None and self.params.align_by == "timestamp":
+                key_field = {"timestamp": datetime.fromtimestamp(key)}
+            elif self.params.key_path is None and self.params.align_by == "sequence_id":
+                key_field = {"sequence_id": int(key)}
+            self.publish(self.create_packet(
+                content=content,
+                data_type=DataType.DERIVED,
+                format=DataFormat.TEXTUAL,
+                lifecycle_state=LifecycleState.PROCESSED,
+                **key_field
+            ))
+
+    def buffered_bytes(self) -> int:
+        held = [buffer.values for buffer in self.aligner.buffers.values()] if self.aligner else []
+        return super().buffered_bytes() + estimate_size(held)
+
+    def save_state(self):
+        if self.aligner is None:
+            return None
+        with self._join_lock:
+            return {
+                "buffers": {channel: [list(item) for item in buffer.items()]
+                            for channel, buffer in self.aligner.buffers.items()},
+                "resolved_through": None if math.isinf(self.aligner.resolved_through)
+                                    else self.aligner.resolved_through,
+            }
+
+    def restore_state(self, state):
+        with self._join_lock:
+            aligner = self._get_aligner()
+            for channel, items in state.get("buffers", {}).items():
+                if channel in aligner.buffers:
+                    for key, value in items:
+                        aligner.buffers[channel].add(key, value)
+            if state.get("resolved_through") is not None:
+                aligner.resolved_through = state["resolved_through"]
+
+
+NODE_CLASSES = [JoinNode]
@@ -11,6 +11,8 @@ class MathAddNode(BaseNode):
     accepted_data_types = set(DataType)
     accepted_formats = {DataFormat.NUMERICAL}
     accepted_categories = set(DataCategory)
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.NUMERICAL}
     
     # Input configuration
     MIN_INPUTS = 2  # Require exactly 2 inputs
@@ -22,12 +24,11 @@ class MathAddNode(BaseNode):
     @node_telemetry("process")
     def process(self):
         """Process packets from both inputs"""
-        # Get the first packet from each input
-        packet1 = self.input_buffers[self.inputs[0]][0] if self.input_buffers[self.inputs[0]] else None
-        packet2 = self.input_buffers[self.inputs[1]][0] if self.input_buffers[self.inputs[1]] else None
-        
-        if not packet1 or not packet2:
+        # Take the first packet from each input once both have one
+        if not self.input_buffers[self.inputs[0]] or not self.input_buffers[self.inputs[1]]:
             return
+        packet1 = self.input_buffers[self.inputs[0]].pop(0)
+        packet2 = self.input_buffers[self.inputs[1]].pop(0)
             
         try:
             result = packet1.content + packet2.content
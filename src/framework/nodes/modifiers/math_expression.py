@@ -0,0 +1,134 @@
+import threading
+from typing import Any, Dict, List, Literal, Optional, Tuple
+import numpy as np
+from pydantic import BaseModel
+from framework.core.decorators import node_telemetry
+from framework.core.expressions import Expression, to_python
+from framework.nodes.base_node import BaseNode
+from framework.nodes.keyed import extract_key
+from framework.data.data_packet import DataPacket
+from framework.data.data_types import DataType, DataFormat, DataCategory, LifecycleState
+
+
+class MathExpressionNode(BaseNode):
+    """Evaluates a formula over any number of inputs in one step.
+
+    Variables name an input node (`gen`), a path into its content
+    (`imu.accel.x`), an alias from `variables`, or `x` for the content of
+    a single input. In zip mode one packet is taken from every input per
+    result; packets queued on all inputs are evaluated together as NumPy
+    arrays. In latest mode the newest value of each input is combined
+    whenever any of them changes. Array contents are evaluated
+    element-wise.
+    """
+    node_type = "math_expression"
+    tags = ["math"]
+    accepted_data_types = set(DataType)
+    accepted_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL}
+    accepted_categories = set(DataCategory)
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.NUMERICAL}
+    MAX_INPUTS = None
+
+    class Params(BaseModel):
+        expression: str = "x"
+        variables: Dict[str, str] = {}  # alias -> input path, e.g. {"ax": "imu.accel.x"}
+        sync: Literal["zip", "latest"] = "zip"
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.expression = Expression(self.params.expression)
+        self.latest: Dict[str, DataPacket] = {}
+        self._bindings: Optional[List[Tuple[str, str, str]]] = None
+        self._eval_lock = threading.Lock()
+        # Fail on unknown variables at construction; channels are bound after build
+        self._bind()
+        self._bindings = None
+
+    def _bind(self) -> List[Tuple[str, str, str]]:
+        """(variable, input channel, path inside content) for every variable"""
+        if self._bindings is None:
+            channels = {ch[:-len("_out")] if ch.endswith("_out") else ch: ch for ch in self.inputs}
+            bindings = []
+            for variable in self.expression.variables:
+                path = self.params.variables.get(variable, variable)
+                root, _, rest = path.partition(".")
+                if root in channels:
+                    bindings.append((variable, channels[root], rest))
+                elif root == "x" and len(self.inputs) == 1:
+                    bindings.append((variable, self.inputs[0], rest))
+                else:
+                    raise ValueError(f"'{variable}' in {self.name} does not name an input")
+            self._bindings = bindings
+        return self._bindings
+
+    @node_telemetry("process")
+    def process(self):
+        with self._eval_lock:
+            if self.params.sync == "latest":
+                rows = self._take_latest()
+            else:
+                rows = self._take_zipped()
+            if not rows:
+                return
+            results = self._evaluate(rows)
+        for template, result in results:
+            self.publish(self.modify_packet(
+                template,
+                to_python(result),
+                format=DataFormat.NUMERICAL,
+                lifecycle_state=LifecycleState.PROCESSED
+            ))
+
+    def _take_zipped(self) -> List[Dict[str, DataPacket]]:
+        count = min(len(self.input_buffers[ch]) for ch in self.inputs)
+        return [{ch: self.input_buffers[ch].pop(0) for ch in self.inputs} for _ in range(count)]
+
+    def _take_latest(self) -> List[Dict[str, DataPacket]]:
+        updated = False
+        for channel in self.inputs:
+            buffer = self.input_buffers[channel]
+            while buffer:
+                self.latest[channel] = buffer.pop(0)
+                updated = True
+        if not updated or len(self.latest) < len(self.inputs):
+            return []
+        return [dict(self.latest)]
+
+    def _evaluate(self, rows: List[Dict[str, DataPacket]]) -> List[Tuple[DataPacket, Any]]:
+        bindings = self._bind()
+        values = [{var: extract_key(row[ch].content, path) if path else row[ch].content
+                   for var, ch, path in bindings} for row in rows]
+        templates = [row[self.inputs[0]] for row in rows]
+
+        if len(rows) > 1 and self.expression.elementwise and all(
+                isinstance(v, (int, float)) for row in values for v in row.values()):
+            # One vectorized evaluation for the whole batch
+            try:
+                batch = {var: np.array([row[var] for row in values], dtype=float) for var in values[0]}
+                return list(zip(templates, np.broadcast_to(self.expression(batch), (len(rows),))))
+            except (ValueError, TypeError, ArithmeticError) as e:
+                self.logger.warning(f"Expression failed: {str(e)}")
+                return []
+
+        results = []
+        for template, row in zip(templates, values):
+            try:
+                arrays = {var: np.asarray(v, dtype=float) if isinstance(v, list) else v
+                          for var, v in row.items()}
+                results.append((template, self.expression(arrays)))
+            except (ValueError, TypeError, ArithmeticError) as e:
+                self.logger.warning(f"Expression failed: {str(e)}")
+        return results
+
+    def save_state(self):
+        if not self.latest:
+            return None
+        return {"latest": {ch: packet.model_dump(mode='json') for ch, packet in self.latest.items()}}
+
+    def restore_state(self, state):
+        self.latest = {ch: DataPacket.model_validate(packet)
+                       for ch, packet in state.get("latest", {}).items() if ch in self.inputs}
+
+
+NODE_CLASSES = [MathExpressionNode]
@@ -10,6 +10,8 @@ class MathMultiplyNode(BaseNode):
     accepted_data_types = {DataType.STREAM, DataType.DERIVED, DataType.STATIC}
     accepted_formats = {DataFormat.NUMERICAL}
     accepted_categories = set(DataCategory)
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.NUMERICAL}
     
     # Input configuration (defaults to single input)
     # MIN_INPUTS = 1 (default)
@@ -23,7 +25,7 @@ class MathMultiplyNode(BaseNode):
         if not self.input_buffers[self.inputs[0]]:
             return
             
-        packet = self.input_buffers[self.inputs[0]][0]
+        packet = self.input_buffers[self.inputs[0]].pop(0)
         
         try:
             result = packet.content * self.params.multiplier
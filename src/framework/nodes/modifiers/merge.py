@@ -12,6 +12,9 @@ class Merge(BaseNode):
     accepted_data_types = {DataType.STREAM, DataType.EVENT, DataType.DERIVED}
     accepted_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL, DataFormat.BINARY}
     accepted_categories = {DataCategory.GENERIC}
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL, DataFormat.BINARY}
+    output_categories = {DataCategory.GENERIC}
     IS_GENERATOR = False
 
     class Params(BaseModel):
@@ -61,6 +64,20 @@ class Merge(BaseNode):
             self.buffers.clear()
             self.timestamps.clear()
 
+    def save_state(self):
+        return {"buffers": {ch: pkt.model_dump() for ch, pkt in list(self.buffers.items())}}
+
+    def restore_state(self, state):
+        self.buffers = {
+            ch: DataPacket.model_validate(pkt)
+            for ch, pkt in state.get("buffers", {}).items()
+            if ch in self.inputs
+        }
+        # Arrival times are wall clock, so saved ones would expire on restart;
+        # restored packets get a fresh timeout instead
+        now = time.time()
+        self.timestamps = {ch: now for ch in self.buffers}
+
     def _infer_format(self, content):
         if isinstance(content, bytes):
             return DataFormat.BINARY
@@ -13,6 +13,7 @@ class PassOnChangeNode(BaseNode):
     accepted_data_types = {DataType.STREAM, DataType.EVENT, DataType.DERIVED}
     accepted_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL}
     accepted_categories = set(DataCategory)
+    PASSTHROUGH_OUTPUT = True
     IS_GENERATOR = False
     IS_ASYNC_CAPABLE = False
     MIN_INPUTS = 1
@@ -55,4 +56,10 @@ class PassOnChangeNode(BaseNode):
         self.data_bus.publish(self.outputs[0], packet)
         self.last_processed = time.time()
 
+    def save_state(self):
+        return {"last_value": self._last_value}
+
+    def restore_state(self, state):
+        self._last_value = state.get("last_value")
+
 NODE_CLASSES = [PassOnChangeNode]
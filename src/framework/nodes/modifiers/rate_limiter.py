@@ -11,6 +11,7 @@ class RateLimiter(BaseNode):
     accepted_data_types = {DataType.STREAM, DataType.EVENT}
     accepted_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL, DataFormat.BINARY}
     accepted_categories = {DataCategory.GENERIC}
+    PASSTHROUGH_OUTPUT = True
     IS_GENERATOR = False
 
     class Params(BaseModel):
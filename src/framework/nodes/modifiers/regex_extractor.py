@@ -13,6 +13,9 @@ class RegexExtractor(BaseNode):
     accepted_data_types = {DataType.STREAM, DataType.EVENT}
     accepted_formats = {DataFormat.TEXTUAL}
     accepted_categories = {DataCategory.GENERIC}
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.TEXTUAL}
+    output_categories = {DataCategory.GENERIC}
     IS_GENERATOR = False  # passive processor
 
     class Params(BaseModel):
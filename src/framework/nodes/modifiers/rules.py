@@ -0,0 +1,88 @@
+import json
+import threading
+from typing import List, Literal, Optional
+from pydantic import BaseModel
+from framework.core.rules import RuleSet
+from framework.nodes.base_node import BaseNode
+from framework.nodes.keyed import extract_key
+from framework.data.data_packet import DataPacket
+from framework.data.data_types import DataType, DataFormat, DataCategory, LifecycleState
+
+
+class Rule(BaseModel):
+    id: str
+    path: str = ""  # dot path into the content; empty for numeric content
+    op: Literal["gt", "ge", "lt", "le", "eq", "ne"] = "gt"
+    threshold: float
+
+
+class RulesNode(BaseNode):
+    """Checks every packet against a whole set of threshold rules at once.
+
+    Replaces a bank of threshold_gate nodes: rules are compiled into
+    sorted threshold lists per content path, so a packet is read and
+    matched once however many rules there are. Emits the ids of matched
+    rules; with edge_triggered only rules that just started matching.
+    """
+    node_type = "rules"
+    tags = ["data flow"]
+    accepted_data_types = {DataType.STREAM, DataType.EVENT, DataType.DERIVED}
+    accepted_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL}
+    accepted_categories = set(DataCategory)
+    output_data_types = {DataType.EVENT}
+    output_formats = {DataFormat.TEXTUAL}
+    IS_GENERATOR = False
+
+    class Params(BaseModel):
+        rules: List[Rule] = []
+        rules_file: Optional[str] = None  # JSON list of rules, added to `rules`
+        edge_triggered: bool = False  # emit rules only when they start matching
+        emit_empty: bool = False  # also emit when nothing matched
+
+    def __init__(self, config):
+        super().__init__(config)
+        rules = [rule.model_dump() for rule in self.params.rules]
+        if self.params.rules_file:
+            with open(self.params.rules_file) as f:
+                rules.extend(Rule(**rule).model_dump() for rule in json.load(f))
+        self.rule_set = RuleSet(rules)
+        self.active = set()  # Rules matched by the previous packet, for edge triggering
+        self._rules_lock = threading.Lock()
+        self.logger.info(f"Compiled {self.rule_set.size} rules over {len(self.rule_set.paths)} paths")
+
+    def on_data(self, packet: DataPacket, input_channel: str):
+        values = {}
+        for path in self.rule_set.paths:
+            raw = extract_key(packet.content, path) if path else packet.content
+            try:
+                values[path] = float(raw) if raw is not None else None
+            except (TypeError, ValueError):
+                values[path] = None
+
+        matched = self.rule_set.match(values)
+        if self.params.edge_triggered:
+            with self._rules_lock:
+                current = set(matched)
+                matched = [rule_id for rule_id in matched if rule_id not in self.active]
+                self.active = current
+        if not matched and not self.params.emit_empty:
+            return
+
+        self.publish(self.modify_packet(
+            packet,
+            matched,
+            data_type=DataType.EVENT,
+            format=DataFormat.TEXTUAL,
+            lifecycle_state=LifecycleState.PROCESSED
+        ))
+
+    def save_state(self):
+        if not self.params.edge_triggered:
+            return None
+        return {"active": sorted(self.active)}
+
+    def restore_state(self, state):
+        self.active = set(state.get("active", []))
+
+
+NODE_CLASSES = [RulesNode]
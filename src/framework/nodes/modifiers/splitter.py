@@ -11,6 +11,9 @@ class Splitter(BaseNode):
     accepted_data_types = {DataType.STREAM, DataType.EVENT}
     accepted_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL, DataFormat.BINARY}
     accepted_categories = {DataCategory.GENERIC}
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL, DataFormat.BINARY}
+    output_categories = {DataCategory.GENERIC}
     IS_GENERATOR = False
 
     class Params(BaseModel):
@@ -12,6 +12,7 @@ class ThresholdGate(BaseNode):
     accepted_data_types = {DataType.STREAM, DataType.EVENT}
     accepted_formats = {DataFormat.NUMERICAL}
     accepted_categories = {DataCategory.GENERIC}
+    PASSTHROUGH_OUTPUT = True
 
     class Params(BaseModel):
         threshold: float = 0.0
@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import List, Literal, Optional
+from pydantic import BaseModel
+from framework.core.windowing import create_window
+from framework.nodes.base_node import BaseNode
+from framework.nodes.keyed import extract_key
+from framework.data.data_packet import DataPacket
+from framework.data.data_types import DataType, DataFormat, DataCategory, LifecycleState
+
+
+class WindowNode(BaseNode):
+    """Aggregates a numeric stream over tumbling, sliding or session windows.
+
+    Count windows emit every `slide` values; time windows use event time
+    (the packet timestamp, or the epoch seconds at `time_path`) and emit
+    once the watermark passes their end. With one aggregation the output
+    is that number, otherwise a dict with the window bounds and count.
+    """
+    node_type = "window"
+    tags = ["data flow"]
+    accepted_data_types = {DataType.STREAM, DataType.EVENT, DataType.DERIVED}
+    accepted_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL}
+    accepted_categories = set(DataCategory)
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL}
+    IS_GENERATOR = False
+
+    class Params(BaseModel):
+        mode: Literal["tumbling", "sliding", "session"] = "tumbling"
+        by: Literal["count", "time"] = "count"
+        size: float = 10  # values, or seconds for time windows
+        slide: Optional[float] = None  # sliding windows only
+        gap: float = 5.0  # seconds of silence that end a session
+        aggregations: List[str] = ["mean"]  # count, sum, mean, min, max, variance, std
+        allowed_lateness: float = 0.0  # seconds the watermark trails the latest event
+        value_path: Optional[str] = None  # dot path to the value inside dict content
+        time_path: Optional[str] = None  # dot path to an epoch-seconds event time
+        idle_flush: bool = True  # on quiet streams, let event time run on with the wall clock
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.params = self.Params(**config.get("params", {}))
+        self.window = create_window(
+            mode=self.params.mode,
+            by=self.params.by,
+            size=self.params.size,
+            slide=self.params.slide,
+            gap=self.params.gap,
+            aggregations=self.params.aggregations,
+            allowed_lateness=self.params.allowed_lateness,
+        )
+        self._window_lock = threading.Lock()
+        # Latest event time and the monotonic time it arrived, for idle flushing
+        self._latest_event: Optional[float] = None
+        self._latest_seen = 0.0
+
+    def on_data(self, packet: DataPacket, input_channel: str):
+        content = packet.content
+        if self.params.value_path:
+            content = extract_key(content, self.params.value_path)
+        try:
+            value = float(content)
+        except (ValueError, TypeError):
+            self.logger.warning("Non-numeric input received: %s", content)
+            return
+
+        event_time = packet.timestamp.timestamp()
+        if self.params.time_path:
+            try:
+                event_time = float(extract_key(packet, self.params.time_path))
+            except (ValueError, TypeError):
+                self.logger.warning("Packet without event time at %s", self.params.time_path)
+                return
+
+        with self._window_lock:
+            if self._latest_event is None or event_time >= self._latest_event:
+                self._latest_event = event_time
+                self._latest_seen = time.monotonic()
+            results = self.window.add(value, event_time)
+        self._emit(results)
+
+    def should_process(self):
+        return self.params.by == "time" or self.params.mode == "session"
+
+    def process(self):
+        if not self.params.idle_flush or self._latest_event is None:
+            return
+        with self._window_lock:
+            # Event time moves on from the latest event by the wall-clock time since it
+            # arrived, so replayed or device timestamps aren't compared with time.time()
+            idle = time.monotonic() - self._latest_seen
+            results = self.window.advance(self._latest_event + idle)
+        self._emit(results)
+
+    def late_count(self) -> int:
+        """Events dropped for arriving after their window was emitted"""
+        return getattr(self.window, "late", 0)
+
+    def _emit(self, results):
+        single = len(self.params.aggregations) == 1
+        for result in results:
+            content = result[self.params.aggregations[0]] if single else result
+            self.publish(self.create_packet(
+                content=content,
+                data_type=DataType.DERIVED,
+                format=DataFormat.NUMERICAL if single else DataFormat.TEXTUAL,
+                category=DataCategory.GENERIC,
+                lifecycle_state=LifecycleState.PROCESSED
+            ))
+
+
+NODE_CLASSES = [WindowNode]
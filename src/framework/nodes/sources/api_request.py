@@ -12,8 +12,12 @@ class ApiRequestNode(BaseNode):
     accepted_data_types = {DataType.EVENT}    # Only trigger on EVENT packets
     accepted_formats = set(DataFormat)                   # Accept any format
     accepted_categories = set(DataCategory)    # Accept all categories
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.TEXTUAL}
+    output_categories = {DataCategory.GENERIC}
     IS_GENERATOR = False
     IS_ASYNC_CAPABLE = False
+    EXECUTION_CLASS = "io"                     # Blocking HTTP call
     MIN_INPUTS = 1
     MAX_INPUTS = 1
 
@@ -50,7 +54,9 @@ class ApiRequestNode(BaseNode):
             resp.raise_for_status()
         except Exception as e:
             self.logger.error(f"API request failed: {e}")
+            self.report_failure(e)
             return
+        self.report_success()
 
         # 3. Parse response
         if self.params.response_format == "json":
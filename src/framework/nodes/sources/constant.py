@@ -12,6 +12,9 @@ class ConstantNode(BaseNode):
     accepted_data_types = set()
     accepted_formats = set()
     accepted_categories = set()
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL}
+    output_categories = {DataCategory.GENERIC}
     IS_GENERATOR = True
     IS_ASYNC_CAPABLE = False
     MIN_INPUTS = 0
@@ -11,6 +11,9 @@ class NumberGenerator(BaseNode):
     IS_GENERATOR = True
     MIN_INPUTS = 0
     IS_ASYNC_CAPABLE = False
+    output_data_types = {DataType.STREAM}
+    output_formats = {DataFormat.NUMERICAL}
+    output_categories = {DataCategory.GENERIC}
 
     class Params(BaseModel):
         start_value: float = 0.0
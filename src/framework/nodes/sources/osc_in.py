@@ -16,10 +16,14 @@ class OSCInNode(BaseNode):
     MIN_INPUTS = 0
     MAX_INPUTS = 0
     IS_GENERATOR = True
+    CAN_PAUSE = False  # Messages keep arriving; ingress_policy applies without credit
 
     accepted_data_types = {DataType.STREAM, DataType.DERIVED, DataType.STATIC}
     accepted_formats = {DataFormat.BINARY}
     accepted_categories = set(DataCategory)
+    output_data_types = {DataType.STREAM}
+    output_formats = {DataFormat.TEXTUAL}
+    output_categories = {DataCategory.NETWORK}
 
     class Params(BaseModel):
         listen_ip: str = "0.0.0.0"
@@ -90,7 +94,8 @@ class OSCInNode(BaseNode):
                         content=content,
                         metadata={}
                     )
-                    self.data_bus.publish(self.outputs[0], out_pkt)
+                    if self.admit(out_pkt):
+                        self.data_bus.publish(self.outputs[0], out_pkt)
 
             except socket.timeout:
                 continue
@@ -13,6 +13,9 @@ class RandomNumberNode(BaseNode):
     accepted_data_types = {DataType.EVENT}
     accepted_formats = set(DataFormat)
     accepted_categories = set(DataCategory)
+    output_data_types = {DataType.DERIVED}
+    output_formats = {DataFormat.NUMERICAL}
+    output_categories = {DataCategory.GENERIC}
     IS_GENERATOR = False
     IS_ASYNC_CAPABLE = False
     MIN_INPUTS = 1
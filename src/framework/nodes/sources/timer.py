@@ -11,6 +11,9 @@ class TimerNode(BaseNode):
     accepted_data_types = set()          # No inputs
     accepted_formats = set()
     accepted_categories = set()
+    output_data_types = {DataType.EVENT}
+    output_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL}
+    output_categories = {DataCategory.GENERIC}
     IS_GENERATOR = True
     MIN_INPUTS = 0
 
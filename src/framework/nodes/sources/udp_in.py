@@ -17,9 +17,13 @@ class UDPIn(BaseNode):
     MIN_INPUTS = 0
     MAX_INPUTS = 0
     IS_GENERATOR = True
+    CAN_PAUSE = False  # Datagrams keep arriving; ingress_policy applies without credit
     accepted_data_types = {DataType.STREAM, DataType.DERIVED, DataType.STATIC}
     accepted_formats = {DataFormat.NUMERICAL, DataFormat.TEXTUAL, DataFormat.BINARY}
     accepted_categories = set(DataCategory)
+    output_data_types = {DataType.STREAM}
+    output_formats = {DataFormat.TEXTUAL}
+    output_categories = {DataCategory.NETWORK}
 
     class Params(BaseModel):
         listen_ip: str = "0.0.0.0"
@@ -95,7 +99,8 @@ class UDPIn(BaseNode):
                     metadata={"remote_addr": addr}
                 )
                 
-                self.data_bus.publish(self.outputs[0], packet)
+                if self.admit(packet):
+                    self.data_bus.publish(self.outputs[0], packet)
                 
             except socket.timeout:
                 continue
@@ -142,13 +147,8 @@ class UDPIn(BaseNode):
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
             if self._thread.is_alive():
+                # Daemon thread exits on its next socket timeout
                 self.logger.warning("Thread did not exit cleanly")
-                # Try to force terminate if still alive
-                try:
-                    import ctypes
-                    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_long(self._thread.ident), ctypes.py_object(SystemExit))
-                except:
-                    pass
         
         self.logger.info("UDP listener stopped")
 
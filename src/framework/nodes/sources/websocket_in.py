@@ -1,8 +1,8 @@
 import asyncio
-import threading
 import logging
 import websockets
 from pydantic import BaseModel
+from framework.core.event_loop import shared_loop
 from framework.nodes.base_node import BaseNode
 from framework.data.data_packet import DataPacket
 from framework.data.data_types import DataType, DataFormat, DataCategory
@@ -11,10 +11,14 @@ class WebSocketIn(BaseNode):
     node_type = "websocket_in"
     tags = ["network"]
     IS_GENERATOR = True  # Actively receives data
+    CAN_PAUSE = False  # The server keeps sending; ingress_policy applies without credit
 
     accepted_data_types = {DataType.EVENT}
     accepted_formats = {DataFormat.TEXTUAL}
     accepted_categories = {DataCategory.GENERIC}
+    output_data_types = {DataType.EVENT}
+    output_formats = {DataFormat.TEXTUAL}
+    output_categories = {DataCategory.GENERIC}
 
     class Params(BaseModel):
         url: str  # WebSocket server URL
@@ -25,20 +29,17 @@ class WebSocketIn(BaseNode):
         super().__init__(config)
         self.params = self.Params(**config.get("params", {}))
         self.logger = logging.getLogger("WebSocketIn")
-        self._loop = None
-        self._thread = None
+        self._task = None
 
-        if self.params.auto_connect:
-            self._start_loop()
+    def start(self):
+        """Connect on the shared event loop once the pipeline runs"""
+        if self.params.auto_connect and self._task is None:
+            self._task = shared_loop.submit(self._connect_loop())
 
-    def _start_loop(self):
-        self._thread = threading.Thread(target=self._run_loop, daemon=True)
-        self._thread.start()
-
-    def _run_loop(self):
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
-        self._loop.run_until_complete(self._connect_loop())
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
 
     async def _connect_loop(self):
         while True:
@@ -53,7 +54,8 @@ class WebSocketIn(BaseNode):
                             format=DataFormat.TEXTUAL,
                             category=DataCategory.GENERIC
                         )
-                        self.publish(packet)
+                        if self.admit(packet):
+                            self.publish(packet)
             except Exception as e:
                 self.logger.error(f"WebSocket error: {e}")
                 await asyncio.sleep(self.params.reconnect_delay)
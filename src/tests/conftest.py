@@ -0,0 +1,21 @@
+import os
+import tempfile
+import pytest
+
+# Node discovery runs when framework.nodes is imported, before any fixture,
+# so the manifest is pointed away from ~/.cache here
+os.environ["STREAMLET_NODE_MANIFEST"] = os.path.join(
+    tempfile.mkdtemp(prefix="streamlet-tests-"), "node_manifest.json"
+)
+
+from framework.data import DataPacket, DataType, DataFormat, DataCategory, DataSource  # noqa: E402
+
+
+@pytest.fixture
+def make_packet():
+    """Build test packets; metadata defaults to a generic external text stream"""
+    def make(content, data_type=DataType.STREAM, format=DataFormat.TEXTUAL,
+             source=DataSource.EXTERNAL):
+        return DataPacket(data_type=data_type, format=format, category=DataCategory.GENERIC,
+                          source=source, content=content)
+    return make
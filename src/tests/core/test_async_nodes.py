@@ -0,0 +1,77 @@
+import asyncio
+import time
+from framework.core import DataBus, Pipeline
+from framework.nodes import BaseNode
+
+
+class AsyncSinkNode(BaseNode):
+    node_type = "async_sink_test"
+    MIN_INPUTS = 0
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.received = []
+
+    async def on_data(self, packet, input_channel):
+        await asyncio.sleep(0.05)
+        self.received.append(packet)
+
+
+class AsyncTickNode(BaseNode):
+    node_type = "async_tick_test"
+    IS_GENERATOR = True
+    MIN_INPUTS = 0
+    MAX_INPUTS = 0
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.ticks = 0
+
+    async def process(self):
+        await asyncio.sleep(0)
+        self.ticks += 1
+
+
+def test_async_nodes_are_flagged():
+    assert AsyncSinkNode.IS_ASYNC_CAPABLE and AsyncTickNode.IS_ASYNC_CAPABLE
+    assert not BaseNode.IS_ASYNC_CAPABLE
+
+
+def test_async_on_data_runs_concurrently_on_shared_loop():
+    bus = DataBus(max_workers=2)
+    bus.set_enabled(True)
+    node = AsyncSinkNode({"name": "sink"})
+    bus.subscribe(node, "ch")
+
+    started = time.monotonic()
+    for i in range(50):
+        bus.publish("ch", i)
+    assert bus.drain(timeout=2.0)
+    assert time.monotonic() - started < 1.0  # Not 50 x 50ms
+    assert sorted(node.received) == list(range(50))
+    bus.shutdown()
+
+
+def test_in_flight_limit_sheds_excess():
+    bus = DataBus(max_workers=2)
+    bus.set_enabled(True)
+    node = AsyncSinkNode({"name": "sink", "max_in_flight": 5})
+    bus.subscribe(node, "ch")
+    for i in range(20):
+        bus.publish("ch", i)
+    assert bus.drain(timeout=2.0)
+    assert len(node.received) + node.shed_count == 20
+    assert node.shed_count > 0
+    bus.shutdown()
+
+
+def test_async_process_runs_each_frame():
+    pipeline = Pipeline({
+        "settings": {"fps_limit": 100},
+        "nodes": [{"type": "async_tick_test", "name": "tick"}],
+    }, "async-frames")
+    pipeline.build()
+    pipeline.run()
+    time.sleep(0.2)
+    pipeline.shutdown()
+    assert pipeline.node_map["tick"].ticks > 5
@@ -0,0 +1,60 @@
+import time
+import pytest
+from framework.core import Pipeline
+from framework.nodes import BaseNode
+
+
+class SlowSourceNode(BaseNode):
+    node_type = "slow_source_test"
+    IS_GENERATOR = True
+    MIN_INPUTS = 0
+    MAX_INPUTS = 0
+
+    def __init__(self, config):
+        time.sleep(0.2)  # e.g. loading a model
+        super().__init__(config)
+
+    def process(self):
+        pass
+
+
+class BrokenNode(BaseNode):
+    node_type = "broken_test"
+    MIN_INPUTS = 0
+    MAX_INPUTS = 0
+    stopped = []
+
+    def __init__(self, config):
+        super().__init__(config)
+        if config.get('params', {}).get('fail'):
+            raise RuntimeError("cannot connect")
+
+    def stop(self):
+        BrokenNode.stopped.append(self.name)
+
+    def process(self):
+        pass
+
+
+def test_constructors_run_concurrently():
+    pipeline = Pipeline({
+        "nodes": [{"type": "slow_source_test", "name": f"s{i}"} for i in range(4)],
+    }, "build-parallel")
+    started = time.monotonic()
+    pipeline.build()
+    assert time.monotonic() - started < 0.6
+    assert [n.name for n in pipeline.nodes] == ["s0", "s1", "s2", "s3"]
+
+
+def test_construction_errors_are_aggregated():
+    pipeline = Pipeline({
+        "nodes": [
+            {"type": "broken_test", "name": "ok"},
+            {"type": "broken_test", "name": "bad1", "params": {"fail": True}},
+            {"type": "broken_test", "name": "bad2", "params": {"fail": True}},
+        ],
+    }, "build-errors")
+    with pytest.raises(ValueError) as exc:
+        pipeline.build()
+    assert "bad1" in str(exc.value) and "bad2" in str(exc.value)
+    assert BrokenNode.stopped == ["ok"]
@@ -0,0 +1,98 @@
+import threading
+import time
+from framework.core import DataBus
+from framework.core.bulkhead import Bulkhead, CircuitBreaker
+
+
+class Subscriber:
+    def __init__(self, bulkhead=None, breaker=None, delay=0.0, fail=False):
+        self.bulkhead = bulkhead
+        self.breaker = breaker
+        self.delay = delay
+        self.fail = fail
+        self.received = []
+        self.shed = []
+
+    def on_data(self, data, channel):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("dependency down")
+        self.received.append(data)
+
+    def record_shed(self, reason):
+        self.shed.append(reason)
+
+
+def test_circuit_breaker_opens_and_recovers():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()  # Single trial call
+    assert breaker.state == CircuitBreaker.HALF_OPEN and not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+
+
+def test_bulkhead_rejects_when_full():
+    bulkhead = Bulkhead("test", max_workers=1, max_queue=1)
+    gate = threading.Event()
+    assert bulkhead.submit(gate.wait) is not None
+    assert bulkhead.submit(gate.wait) is not None
+    assert bulkhead.submit(gate.wait) is None
+    assert bulkhead.rejected == 1
+    gate.set()
+    bulkhead.shutdown()
+
+
+def test_slow_io_node_does_not_block_inline_node():
+    bus = DataBus(max_workers=1)
+    bus.set_enabled(True)
+    io = Bulkhead("io", max_workers=1, max_queue=0)
+    slow = Subscriber(bulkhead=io, delay=0.3)
+    fast = Subscriber()
+    bus.subscribe(slow, "ch")
+    bus.subscribe(fast, "ch")
+
+    for i in range(3):
+        bus.publish("ch", i)
+    assert bus.drain(timeout=0.2) is False  # Slow delivery still running
+    assert fast.received == [0, 1, 2]
+    assert slow.shed == ["bulkhead_full", "bulkhead_full"]
+    assert bus.drain(timeout=1.0)
+    assert slow.received == [0]
+    bus.shutdown()
+    io.shutdown()
+
+
+def test_open_circuit_sheds_packets():
+    bus = DataBus(max_workers=1)
+    bus.set_enabled(True)
+    failing = Subscriber(breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60), fail=True)
+    bus.subscribe(failing, "ch")
+    for i in range(5):
+        bus.publish("ch", i)
+    assert bus.drain(timeout=1.0)
+    assert failing.breaker.state == CircuitBreaker.OPEN
+    assert failing.shed == ["circuit_open"] * 3
+    bus.shutdown()
+
+
+def test_breakers_only_for_offloaded_or_opted_in_nodes():
+    from framework.core import Pipeline
+    import framework.nodes  # noqa: F401
+    pipeline = Pipeline({"nodes": [
+        {"type": "number_generator", "name": "inline"},
+        {"type": "number_generator", "name": "io", "execution": "io"},
+        {"type": "number_generator", "name": "opted", "circuit_breaker": {"failure_threshold": 2}},
+    ]}, "breakers")
+    pipeline.build()
+    nodes = pipeline.node_map
+    assert nodes["inline"].breaker is None
+    nodes["inline"].report_failure()  # No breaker to record into
+    assert nodes["io"].breaker is not None
+    assert nodes["opted"].breaker.failure_threshold == 2
+    pipeline.shutdown()
@@ -0,0 +1,92 @@
+import threading
+import time
+import pytest
+from framework.core import Pipeline, FairExecutor, Scheduler
+import framework.nodes  # noqa: F401
+
+
+def test_weighted_round_robin_order():
+    pool = FairExecutor(max_workers=1)
+    gate = threading.Event()
+    order = []
+    heavy = pool.tenant("heavy", weight=2)
+    light = pool.tenant("light", weight=1)
+
+    # Block the only worker so everything below queues up
+    blocker = light.submit(gate.wait)
+    futures = [heavy.submit(order.append, f"h{i}") for i in range(4)]
+    futures += [light.submit(order.append, f"l{i}") for i in range(2)]
+    gate.set()
+    for future in futures + [blocker]:
+        future.result(timeout=1.0)
+
+    assert order == ["h0", "h1", "l0", "h2", "h3", "l1"]
+    pool.shutdown()
+
+
+def test_remove_tenant_cancels_queued_work_and_closed_view_rejects():
+    pool = FairExecutor(max_workers=1)
+    gate = threading.Event()
+    view = pool.tenant("a")
+    blocker = view.submit(gate.wait)
+    while not blocker.running():
+        time.sleep(0.001)
+    queued = [view.submit(time.sleep, 0) for _ in range(3)]
+    assert pool.remove_tenant("a") == 3
+    assert all(f.cancelled() for f in queued)
+    gate.set()
+
+    view.shutdown()
+    with pytest.raises(RuntimeError):
+        view.submit(time.sleep, 0)
+    pool.shutdown()
+
+
+def test_many_pipelines_share_bounded_threads():
+    pool = FairExecutor(max_workers=4)
+    scheduler = Scheduler()
+    config = {
+        "settings": {"fps_limit": 100},
+        "nodes": [
+            {"type": "number_generator", "name": "gen"},
+            {"type": "console_logger", "name": "log", "inputs": ["gen"]},
+        ],
+    }
+    baseline = threading.active_count()
+    pipelines = []
+    for i in range(20):
+        pipeline = Pipeline(config, f"p{i}", executor=pool.tenant(f"p{i}"),
+                            scheduler=scheduler)
+        pipeline.build()
+        pipeline.run()
+        pipelines.append(pipeline)
+
+    time.sleep(0.2)
+    # Worker pool plus the single scheduler thread
+    assert threading.active_count() - baseline <= 5
+    assert all(p._thread is None for p in pipelines)
+
+    for pipeline in pipelines:
+        pipeline.shutdown(timeout=1.0)
+        assert not scheduler.is_scheduled(pipeline)
+    scheduler.stop()
+    pool.shutdown()
+
+
+def test_pool_grows_with_backlog_and_retires_idle_workers():
+    pool = FairExecutor(max_workers=4, min_workers=1, idle_timeout=0.05)
+    gate = threading.Event()
+    futures = [pool.submit("t", gate.wait) for _ in range(6)]
+    assert pool.pool_stats()["workers"] == 4  # Capped at max_workers
+
+    gate.set()
+    for future in futures:
+        future.result(timeout=1.0)
+    deadline = time.time() + 2.0
+    while pool.pool_stats()["workers"] > 1 and time.time() < deadline:
+        time.sleep(0.01)
+    assert pool.pool_stats() == {
+        "workers": 1, "idle": 1, "queued": 0, "min_workers": 1, "max_workers": 4
+    }
+    assert pool.submit("t", lambda: 42).result(timeout=1.0) == 42
+    pool.shutdown()
@@ -0,0 +1,71 @@
+from framework.core import Pipeline, DataBus
+from framework.core.flow_control import FlowControl
+from framework.core.registry import NodeRegistry
+from framework.core.telemetry import telemetry, RingBufferSink
+from framework.data.data_packet import DataPacket
+from framework.data.data_types import DataType, DataFormat, DataCategory, DataSource
+from framework.nodes import BaseNode
+import framework.nodes  # noqa: F401
+
+
+class HoarderNode(BaseNode):
+    """Sink that never consumes its input, like a stuck exporter"""
+    node_type = "hoarder_test"
+    accepted_data_types = set(DataType)
+    accepted_formats = set(DataFormat)
+    accepted_categories = set(DataCategory)
+
+    def process(self):
+        pass
+
+
+def test_slow_sink_pauses_source_through_intermediate_node():
+    sink = RingBufferSink()
+    previous = telemetry.set_sink(sink)
+    try:
+        pipeline = Pipeline({
+            "settings": {"delivery": "frame_sync", "flow_control": True},
+            "nodes": [
+                {"type": "number_generator", "name": "gen"},
+                {"type": "average", "name": "avg", "inputs": ["gen"], "params": {"window_size": 1}},
+                {"type": "hoarder_test", "name": "sink", "inputs": ["avg"], "credits": 3},
+            ],
+        }, "flow")
+        pipeline.build()
+        pipeline.data_bus.set_enabled(True)
+        for _ in range(10):
+            pipeline._run_frame()
+
+        buffer = pipeline.node_map["sink"].input_buffers["avg_out"]
+        assert len(buffer) == 3
+        assert pipeline.flow_control.credit("gen") == 0
+        assert pipeline.node_map["gen"].credit_blocked
+
+        buffer.clear()
+        pipeline._run_frame()
+        assert len(buffer) == 1 and not pipeline.node_map["gen"].credit_blocked
+        events = [m["value"]["blocked"] for m in sink.snapshot() if m["metric"] == "backpressure"]
+        assert events == [True, False]
+    finally:
+        telemetry.set_sink(previous)
+
+
+def test_unpausable_source_holds_latest_at_ingress():
+    bus = DataBus(max_workers=1)
+    node = NodeRegistry.create("udp_in", {"name": "udp", "ingress_policy": "latest"})
+    node.outputs = ["udp_out"]
+    node.data_bus = bus
+    node.flow = FlowControl(bus)
+    node.flow._credits = {"udp": 0}
+
+    packets = [DataPacket(data_type=DataType.STREAM, format=DataFormat.TEXTUAL,
+                          category=DataCategory.NETWORK, source=DataSource.EXTERNAL,
+                          content=str(i)) for i in range(3)]
+    assert not any(node.admit(p) for p in packets)
+    assert node.shed_count == 2 and node._ingress_held is packets[-1]
+
+    node.flow._credits = {"udp": 5}
+    assert node.admit(packets[0])
+    node.release_held()
+    assert node._ingress_held is None and node.last_output is packets[-1]
+    bus.shutdown()
@@ -0,0 +1,54 @@
+import threading
+import pytest
+from framework.core import Pipeline
+from framework.core.data_bus import FrameSyncBus
+from framework.data.data_types import DataType, DataFormat, DataCategory
+from framework.nodes import BaseNode
+import framework.nodes  # noqa: F401
+
+
+class FrameRecorderNode(BaseNode):
+    node_type = "frame_recorder_test"
+    accepted_data_types = set(DataType)
+    accepted_formats = set(DataFormat)
+    accepted_categories = set(DataCategory)
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.seen = []
+
+    def process(self):
+        packet = self.input_buffers[self.inputs[0]].pop(0)
+        self.seen.append((packet.content, self.pipeline.in_frame, threading.current_thread()))
+
+
+def _pipeline(delivery):
+    return Pipeline({
+        "settings": {"fps_limit": 60, "delivery": delivery},
+        "nodes": [
+            {"type": "frame_recorder_test", "name": "rec", "inputs": ["avg"]},
+            {"type": "average", "name": "avg", "inputs": ["gen"], "params": {"window_size": 2}},
+            {"type": "number_generator", "name": "gen"},
+        ],
+    }, f"sync-{delivery}")
+
+
+def test_frame_sync_delivers_whole_graph_within_frame():
+    pipeline = _pipeline("frame_sync")
+    pipeline.build()
+    assert isinstance(pipeline.data_bus, FrameSyncBus)
+    assert [n.name for n in pipeline.frame_nodes] == ["gen", "avg", "rec"]
+    pipeline.data_bus.set_enabled(True)
+
+    for _ in range(3):
+        pipeline._run_frame()
+    seen = pipeline.node_map["rec"].seen
+    assert [content for content, _, _ in seen] == [1.0, 1.5, 2.5]
+    assert all(in_frame and thread is threading.current_thread()
+               for _, in_frame, thread in seen)
+    pipeline.data_bus.shutdown()
+
+
+def test_unknown_delivery_mode_is_rejected():
+    with pytest.raises(ValueError):
+        _pipeline("eventually")
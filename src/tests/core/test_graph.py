@@ -0,0 +1,78 @@
+import pytest
+from framework.core import Pipeline, NodeRegistry
+from framework.core.graph import compile_plan, plan_cache, SAFE, RUNTIME, INCOMPATIBLE
+import framework.nodes  # noqa: F401  registers built-in nodes
+
+
+def _config(nodes, **settings):
+    return {"settings": settings, "nodes": nodes}
+
+
+def test_safe_edge_skips_runtime_validation():
+    config = _config([
+        {"type": "number_generator", "name": "gen"},
+        {"type": "console_logger", "name": "log", "inputs": ["gen"]},
+    ])
+    pipeline = Pipeline(config, "graph-safe")
+    pipeline.build()
+    assert pipeline.node_map["log"].trusted_inputs == {"gen_out"}
+
+
+def test_passthrough_propagates_upstream_envelope():
+    plan = compile_plan(_config([
+        {"type": "timer", "name": "tick"},
+        {"type": "rate_limiter", "name": "limit", "inputs": ["tick"]},
+        {"type": "api_request", "name": "api", "inputs": ["limit"], "params": {"url": "http://x"}},
+    ]), NodeRegistry.get_class)
+    statuses = {(e.upstream, e.downstream): e.status for e in plan.edges}
+    assert statuses[("tick", "limit")] == SAFE
+    assert statuses[("limit", "api")] == SAFE
+    assert plan.order == ["tick", "limit", "api"]
+
+
+def test_incompatible_edge_fails_build():
+    config = _config([
+        {"type": "udp_in", "name": "udp"},
+        {"type": "average", "name": "avg", "inputs": ["udp"]},
+    ])
+    with pytest.raises(ValueError, match="udp -> avg"):
+        Pipeline(config, "graph-bad").build()
+
+
+def test_incompatible_edge_warns_when_not_strict():
+    plan = compile_plan(_config([
+        {"type": "udp_in", "name": "udp"},
+        {"type": "average", "name": "avg", "inputs": ["udp"]},
+    ]), NodeRegistry.get_class, mode="warn")
+    assert not plan.errors
+    assert plan.edges[0].status == INCOMPATIBLE
+
+
+def test_undeclared_output_falls_back_to_runtime():
+    plan = compile_plan(_config([
+        {"type": "udp_in", "name": "udp"},
+        {"type": "accumulator", "name": "acc", "inputs": ["udp"]},
+        {"type": "buffer_difference", "name": "diff", "inputs": ["acc"]},
+    ]), NodeRegistry.get_class)
+    statuses = {(e.upstream, e.downstream): e.status for e in plan.edges}
+    assert statuses[("acc", "diff")] == RUNTIME
+
+
+def test_plan_is_cached_by_topology():
+    nodes = [
+        {"type": "number_generator", "name": "gen", "params": {"step_per_frame": 1}},
+        {"type": "console_logger", "name": "log", "inputs": ["gen"]},
+    ]
+    plan_cache.clear()
+    first = compile_plan(_config(nodes), NodeRegistry.get_class)
+    nodes[0]["params"]["step_per_frame"] = 5
+    assert compile_plan(_config(nodes), NodeRegistry.get_class) is first
+
+
+def test_accumulator_output_format_stays_within_declared_formats():
+    config = _config([
+        {"type": "number_generator", "name": "gen"},
+        {"type": "accumulator", "name": "acc", "inputs": ["gen"], "params": {"output_format": "media"}},
+    ])
+    with pytest.raises(ValueError, match="output_format"):
+        Pipeline(config, "graph-acc-format").build()
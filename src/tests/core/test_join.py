@@ -0,0 +1,113 @@
+import time
+from datetime import datetime
+import pytest
+from framework.core import Pipeline
+from framework.core.alignment import MISSING, SortedStream, StreamAligner
+from framework.data.data_packet import DataPacket
+from framework.data.data_types import DataType, DataFormat, DataCategory, DataSource
+import framework.nodes  # noqa: F401
+
+
+def test_sorted_stream_lookups():
+    stream = SortedStream()
+    for key, value in ((0.0, 0.0), (2.0, 20.0), (1.0, 10.0)):  # Out of order
+        stream.add(key, value)
+    assert stream.keys == [0.0, 1.0, 2.0]
+    assert stream.lookup(1.2, 0.5) == 10.0
+    assert stream.lookup(1.5, 0.4) is MISSING
+    assert stream.lookup(1.25, 1.0, "interpolate") == pytest.approx(12.5)
+    assert stream.lookup(1.25, 0.5, "interpolate") == 10.0  # 2.0 is out of tolerance
+    stream.evict_before(1.5)
+    assert stream.keys == [1.0, 2.0]
+
+
+def test_rows_wait_for_every_stream_to_pass_them():
+    aligner = StreamAligner(["a", "b"], tolerance=0.1)
+    assert aligner.add("a", 1.0, "a1") == []
+    assert aligner.add("b", 0.95, "b1") == []  # b's watermark hasn't passed 1.1 yet
+    assert aligner.add("a", 2.0, "a2") == []
+    assert aligner.add("b", 1.2, "b2") == [(1.0, {"a": "a1", "b": "b1"})]
+    # Nothing within tolerance of 2.0: the row is dropped once b moves on
+    assert aligner.add("b", 3.0, "b3") == []
+    assert aligner.unmatched == 1
+    assert aligner.add("a", 0.5, "late") == []
+    assert aligner.late == 1
+
+
+def test_idle_streams_stop_holding_rows_back():
+    aligner = StreamAligner(["a", "b", "c"], tolerance=0.0, emit_partial=True)
+    aligner.add("b", 1.0, "b1")
+    aligner.add("a", 1.0, "a1")
+    assert aligner.resolve() == []
+    aligner.set_idle("c", True)
+    assert aligner.resolve() == [(1.0, {"a": "a1", "b": "b1", "c": None})]
+
+
+class Collector:
+    def __init__(self):
+        self.received = []
+
+    def on_data(self, packet, channel):
+        self.received.append(packet)
+
+
+def _packet(value, seq):
+    return DataPacket(
+        data_type=DataType.STREAM, format=DataFormat.NUMERICAL, category=DataCategory.GENERIC,
+        source=DataSource.EXTERNAL, content=value, sequence_id=seq
+    )
+
+
+def _pipeline(params):
+    pipeline = Pipeline({
+        "settings": {"delivery": "frame_sync"},
+        "nodes": [
+            {"type": "number_generator", "name": "fast"},
+            {"type": "number_generator", "name": "slow"},
+            {"type": "join", "name": "join", "inputs": ["fast", "slow"], "params": params},
+        ],
+    }, "join-node")
+    pipeline.build()
+    pipeline.data_bus.set_enabled(True)
+    collector = Collector()
+    pipeline.data_bus.subscribe(collector, "join_out")
+    return pipeline, pipeline.node_map["join"], collector
+
+
+def test_join_node_interpolates_by_sequence():
+    pipeline, node, collector = _pipeline({
+        "align_by": "sequence_id", "tolerance": 2, "method": "interpolate", "output_as": "dict"
+    })
+    for seq in range(5):
+        node.on_data(_packet(float(seq), seq), "fast_out")
+    for seq in (0, 2, 4, 6):
+        node.on_data(_packet(seq * 10.0, seq), "slow_out")
+    pipeline.data_bus.run_pending()
+    assert [p.content["slow"] for p in collector.received] == [0.0, 10.0, 20.0, 30.0, 40.0]
+    assert [p.sequence_id for p in collector.received] == [0, 1, 2, 3, 4]
+
+
+def test_join_node_leaves_sequence_id_alone_for_content_keys():
+    pipeline, node, collector = _pipeline({"key_path": "content.step", "tolerance": 0})
+    for channel in ("fast_out", "slow_out"):
+        node.on_data(_packet({"step": 3}, None), channel)
+        node.on_data(_packet({"step": 4}, None), channel)
+    pipeline.data_bus.run_pending()
+    assert [p.sequence_id for p in collector.received] == [None, None]
+
+
+def test_join_node_emits_timestamped_rows_after_idle_timeout():
+    pipeline, node, collector = _pipeline({"tolerance": 0.5, "idle_timeout": 0.05, "emit_partial": True})
+    now = datetime.now()
+    node.on_data(DataPacket(
+        data_type=DataType.STREAM, format=DataFormat.NUMERICAL, category=DataCategory.GENERIC,
+        source=DataSource.EXTERNAL, content=1.0, timestamp=now
+    ), "fast_out")
+    node.process()
+    pipeline.data_bus.run_pending()
+    assert collector.received == []
+    time.sleep(0.06)
+    node.process()
+    pipeline.data_bus.run_pending()
+    assert [p.content for p in collector.received] == [[1.0, None]]
+    assert collector.received[0].timestamp == now
@@ -0,0 +1,174 @@
+import threading
+import time
+import pytest
+from framework.core import FairExecutor, Pipeline
+from framework.core.bulkhead import CircuitBreaker
+from framework.data.data_packet import DataPacket
+from framework.data.data_types import DataType, DataFormat, DataCategory, DataSource
+from framework.nodes import BaseNode
+from framework.nodes.keyed import KeyedNode, extract_key
+import framework.nodes  # noqa: F401
+
+
+class SlowNode(BaseNode):
+    """Records how many of its instances run at once"""
+    node_type = "slow_keyed_test"
+    accepted_data_types = set(DataType)
+    accepted_formats = set(DataFormat)
+    accepted_categories = set(DataCategory)
+    lock = threading.Lock()
+    running = peak = 0
+    received = []
+
+    def on_data(self, packet, input_channel):
+        with SlowNode.lock:
+            SlowNode.running += 1
+            SlowNode.peak = max(SlowNode.peak, SlowNode.running)
+            SlowNode.received.append(packet)
+        time.sleep(0.02)
+        with SlowNode.lock:
+            SlowNode.running -= 1
+
+
+class Collector:
+    def __init__(self):
+        self.received = []
+
+    def on_data(self, packet, channel):
+        self.received.append((packet.content["sensor"], packet.content["value"]))
+
+
+def _packet(sensor, value):
+    return DataPacket(
+        data_type=DataType.STREAM, format=DataFormat.TEXTUAL, category=DataCategory.GENERIC,
+        source=DataSource.EXTERNAL, content={"sensor": sensor, "value": value}
+    )
+
+
+def _pipeline():
+    pipeline = Pipeline({
+        "nodes": [
+            {"type": "number_generator", "name": "src"},
+            {"type": "pass_on_change", "name": "changes", "inputs": ["src"],
+             "parallelism": 3, "key_by": "content.sensor",
+             "params": {"key_path": "value"}},
+        ],
+    }, "keyed")
+    pipeline.build()
+    pipeline.data_bus.set_enabled(True)
+    return pipeline
+
+
+def test_state_and_order_are_kept_per_key():
+    pipeline = _pipeline()
+    node = pipeline.node_map["changes"]
+    assert isinstance(node, KeyedNode)
+    collector = Collector()
+    pipeline.data_bus.subscribe(collector, "changes_out")
+
+    readings = [("a", 1), ("b", 1), ("a", 1), ("b", 2), ("a", 2), ("b", 2), ("a", 3)]
+    for sensor, value in readings:
+        pipeline.data_bus.publish("src_out", _packet(sensor, value))
+    assert pipeline.data_bus.drain(timeout=5.0)
+
+    # One pass_on_change per sensor: a repeat of another sensor's value still passes
+    assert sorted(node.instances) == ["a", "b"]
+    assert [r for r in collector.received if r[0] == "a"] == [("a", 1), ("a", 2), ("a", 3)]
+    assert [r for r in collector.received if r[0] == "b"] == [("b", 1), ("b", 2)]
+
+    state = node.save_state()
+    restored = _pipeline().node_map["changes"]
+    restored.restore_state(state)
+    assert restored.instance_for("a")._last_value == 3
+    pipeline.data_bus.shutdown()
+
+
+def test_sources_cannot_be_partitioned():
+    with pytest.raises(ValueError, match="cannot be partitioned"):
+        Pipeline({"nodes": [{"type": "number_generator", "name": "src",
+                             "parallelism": 2, "key_by": "content"}]}, "bad").build()
+
+
+def test_extract_key_walks_attributes_and_dicts():
+    packet = _packet("x", [5, 6])
+    assert extract_key(packet, "content.sensor") == "x"
+    assert extract_key(packet, "content.value.1") == 6
+    assert extract_key(packet, "content.missing.deeper") is None
+
+
+def _slow_pipeline(executor=None, **keyed):
+    SlowNode.running = SlowNode.peak = 0
+    SlowNode.received = []
+    pipeline = Pipeline({
+        "nodes": [
+            {"type": "number_generator", "name": "src"},
+            {"type": "slow_keyed_test", "name": "slow", "inputs": ["src"],
+             "parallelism": 4, "key_by": "content.sensor", **keyed},
+        ],
+    }, "keyed-slow", executor=executor)
+    pipeline.build()
+    pipeline.data_bus.set_enabled(True)
+    return pipeline
+
+
+def test_lanes_run_within_the_pipeline_tenant_budget():
+    pool = FairExecutor(max_workers=8)
+    pipeline = _slow_pipeline(pool.tenant("keyed-slow", max_running=2))
+    for i in range(16):
+        pipeline.data_bus.publish("src_out", _packet(f"s{i}", i))
+    assert pipeline.data_bus.drain(timeout=5.0)
+    assert len(SlowNode.received) == 16
+    assert SlowNode.peak <= 2  # Four lanes, but only two of the tenant's slots
+    pipeline.data_bus.shutdown()
+    pool.shutdown()
+
+
+def test_routed_packets_are_copied_and_respect_the_breaker():
+    pipeline = _slow_pipeline()
+    node = pipeline.node_map["slow"]
+    packet = _packet("a", 1)
+    pipeline.data_bus.publish("src_out", packet)
+    packet.content["value"] = 2  # Published data is copied before it is queued
+    assert pipeline.data_bus.drain(timeout=5.0)
+    assert SlowNode.received[0] is not packet and SlowNode.received[0].content["value"] == 1
+
+    node.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    node.breaker.record_failure()
+    pipeline.data_bus.publish("src_out", _packet("a", 3))
+    assert pipeline.data_bus.drain(timeout=5.0)
+    assert node.shed_count == 1 and len(SlowNode.received) == 1
+    pipeline.data_bus.shutdown()
+
+
+def test_lane_overflow_spills_on_spilling_edges(tmp_path):
+    pipeline = _slow_pipeline(lane_queue=1)
+    pipeline.data_bus.set_spill("src_out", max_in_flight=1, directory=str(tmp_path))
+    node = pipeline.node_map["slow"]
+    for i in range(12):
+        pipeline.data_bus.publish("src_out", _packet("a", i))
+    assert pipeline.data_bus.drain(timeout=5.0)
+    assert node.shed_count == 0
+    assert [p.content["value"] for p in SlowNode.received] == list(range(12))
+    pipeline.data_bus.shutdown()
+
+
+class Unhashable:
+    __hash__ = None
+
+
+def test_unhashable_keys_are_normalized_or_shed():
+    pipeline = _slow_pipeline()
+    node = pipeline.node_map["slow"]
+    for sensor in (["a", 1], {"id": "b"}, ["a", 1]):
+        pipeline.data_bus.publish("src_out", _packet(sensor, 0))
+    assert pipeline.data_bus.drain(timeout=5.0)
+    assert set(node.instances) == {("a", 1), (("id", "b"),)} and len(SlowNode.received) == 3
+
+    node.on_data(_packet(Unhashable(), 0), "src_out")
+    assert node.shed_count == 1 and len(SlowNode.received) == 3
+
+    # Tuple keys come back from msgpack as lists
+    restored = _slow_pipeline().node_map["slow"]
+    restored.restore_state({"instances": [[["a", 1], None], [Unhashable(), None]]})
+    assert list(restored.instances) == [("a", 1)]
+    pipeline.data_bus.shutdown()
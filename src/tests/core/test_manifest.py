@@ -0,0 +1,57 @@
+import json
+import framework.nodes
+from framework.core import manifest, NodeRegistry
+
+
+def test_manifest_is_written_and_reused(tmp_path, monkeypatch):
+    path = tmp_path / "node_manifest.json"
+    entries = manifest.discover(framework.nodes.__path__, "framework.nodes.", path)
+    types = {e["type"] for e in entries}
+    assert {"timer", "udp_out", "average"} <= types
+    assert json.loads(path.read_text())["version"] == manifest.MANIFEST_VERSION
+
+    def fail_import(module_name):
+        raise AssertionError(f"{module_name} should come from the manifest")
+
+    # Unchanged modules must be served from disk, including ones that failed to import
+    monkeypatch.setattr(manifest, "_import_entries", fail_import)
+    again = manifest.discover(framework.nodes.__path__, "framework.nodes.", path)
+    assert {e["type"] for e in again} == types
+
+
+def test_import_failures_are_cached_until_the_module_changes(tmp_path, monkeypatch):
+    package = tmp_path / "fake_nodes"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    module = package / "needs_missing_dep.py"
+    module.write_text("import not_installed_dependency\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    path = tmp_path / "node_manifest.json"
+
+    attempts = []
+    import_entries = manifest._import_entries
+    monkeypatch.setattr(manifest, "_import_entries",
+                        lambda name: attempts.append(name) or import_entries(name))
+    for _ in range(2):
+        assert manifest.discover([str(package)], "fake_nodes.", path) == []
+    assert attempts == ["fake_nodes.needs_missing_dep"]
+
+    module.write_text("NODE_CLASSES = []\n")
+    manifest.discover([str(package)], "fake_nodes.", path)
+    assert len(attempts) == 2
+
+
+def test_lazy_entry_resolves_on_create():
+    entry = {
+        "type": "lazy_timer_alias",
+        "module": "framework.nodes.sources.timer",
+        "class": "TimerNode",
+        "category": "sources",
+        "tags": ["utils"],
+        "params_schema": {"type": "object"},
+    }
+    NodeRegistry.register_lazy(entry)
+    assert NodeRegistry.get_category("lazy_timer_alias") == "sources"
+    assert not NodeRegistry.is_loaded("lazy_timer_alias")
+    node = NodeRegistry.create("lazy_timer_alias", {"name": "t"})
+    assert node.node_type == "timer"
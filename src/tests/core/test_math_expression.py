@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from framework.core import Pipeline
+from framework.core.expressions import Expression
+import framework.nodes  # noqa: F401
+
+
+def test_expression_evaluates_scalars_and_arrays_alike():
+    expr = Expression("hypot(a.x, a.y) if 0 < b <= 10 and not c else -1")
+    assert expr.variables == ["b", "c", "a.x", "a.y"]
+    assert expr({"a.x": 3, "a.y": 4, "b": 5, "c": False}) == 5.0
+    result = expr({"a.x": np.array([3.0, 6.0]), "a.y": np.array([4.0, 8.0]),
+                   "b": np.array([5, 20]), "c": np.array([False, False])})
+    assert result.tolist() == [5.0, -1.0]
+    assert not Expression("mean(x)").elementwise
+
+
+def test_integer_powers_overflow_instead_of_hanging():
+    assert Expression("9**9**9")({}) == np.inf
+    assert Expression("x ** y")({"x": 9, "y": 10 ** 6}) == np.inf
+
+
+@pytest.mark.parametrize("source", [
+    "__import__('os')", "x.__class__", "(1).real", "x[0]", "'text'", "lambda: 1", "open(x)", "sum",
+])
+def test_unsafe_expressions_are_rejected(source):
+    with pytest.raises(ValueError):
+        Expression(source)
+
+
+class Collector:
+    def __init__(self):
+        self.received = []
+
+    def on_data(self, packet, channel):
+        self.received.append(packet.content)
+
+
+def _pipeline(nodes):
+    pipeline = Pipeline({"settings": {"delivery": "frame_sync"}, "nodes": nodes}, "math-expression")
+    pipeline.build()
+    pipeline.data_bus.set_enabled(True)
+    collector = Collector()
+    pipeline.data_bus.subscribe(collector, f"{nodes[-1]['name']}_out")
+    return pipeline, collector
+
+
+def test_zip_mode_pairs_inputs_and_batches_backlog(make_packet):
+    pipeline, collector = _pipeline([
+        {"type": "number_generator", "name": "a"},
+        {"type": "number_generator", "name": "imu"},
+        {"type": "math_expression", "name": "calc", "inputs": ["a", "imu"],
+         "params": {"expression": "a * 10 + ax", "variables": {"ax": "imu.accel.x"}}},
+    ])
+    node = pipeline.node_map["calc"]
+    for value in (1, 2, 3):
+        node.input_buffers["a_out"].append(make_packet(value))
+    for value in (0.5, 0.25):
+        node.input_buffers["imu_out"].append(make_packet({"accel": {"x": value}}))
+    node.process()
+    pipeline.data_bus.run_pending()
+    assert collector.received == [10.5, 20.25]
+    assert len(node.input_buffers["a_out"]) == 1
+
+
+def test_latest_mode_and_array_content(make_packet):
+    pipeline, collector = _pipeline([
+        {"type": "number_generator", "name": "gen"},
+        {"type": "math_expression", "name": "calc", "inputs": ["gen"],
+         "params": {"expression": "clip(x * 2, 0, 5)", "sync": "latest"}},
+    ])
+    node = pipeline.node_map["calc"]
+    node.on_data(make_packet([1, 2, 3]), "gen_out")
+    node.process()  # Nothing new
+    pipeline.data_bus.run_pending()
+    assert collector.received == [[2.0, 4.0, 5.0]]
+
+
+def test_unknown_variable_fails_at_build():
+    with pytest.raises(ValueError):
+        _pipeline([
+            {"type": "number_generator", "name": "gen"},
+            {"type": "math_expression", "name": "calc", "inputs": ["gen"],
+             "params": {"expression": "y + 1"}},
+        ])
+
+
+def test_math_multiply_consumes_its_input(make_packet):
+    pipeline, collector = _pipeline([
+        {"type": "number_generator", "name": "gen"},
+        {"type": "math_multiply", "name": "mul", "inputs": ["gen"], "params": {"multiplier": 3}},
+    ])
+    node = pipeline.node_map["mul"]
+    for value in (1, 2):
+        node.on_data(make_packet(value), "gen_out")
+    pipeline.data_bus.run_pending()
+    assert collector.received == [3, 6]
+    assert not node.input_buffers["gen_out"]
@@ -0,0 +1,48 @@
+from framework.core import DataBus
+from framework.core.offload import ProcessOffload, _pack, _unpack
+from framework.core.registry import NodeRegistry
+import framework.nodes  # noqa: F401
+
+
+class Collector:
+    def __init__(self):
+        self.received = []
+
+    def on_data(self, data, channel):
+        self.received.append(data)
+
+
+def test_large_content_roundtrips_through_shared_memory(make_packet):
+    text = "x" * 100
+    payload, shm = _pack(make_packet(text), threshold=10)
+    assert shm is not None and payload["body"]["content"] is None
+    assert _unpack(payload).content == text
+    shm.close()
+    shm.unlink()
+
+
+def test_process_node_runs_unchanged_in_worker(make_packet):
+    offload = ProcessOffload(max_workers=1, shm_threshold=16)
+    bus = DataBus(max_workers=2)
+    node = NodeRegistry.create("regex_extractor", {
+        "name": "rx", "inputs": ["src"], "execution": "process",
+        "params": {"pattern": r"\d+"},
+    })
+    node.inputs = ["src_out"]
+    node.outputs = ["rx_out"]
+    node.input_buffers = {"src_out": []}
+    node.data_bus = bus
+    node.offload = offload
+    collector = Collector()
+    bus.subscribe(node, "src_out")
+    bus.subscribe(collector, "rx_out")
+    bus.set_enabled(True)
+
+    try:
+        bus.publish("src_out", make_packet("a1 b22 " * 20))
+        assert bus.drain(timeout=30.0)
+        [result] = collector.received
+        assert result.content == ["1", "22"] * 20
+    finally:
+        bus.shutdown()
+        offload.shutdown()
@@ -0,0 +1,67 @@
+import asyncio
+from types import SimpleNamespace
+from framework.core import PipelineManager
+from framework.core.event_loop import shared_loop
+from framework.core.offload import process_offload
+from framework.core.pipeline_store import PipelineStore
+from framework.core.watchdog import watchdog
+import framework.nodes  # noqa: F401
+
+CONFIG = {
+    "settings": {"fps_limit": 50},
+    "nodes": [
+        {"type": "number_generator", "name": "gen"},
+        {"type": "average", "name": "avg", "inputs": ["gen"], "params": {"window_size": 3}},
+    ],
+}
+
+
+def test_store_roundtrip(tmp_path):
+    store = PipelineStore(tmp_path / "pipelines.db")
+    store.save("p1", CONFIG)
+    store.set_running("p1", True)
+    store.save("p1", {**CONFIG, "settings": {"fps_limit": 10}})
+
+    [record] = store.load_all()
+    assert record.pipeline_id == "p1"
+    assert record.running  # Config updates keep the run state
+    assert record.config["settings"]["fps_limit"] == 10
+
+    store.delete("p1")
+    assert store.load_all() == []
+    store.close()
+
+
+def test_manager_warm_restore(tmp_path):
+    manager = PipelineManager()
+    manager.open_store(tmp_path / "pipelines.db")
+    try:
+        running_id = manager.create_pipeline(CONFIG)
+        stopped_id = manager.create_pipeline(CONFIG)
+        manager.start_pipeline(running_id)
+        manager.shutdown_all()
+        assert not manager.pipelines
+
+        assert manager.restore(auto_start=True) == {}
+        assert set(manager.pipelines) == {running_id, stopped_id}
+        assert manager.get_pipeline(running_id)._running.is_set()
+        assert not manager.get_pipeline(stopped_id)._running.is_set()
+
+        manager.delete_pipeline(stopped_id)
+        assert [r.pipeline_id for r in manager.store.load_all()] == [running_id]
+    finally:
+        manager.shutdown_all()
+        manager.close_store()
+
+
+def test_shutdown_all_stops_process_wide_helpers():
+    manager = PipelineManager()
+    assert shared_loop.submit(asyncio.sleep(0)).result(timeout=5.0) is None
+    process_offload.executor  # Created on first use
+    watchdog.watch(SimpleNamespace(id="idle", check_stalls=lambda: []))
+    watchdog.unwatch(SimpleNamespace(id="idle"))
+
+    manager.shutdown_all()
+    assert shared_loop._loop is None
+    assert process_offload._executor is None
+    assert watchdog._thread is None
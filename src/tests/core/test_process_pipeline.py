@@ -0,0 +1,87 @@
+import time
+import pytest
+from framework.core import ProcessPipeline
+from framework.core.telemetry import telemetry, RingBufferSink
+
+CONFIG = {
+    "settings": {"fps_limit": 100, "shutdown_timeout": 1.0},
+    "nodes": [
+        {"type": "number_generator", "name": "gen"},
+        {"type": "console_logger", "name": "log", "inputs": ["gen"]},
+    ],
+}
+
+
+def test_process_pipeline_lifecycle_relays_telemetry():
+    sink = RingBufferSink()
+    previous = telemetry.set_sink(sink)
+    pipeline = ProcessPipeline(CONFIG, "proc-test")
+    try:
+        pipeline.build()
+        pipeline.run()
+        assert pipeline._running.is_set()
+        time.sleep(0.2)
+        pipeline.shutdown()
+        assert not pipeline._running.is_set()
+
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            if any(m["metric"] == "shutdown" for m in sink.snapshot()):
+                break
+            time.sleep(0.05)
+        reports = [m for m in sink.snapshot() if m["metric"] == "shutdown"]
+        assert reports and reports[-1]["pipeline_id"] == "proc-test"
+    finally:
+        pipeline.close()
+        telemetry.set_sink(previous)
+    assert not pipeline.process.is_alive()
+
+
+def test_process_pipeline_reraises_worker_errors():
+    config = {"nodes": [{"type": "console_logger", "name": "log", "inputs": ["missing"]}]}
+    pipeline = ProcessPipeline(config, "proc-error")
+    try:
+        with pytest.raises(ValueError):
+            pipeline.build()
+    finally:
+        pipeline.close()
+
+
+def test_late_reply_to_timed_out_call_is_discarded():
+    pipeline = ProcessPipeline(CONFIG, "proc-timeout")
+    try:
+        with pytest.raises(TimeoutError):
+            pipeline._call("build", timeout=0)
+        # The build reply arrives late; this call must get its own answer
+        assert pipeline.update_node_params("gen", {"step_per_frame": 2.0}) is True
+        assert pipeline.snapshot_state() == 0
+    finally:
+        pipeline.close()
+
+
+def test_process_nodes_fall_back_to_cpu_bulkhead_in_worker():
+    # Daemonic worker processes can't start the process offload pool
+    config = {
+        "settings": {"fps_limit": 100, "shutdown_timeout": 1.0},
+        "nodes": [
+            {"type": "number_generator", "name": "gen"},
+            {"type": "console_logger", "name": "log", "inputs": ["gen"], "execution": "process"},
+        ],
+    }
+    sink = RingBufferSink()
+    previous = telemetry.set_sink(sink)
+    pipeline = ProcessPipeline(config, "proc-offload")
+    try:
+        pipeline.build()
+        pipeline.run()
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            if any(m["node_id"] == "log" and m["metric"] == "processing_end" for m in sink.snapshot()):
+                break
+            time.sleep(0.05)
+        pipeline.shutdown()
+        assert any(m["node_id"] == "log" and m["metric"] == "processing_end" for m in sink.snapshot())
+        assert not any(m["metric"] == "processing_error" for m in sink.snapshot())
+    finally:
+        pipeline.close()
+        telemetry.set_sink(previous)
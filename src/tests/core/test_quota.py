@@ -0,0 +1,77 @@
+import threading
+import pytest
+from framework.core import Pipeline, FairExecutor
+from framework.core.quota import ResourceQuota, estimate_size
+import framework.nodes  # noqa: F401
+
+
+def test_tenant_thread_cap_leaves_room_for_others():
+    pool = FairExecutor(max_workers=4)
+    gate = threading.Event()
+    capped = pool.tenant("capped", max_running=1)
+    other = pool.tenant("other")
+
+    blocked = [capped.submit(gate.wait) for _ in range(3)]
+    assert other.submit(lambda: "ok").result(timeout=1.0) == "ok"
+    assert pool.stats()["capped"] == {"weight": 1, "queued": 2, "running": 1}
+
+    gate.set()
+    for future in blocked:
+        future.result(timeout=1.0)
+    pool.shutdown()
+
+
+def _pipeline(policy):
+    return Pipeline({
+        "settings": {"fps_limit": 60, "delivery": "frame_sync",
+                     "quota": {"max_buffered_bytes": 200, "policy": policy}},
+        "nodes": [
+            {"type": "storage", "name": "store", "inputs": ["gen"],
+             "params": {"include_metadata": False}},
+            {"type": "number_generator", "name": "gen"},
+        ],
+    }, f"quota-{policy}")
+
+
+def test_shed_policy_trims_stored_records():
+    pipeline = _pipeline("shed")
+    pipeline.build()
+    pipeline.data_bus.set_enabled(True)
+    for _ in range(10):
+        pipeline._run_frame()
+    store = pipeline.node_map["store"]
+    assert store.buffered_bytes() > 200
+
+    usage = pipeline.sample_usage()
+    assert usage["buffered_bytes"] == store.buffered_bytes()
+    pipeline._enforce_quota()
+    assert len(store.get_all()) == 5
+    assert pipeline.quota_action is None
+
+
+def test_pause_policy_holds_sources_until_under_budget():
+    pipeline = _pipeline("pause")
+    pipeline.build()
+    pipeline.data_bus.set_enabled(True)
+    for _ in range(10):
+        pipeline._run_frame()
+    pipeline.sample_usage()
+    pipeline._enforce_quota()
+    assert pipeline.quota_action == "pause"
+
+    store = pipeline.node_map["store"]
+    stored = len(store.get_all())
+    pipeline._run_frame()
+    assert len(store.get_all()) == stored
+
+    store.restore_state({"records": []})
+    pipeline.sample_usage()
+    pipeline._enforce_quota()
+    assert pipeline.quota_action is None
+
+
+def test_quota_validation_and_size_estimate():
+    with pytest.raises(ValueError):
+        ResourceQuota(policy="explode")
+    assert ResourceQuota.from_settings(None) is None
+    assert estimate_size({"a": "xyz", "b": [b"12", 3]}) == 1 + 3 + 1 + 2 + 8
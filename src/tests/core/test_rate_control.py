@@ -0,0 +1,73 @@
+import time
+from framework.core import Pipeline
+from framework.core.rate_control import AdaptiveRateController
+from framework.core.telemetry import telemetry, RingBufferSink
+from framework.nodes import BaseNode
+
+
+class SlowGeneratorNode(BaseNode):
+    node_type = "slow_generator_test"
+    IS_GENERATOR = True
+    MIN_INPUTS = 0
+    MAX_INPUTS = 0
+
+    def process(self):
+        time.sleep(0.03)
+
+
+def test_controller_backs_off_and_recovers():
+    controller = AdaptiveRateController(60, min_fps=10, cooldown=0, smoothing=1.0)
+    for _ in range(50):
+        controller.update(0.2)  # 200ms frames fit no rate above 5fps
+    assert controller.fps == 10
+
+    for _ in range(100):
+        controller.update(0.001)
+    assert controller.fps == 60
+
+
+def test_backlog_alone_reduces_rate():
+    controller = AdaptiveRateController(60, cooldown=0, max_backlog=10)
+    assert controller.update(0.0, backlog=50) < 60
+
+
+def test_disabled_without_setting():
+    assert AdaptiveRateController.from_settings(60, None) is None
+    assert AdaptiveRateController.from_settings(0, True) is None
+
+
+def test_pipeline_adapts_and_reports_overruns():
+    sink = RingBufferSink()
+    previous = telemetry.set_sink(sink)
+    try:
+        pipeline = Pipeline({
+            "settings": {"fps_limit": 60, "adaptive_fps": {"min_fps": 15, "cooldown": 0}},
+            "nodes": [{"type": "slow_generator_test", "name": "slow"}],
+        }, "adaptive")
+        pipeline.build()
+        pipeline.fps_telemetry_interval = 0.1
+        for _ in range(10):
+            pipeline._run_frame()
+        assert pipeline.effective_fps < 60 and pipeline.fps_limit == 60  # Configured limit kept
+        assert pipeline.frame_duration == 1.0 / pipeline.effective_fps
+        reports = [m for m in sink.snapshot() if m["metric"] == "frame_overrun"]
+        assert reports and reports[0]["value"]["overruns"] > 0
+        assert reports[0]["value"]["fps_limit"] == 60
+    finally:
+        telemetry.set_sink(previous)
+
+
+def test_update_config_rebuilds_the_rate_controller():
+    nodes = [{"type": "slow_generator_test", "name": "slow"}]
+    pipeline = Pipeline({"settings": {"fps_limit": 60}, "nodes": nodes}, "adaptive-update")
+    pipeline.build()
+    assert pipeline.rate_controller is None
+
+    pipeline.update_config({"settings": {"fps_limit": 30, "adaptive_fps": {"min_fps": 10}}, "nodes": nodes})
+    assert pipeline.rate_controller is not None and pipeline.rate_controller.target_fps == 30
+    assert pipeline.fps_limit == pipeline.effective_fps == 30
+    assert pipeline.frame_duration == 1.0 / 30
+
+    pipeline.update_config({"settings": {"fps_limit": 20}, "nodes": nodes})
+    assert pipeline.rate_controller is None and pipeline.effective_fps == 20
+    pipeline.close()
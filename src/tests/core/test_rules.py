@@ -0,0 +1,72 @@
+import json
+import operator
+import random
+import pytest
+from framework.core import Pipeline
+from framework.core.rules import RULE_OPERATORS, RuleSet
+import framework.nodes  # noqa: F401
+
+OPS = {"gt": operator.gt, "ge": operator.ge, "lt": operator.lt,
+       "le": operator.le, "eq": operator.eq, "ne": operator.ne}
+
+
+def test_rule_set_matches_brute_force():
+    rng = random.Random(3)
+    rules = [{"id": f"r{i}", "path": rng.choice(["temp", "load"]),
+              "op": rng.choice(RULE_OPERATORS), "threshold": rng.randint(0, 20)}
+             for i in range(2000)]
+    rule_set = RuleSet(rules)
+    for _ in range(50):
+        values = {"temp": rng.randint(-1, 21), "load": rng.choice([None, rng.randint(0, 20)])}
+        expected = {r["id"] for r in rules
+                    if values[r["path"]] is not None and OPS[r["op"]](values[r["path"]], r["threshold"])}
+        assert set(rule_set.match(values)) == expected
+
+
+def test_non_finite_values_match_nothing():
+    rule_set = RuleSet([{"id": "a", "op": "ge", "threshold": 1}, {"id": "b", "op": "le", "threshold": 2},
+                        {"id": "c", "op": "ne", "threshold": 0}])
+    for value in (float("nan"), float("inf"), float("-inf")):
+        assert rule_set.match({"": value}) == []
+
+
+def test_invalid_rules_are_rejected():
+    with pytest.raises(ValueError):
+        RuleSet([{"id": "a", "op": "between", "threshold": 1}])
+    with pytest.raises(ValueError):
+        RuleSet([{"id": "a", "threshold": 1}, {"id": "a", "threshold": 2}])
+
+
+class Collector:
+    def __init__(self):
+        self.received = []
+
+    def on_data(self, packet, channel):
+        self.received.append(sorted(packet.content))
+
+
+def test_rules_node_edge_triggers_from_file(tmp_path, make_packet):
+    rules_file = tmp_path / "rules.json"
+    rules_file.write_text(json.dumps([
+        {"id": "hot", "path": "temp", "op": "gt", "threshold": 30},
+        {"id": "cold", "path": "temp", "op": "lt", "threshold": 5},
+        {"id": "busy", "path": "cpu.load", "op": "ge", "threshold": 0.9},
+    ]))
+    pipeline = Pipeline({
+        "settings": {"delivery": "frame_sync"},
+        "nodes": [
+            {"type": "number_generator", "name": "src"},
+            {"type": "rules", "name": "alerts", "inputs": ["src"],
+             "params": {"rules_file": str(rules_file), "edge_triggered": True}},
+        ],
+    }, "rules-node")
+    pipeline.build()
+    pipeline.data_bus.set_enabled(True)
+    collector = Collector()
+    pipeline.data_bus.subscribe(collector, "alerts_out")
+    node = pipeline.node_map["alerts"]
+    for content in ({"temp": 35, "cpu": {"load": 0.95}}, {"temp": 36, "cpu": {"load": 0.5}},
+                    {"temp": 2}, {"temp": 40, "cpu": {"load": 1.0}}):
+        node.on_data(make_packet(content), "src_out")
+    pipeline.data_bus.run_pending()
+    assert collector.received == [["busy", "hot"], ["cold"], ["busy", "hot"]]
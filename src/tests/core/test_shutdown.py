@@ -0,0 +1,104 @@
+import time
+from framework.core import Pipeline, DataBus
+from framework.core.telemetry import telemetry, RingBufferSink
+import framework.nodes  # noqa: F401
+
+
+class SlowSubscriber:
+    def __init__(self, delay):
+        self.delay = delay
+        self.received = []
+
+    def on_data(self, data, channel):
+        time.sleep(self.delay)
+        self.received.append(data)
+
+
+def test_drain_and_discard_are_bounded():
+    bus = DataBus(max_workers=1)
+    bus.set_enabled(True)
+    subscriber = SlowSubscriber(0.02)
+    bus.subscribe(subscriber, "ch")
+    for i in range(50):
+        bus.publish("ch", i)
+
+    assert not bus.drain(timeout=0.05)
+    discarded = bus.discard_pending()
+    assert discarded > 0
+    assert bus.drain(timeout=1.0)
+    assert len(subscriber.received) + discarded == 50
+    bus.shutdown()
+
+
+def test_pipeline_shutdown_reports_drain():
+    sink = RingBufferSink()
+    previous = telemetry.set_sink(sink)
+    try:
+        pipeline = Pipeline({
+            "settings": {"fps_limit": 200, "shutdown_timeout": 1.0},
+            "nodes": [
+                {"type": "number_generator", "name": "gen"},
+                {"type": "console_logger", "name": "log", "inputs": ["gen"]},
+            ],
+        }, "shutdown-test")
+        pipeline.build()
+        pipeline.run()
+        time.sleep(0.05)
+        started = time.monotonic()
+        pipeline.shutdown()
+        assert time.monotonic() - started < 1.5
+        assert pipeline._thread is None
+        reports = [m for m in sink.snapshot() if m["metric"] == "shutdown"]
+        assert reports and not reports[-1]["value"]["timed_out"]
+        assert reports[-1]["value"]["discarded"] == 0
+    finally:
+        telemetry.set_sink(previous)
+
+
+def test_shutdown_reports_drained_and_discarded_counts():
+    sink = RingBufferSink()
+    previous = telemetry.set_sink(sink)
+    try:
+        pipeline = Pipeline({
+            "settings": {"shutdown_timeout": 0.1, "bus_max_workers": 1, "bus_min_workers": 1},
+            "nodes": [{"type": "number_generator", "name": "gen"}],
+        }, "shutdown-counts")
+        pipeline.build()
+        subscriber = SlowSubscriber(0.02)
+        pipeline.data_bus.subscribe(subscriber, "gen_out")
+        pipeline.run()
+        for i in range(50):
+            pipeline.data_bus.publish("gen_out", i)
+        pipeline.shutdown()
+        report = [m for m in sink.snapshot() if m["metric"] == "shutdown"][-1]["value"]
+        assert report["timed_out"]
+        assert report["drained"] > 0 and report["discarded"] > 0
+        assert report["drained"] <= len(subscriber.received)
+    finally:
+        telemetry.set_sink(previous)
+
+
+def test_replaced_and_closed_buses_release_their_workers():
+    config = {
+        "settings": {"bus_min_workers": 1},
+        "nodes": [{"type": "number_generator", "name": "gen"}],
+    }
+    pipeline = Pipeline(config, "bus-release")
+    pipeline.build()
+    old_bus = pipeline.data_bus
+    old_bus.set_enabled(True)
+    old_bus.subscribe(SlowSubscriber(0), "gen_out")
+    old_bus.publish("gen_out", 1)
+    assert old_bus.drain(timeout=1.0)
+
+    pipeline.update_config(config)
+    assert pipeline.data_bus is not old_bus
+    deadline = time.monotonic() + 1.0
+    while old_bus.pool.pool_stats()["workers"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert old_bus.pool.pool_stats()["workers"] == 0  # min_workers no longer kept alive
+    assert not old_bus.enabled
+
+    new_bus = pipeline.data_bus
+    pipeline.close()
+    assert new_bus.pool._shutdown
@@ -0,0 +1,95 @@
+import os
+import queue
+import pytest
+from framework.core import DataBus
+from framework.core.spill_queue import SpillQueue
+from framework.core.registry import NodeRegistry
+import framework.nodes  # noqa: F401
+
+
+def test_overflow_spills_to_segments_and_replays_in_order(tmp_path, make_packet):
+    spill = SpillQueue(max_memory_items=3, segment_bytes=256, directory=str(tmp_path))
+    for i in range(50):
+        spill.put((i, make_packet(f"p{i}")))
+    assert len(spill) == 50 and spill.spilled_total == 47
+    [spill_dir] = tmp_path.iterdir()
+    assert len(os.listdir(spill_dir)) > 1  # Rolled over to several segments
+
+    items = [spill.get_nowait() for _ in range(50)]
+    assert [i for i, _ in items] == list(range(50))
+    assert [p.content for _, p in items] == [f"p{i}" for i in range(50)]
+    assert os.listdir(spill_dir) == []  # Read segments are deleted
+    with pytest.raises(queue.Empty):
+        spill.get_nowait()
+
+    spill.close()
+    assert not spill_dir.exists()
+
+
+def test_disk_limit_refuses_items(tmp_path):
+    spill = SpillQueue(max_memory_items=1, max_disk_bytes=64, directory=str(tmp_path))
+    results = [spill.put("x" * 20) for _ in range(5)]
+    assert results[:3] == [True, True, True] and not all(results)
+    assert spill.dropped == results.count(False)
+    spill.close()
+
+
+def test_node_input_spills_instead_of_dropping(tmp_path, make_packet):
+    node = NodeRegistry.create("console_logger", {
+        "name": "log", "inputs": ["src"],
+        "spill": {"max_memory_items": 10, "directory": str(tmp_path)},
+    })
+    buffer = node.input_buffers["src"]
+    assert isinstance(buffer, SpillQueue)
+    for i in range(node.MAX_BUFFER_SIZE + 50):
+        buffer.append(make_packet(i))
+    assert buffer[0].content == 0 and buffer[-1].content == node.MAX_BUFFER_SIZE + 49
+    assert node.shed_to_latest() == node.MAX_BUFFER_SIZE + 49
+    assert [buffer.pop(0).content] == [node.MAX_BUFFER_SIZE + 49] and not buffer
+
+
+class SlowCollector:
+    def __init__(self):
+        self.received = []
+
+    def on_data(self, data, channel):
+        self.received.append(data.content)
+
+
+def test_spilling_edge_delivers_everything_in_order(tmp_path, make_packet):
+    bus = DataBus(max_workers=4)
+    collector = SlowCollector()
+    bus.subscribe(collector, "src_out")
+    bus.set_spill("src_out", max_in_flight=1, max_memory_items=2, directory=str(tmp_path))
+    bus.set_enabled(True)
+
+    for i in range(30):
+        bus.publish("src_out", make_packet(i))
+    assert bus.drain(timeout=5.0)
+    assert collector.received == list(range(30))
+    assert bus.pending_count() == 0
+    bus.shutdown()
+
+
+def test_pipeline_close_releases_spill_files(tmp_path, make_packet):
+    from framework.core import Pipeline
+    edge_dir, input_dir = tmp_path / "edge", tmp_path / "input"
+    edge_dir.mkdir()
+    input_dir.mkdir()
+    pipeline = Pipeline({
+        "nodes": [
+            {"type": "number_generator", "name": "src",
+             "spill_output": {"max_in_flight": 1, "max_memory_items": 1, "directory": str(edge_dir)}},
+            {"type": "console_logger", "name": "log", "inputs": ["src"],
+             "spill": {"max_memory_items": 1, "directory": str(input_dir)}},
+        ],
+    }, "spill-release")
+    pipeline.build()
+    edge = pipeline.data_bus._edges["src_out"]
+    for i in range(5):
+        edge.queue.put(make_packet(i))
+        pipeline.node_map["log"].input_buffers["src_out"].append(make_packet(i))
+    assert os.listdir(edge_dir) and os.listdir(input_dir)  # Spilled to disk
+
+    pipeline.close()
+    assert os.listdir(edge_dir) == [] and os.listdir(input_dir) == []
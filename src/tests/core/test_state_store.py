@@ -0,0 +1,85 @@
+import time
+from framework.core import Pipeline
+from framework.core.state_store import StateStore
+from framework.data import DataPacket, DataType, DataFormat, DataSource
+import framework.nodes  # noqa: F401
+
+
+def _config(store_path):
+    return {
+        "settings": {"state_store": str(store_path), "state_key": "sensor-flow"},
+        "nodes": [
+            {"type": "number_generator", "name": "gen"},
+            {"type": "average", "name": "avg", "inputs": ["gen"], "params": {"window_size": 3}},
+            {"type": "accumulator", "name": "acc", "inputs": ["gen"], "params": {"flush_by": "count"}},
+        ],
+    }
+
+
+def test_store_roundtrip_keeps_enums_and_bytes(tmp_path, make_packet):
+    store = StateStore(tmp_path / "state.db")
+    packet = make_packet(b"\x00\x01", format=DataFormat.BINARY, source=DataSource.INTERNAL)
+    store.save("p1", {"acc": ("accumulator", {"buffer": [packet.model_dump()]})})
+    node_type, state = store.load("p1")["acc"]
+    assert node_type == "accumulator"
+    restored = DataPacket.model_validate(state["buffer"][0])
+    assert restored.content == b"\x00\x01"
+    assert restored.data_type is DataType.STREAM and restored.format is DataFormat.BINARY
+    assert restored.source is DataSource.INTERNAL
+    assert restored.timestamp == packet.timestamp
+
+
+def test_pipeline_resumes_from_snapshot(tmp_path, make_packet):
+    store_path = tmp_path / "state.db"
+    first = Pipeline(_config(store_path), "run-1")
+    first.build()
+    first.node_map["avg"].values = [1.0, 2.0, 3.0]
+    first.node_map["acc"].buffer = [make_packet(b"abc")]
+    assert first.snapshot_state() == 2
+    first.state_store.close()
+
+    second = Pipeline(_config(store_path), "run-2")
+    second.build()
+    assert second.node_map["avg"].values == [1.0, 2.0, 3.0]
+    assert second.node_map["acc"].buffer[0].content == b"abc"
+
+
+def test_restored_merge_inputs_get_a_fresh_timeout(make_packet):
+    pipeline = Pipeline({"nodes": [
+        {"type": "number_generator", "name": "a"},
+        {"type": "merge", "name": "merge", "inputs": ["a"]},
+    ]}, "merge-restore")
+    pipeline.build()
+    merge = pipeline.node_map["merge"]
+    merge.restore_state({"buffers": {"a_out": make_packet(b"x").model_dump()},
+                         "timestamps": {"a_out": 0.0}})
+    assert time.time() - merge.timestamps["a_out"] < merge.params.timeout
+
+
+def test_storage_snapshot_keeps_only_newest_records():
+    pipeline = Pipeline({"nodes": [
+        {"type": "number_generator", "name": "gen"},
+        {"type": "storage", "name": "store", "inputs": ["gen"], "params": {"max_saved_records": 2}},
+    ]}, "storage-snapshot")
+    pipeline.build()
+    storage = pipeline.node_map["store"]
+    storage._storage = [{"content": i} for i in range(5)]
+    assert storage.save_state() == {"records": [{"content": 3}, {"content": 4}]}
+
+
+def test_shutdown_closes_store_opened_from_settings(tmp_path):
+    pipeline = Pipeline(_config(tmp_path / "state.db"), "closing")
+    pipeline.build()
+    pipeline.run()
+    pipeline.shutdown()
+    assert pipeline.state_store is None
+    pipeline.run()  # Restarting reopens it
+    assert pipeline.state_store is not None
+    pipeline.shutdown()
+
+    shared = StateStore(tmp_path / "shared.db")
+    hosted = Pipeline(_config(tmp_path / "state.db"), "hosted", state_store=shared)
+    hosted.build()
+    hosted.shutdown()
+    assert hosted.state_store is shared  # Not ours to close
+    shared.close()
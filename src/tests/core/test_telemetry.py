@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+from framework.core.telemetry import Telemetry, NullSink, RingBufferSink
+
+
+def test_default_sink_is_noop():
+    t = Telemetry()
+    assert isinstance(t.sink, NullSink)
+    assert not t.enabled
+    t.broadcast_sync({"metric": "fps"})
+
+
+def test_ring_buffer_keeps_latest_messages():
+    t = Telemetry()
+    sink = RingBufferSink(max_messages=3)
+    t.set_sink(sink)
+    for i in range(5):
+        t.broadcast_sync({"value": i})
+    assert [m["value"] for m in sink.snapshot()] == [2, 3, 4]
+    assert len(sink.drain()) == 3
+    assert sink.snapshot() == []
+
+
+def test_core_does_not_pull_in_web_stack():
+    # A fresh interpreter: this test process may already have imported the web stack
+    check = ("import sys, framework.core; "
+             "print(sorted(m for m in ('janus', 'fastapi', 'uvicorn', 'api.telemetry_ws') if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
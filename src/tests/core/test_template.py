@@ -0,0 +1,46 @@
+import pytest
+from framework.core import PipelineTemplate
+from framework.core.template import template_cache
+import framework.nodes  # noqa: F401
+
+CONFIG = {
+    "settings": {"fps_limit": 30},
+    "nodes": [
+        {"type": "number_generator", "name": "gen", "params": {"start_value": 1.0}},
+        {"type": "console_logger", "name": "log", "inputs": ["gen"]},
+    ],
+}
+
+
+def test_instances_share_plan_and_apply_overrides():
+    template = PipelineTemplate(CONFIG)
+    first = template.instantiate("a")
+    second = template.instantiate("b", overrides={"gen": {"step_per_frame": 5.0}})
+
+    assert first.plan is second.plan is template.plan
+    assert first.node_map["gen"].params.step_per_frame == 1.0
+    assert second.node_map["gen"].params.step_per_frame == 5.0
+    assert second.node_map["gen"].params.start_value == 1.0
+    # The template itself is never mutated by overrides
+    assert "step_per_frame" not in template.config["nodes"][0]["params"]
+
+
+def test_template_errors_are_aggregated():
+    bad = {
+        "nodes": [
+            {"type": "number_generator", "name": "gen", "params": {"start_value": "x"}},
+            {"type": "no_such_node", "name": "other"},
+        ],
+    }
+    with pytest.raises(ValueError, match="no_such_node"):
+        PipelineTemplate(bad)
+
+    template = PipelineTemplate(CONFIG)
+    with pytest.raises(ValueError) as exc:
+        template.instantiate("c", overrides={"gen": {"wrap_around": "maybe"}, "nope": {}})
+    assert "gen.wrap_around" in str(exc.value) and "nope" in str(exc.value)
+
+
+def test_template_cache_reuses_compiled_templates():
+    template_cache.clear()
+    assert template_cache.get(CONFIG) is template_cache.get(dict(CONFIG))
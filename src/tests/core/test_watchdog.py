@@ -0,0 +1,140 @@
+import threading
+import time
+import pytest
+from framework.core import Pipeline
+from framework.core.watchdog import StallLimits, watchdog
+from framework.data.data_types import DataType, DataFormat, DataCategory
+from framework.nodes import BaseNode
+import framework.nodes  # noqa: F401
+
+
+class StickyNode(BaseNode):
+    """Blocks inside on_data on packets saying 'block' until released"""
+    node_type = "sticky_test"
+    accepted_data_types = set(DataType)
+    accepted_formats = set(DataFormat)
+    accepted_categories = set(DataCategory)
+    release = threading.Event()
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.received = []
+
+    def on_data(self, packet, input_channel):
+        self.received.append(packet.content)
+        if packet.content == "block":
+            self.release.wait(5.0)
+
+
+def _pipeline(policy):
+    StickyNode.release = threading.Event()
+    pipeline = Pipeline({
+        "settings": {"watchdog": {"stall_timeout": 0.05, "max_backlog": 2, "policy": policy}},
+        "nodes": [
+            {"type": "number_generator", "name": "src"},
+            {"type": "sticky_test", "name": "sticky", "inputs": ["src"]},
+        ],
+    }, f"watchdog-{policy}")
+    pipeline.build()
+    pipeline.data_bus.set_enabled(True)
+    return pipeline
+
+
+def _wait_until(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_hung_node_is_skipped_until_it_recovers(make_packet):
+    pipeline = _pipeline("skip")
+    node = pipeline.node_map["sticky"]
+    pipeline.data_bus.publish("src_out", make_packet("block"))
+    assert _wait_until(lambda: node.busy_for() > 0.1)
+
+    assert pipeline.check_stalls() == ["sticky"]
+    assert node.stalled
+    pipeline.data_bus.publish("src_out", make_packet("dropped"))
+    assert _wait_until(lambda: node.shed_count == 1)
+
+    StickyNode.release.set()
+    assert _wait_until(lambda: node.busy_for() == 0)
+    assert pipeline.check_stalls() == [] and not node.stalled
+    assert node.received == ["block"]
+    pipeline.data_bus.shutdown()
+
+
+def test_shed_latest_keeps_newest_input_and_replays_it(make_packet):
+    pipeline = _pipeline("shed_latest")
+    node = pipeline.node_map["sticky"]
+    node.input_buffers["src_out"] = [make_packet(i) for i in range(5)]
+    node.last_progress -= 1.0
+
+    assert pipeline.check_stalls() == ["sticky"]
+    assert [p.content for p in node.input_buffers["src_out"]] == [4]
+    for content in ("a", "b"):
+        pipeline.data_bus.publish("src_out", make_packet(content))
+    assert _wait_until(lambda: node.shed_count == 5)  # 4 trimmed + "a" replaced by "b"
+
+    assert pipeline.check_stalls() == []
+    assert _wait_until(lambda: node.received == ["b"])
+    pipeline.data_bus.shutdown()
+
+
+def test_shed_latest_replay_runs_on_the_frame_thread(make_packet):
+    StickyNode.release = threading.Event()
+    pipeline = Pipeline({
+        "settings": {"delivery": "frame_sync",
+                     "watchdog": {"stall_timeout": 0.05, "max_backlog": 2, "policy": "shed_latest"}},
+        "nodes": [
+            {"type": "number_generator", "name": "src"},
+            {"type": "sticky_test", "name": "sticky", "inputs": ["src"]},
+        ],
+    }, "watchdog-frame-sync")
+    pipeline.build()
+    pipeline.data_bus.set_enabled(True)
+    node = pipeline.node_map["sticky"]
+    node.input_buffers["src_out"] = [make_packet(i) for i in range(5)]
+    node.last_progress -= 1.0
+    assert pipeline.check_stalls() == ["sticky"]
+    for content in ("a", "b"):
+        pipeline.data_bus.publish("src_out", make_packet(content))
+    pipeline.data_bus.run_pending()
+
+    assert pipeline.check_stalls() == []
+    assert node.received == []  # Queued for the next frame, not run on the watchdog thread
+    pipeline.data_bus.run_pending()
+    assert node.received == ["b"]
+    pipeline.data_bus.shutdown()
+
+
+def test_restart_replaces_hung_node(make_packet):
+    pipeline = _pipeline("restart")
+    old = pipeline.node_map["sticky"]
+    pipeline.data_bus.publish("src_out", make_packet("block"))
+    assert _wait_until(lambda: old.busy_for() > 0.1)
+
+    pipeline.check_stalls()
+    new = pipeline.node_map["sticky"]
+    assert new is not old and new in pipeline.nodes
+    pipeline.data_bus.publish("src_out", make_packet("fresh"))
+    assert _wait_until(lambda: new.received == ["fresh"])
+    StickyNode.release.set()
+    pipeline.data_bus.shutdown()
+
+
+def test_watch_follows_run_and_shutdown():
+    pipeline = _pipeline("skip")
+    pipeline.run()
+    assert watchdog.is_watching(pipeline)
+    pipeline.shutdown()
+    assert not watchdog.is_watching(pipeline)
+
+
+def test_node_config_overrides_pipeline_limits():
+    limits = StallLimits.from_settings({"policy": "skip"}, {"policy": "restart", "stall_timeout": 1})
+    assert (limits.policy, limits.stall_timeout) == ("restart", 1)
+    assert StallLimits.from_settings(None) is None
+    with pytest.raises(ValueError):
+        StallLimits(policy="panic")
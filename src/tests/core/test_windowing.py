@@ -0,0 +1,159 @@
+import time
+import numpy as np
+import pytest
+from framework.core import Pipeline
+from framework.core.windowing import (
+    CountWindow, RingBuffer, SessionWindow, TimeWindow, create_window, make_aggregators
+)
+import framework.nodes  # noqa: F401
+
+
+def test_ring_buffer_returns_evicted_values():
+    ring = RingBuffer(3)
+    assert [ring.append(v) for v in (1, 2, 3, 4, 5)] == [None, None, None, 1.0, 2.0]
+    assert ring.values().tolist() == [3.0, 4.0, 5.0]
+
+
+def test_sliding_aggregates_match_recomputation():
+    rng = np.random.default_rng(7)
+    stream = rng.integers(-50, 50, size=300).astype(float)
+    window = CountWindow(size=20, slide=1,
+                         aggregations=("sum", "mean", "min", "max", "variance", "std"))
+    results = [r for v in stream for r in window.add(v)]
+    assert len(results) == len(stream) - 19
+    for i, result in enumerate(results):
+        expected = stream[i:i + 20]
+        assert result["count"] == 20
+        assert result["sum"] == pytest.approx(expected.sum())
+        assert result["mean"] == pytest.approx(expected.mean())
+        assert result["min"] == expected.min()
+        assert result["max"] == expected.max()
+        assert result["variance"] == pytest.approx(expected.var())
+        assert result["std"] == pytest.approx(expected.std())
+
+
+def test_tumbling_count_windows_do_not_overlap():
+    window = create_window("tumbling", "count", size=3, aggregations=["sum"])
+    results = [r for v in range(1, 10) for r in window.add(v)]
+    assert [(r["start"], r["end"], r["sum"]) for r in results] == [(0, 3, 6), (3, 6, 15), (6, 9, 24)]
+
+
+def test_time_windows_close_on_watermark_and_drop_late_events():
+    window = TimeWindow(size=10, aggregations=("sum",), allowed_lateness=2)
+    assert window.add(1, 1) == []
+    assert window.add(2, 11) == []  # Watermark 9: [0, 10) still open
+    assert window.add(4, 8) == []  # Out of order but within lateness
+    results = window.add(8, 13)  # Watermark 11 closes [0, 10)
+    assert [(r["start"], r["count"], r["sum"]) for r in results] == [(0.0, 2, 5)]
+    assert window.add(16, 5) == []
+    assert window.late == 1
+    assert [r["sum"] for r in window.advance(30)] == [10]
+
+
+def test_sliding_time_windows_share_elements():
+    window = TimeWindow(size=10, slide=5, aggregations=("count",))
+    results = [r for t in (1, 6, 12) for r in window.add(1, t)]
+    results += window.advance(20)
+    assert [(r["start"], r["count"]) for r in results] == [(-5.0, 1), (0.0, 2), (5.0, 2), (10.0, 1)]
+
+
+def test_session_windows_split_on_gap():
+    window = SessionWindow(gap=5, aggregations=("max",))
+    assert window.add(3, 0) == [] and window.add(7, 3) == []
+    results = window.add(1, 20)
+    assert [(r["start"], r["end"], r["count"], r["max"]) for r in results] == [(0, 8, 2, 7)]
+    assert [r["count"] for r in window.advance(25)] == [1]
+
+
+def test_invalid_window_configs_are_rejected():
+    with pytest.raises(ValueError):
+        make_aggregators(["median"])
+    with pytest.raises(ValueError):
+        create_window("session", "count", gap=1)
+    with pytest.raises(ValueError):
+        create_window("sliding", "time", size=10)
+
+
+class Collector:
+    def __init__(self):
+        self.received = []
+
+    def on_data(self, packet, channel):
+        self.received.append(packet.content)
+
+
+def test_window_node_aggregates_dict_values(make_packet):
+    pipeline = Pipeline({
+        "settings": {"delivery": "frame_sync"},
+        "nodes": [
+            {"type": "number_generator", "name": "src"},
+            {"type": "window", "name": "win", "inputs": ["src"],
+             "params": {"mode": "sliding", "size": 3, "slide": 2,
+                        "value_path": "reading", "aggregations": ["min", "max"]}},
+        ],
+    }, "window-node")
+    pipeline.build()
+    pipeline.data_bus.set_enabled(True)
+    collector = Collector()
+    pipeline.data_bus.subscribe(collector, "win_out")
+    node = pipeline.node_map["win"]
+    for value in (5, 1, 9, 4, 7):
+        node.on_data(make_packet({"reading": value}), "src_out")
+    pipeline.data_bus.run_pending()
+    assert [(r["min"], r["max"]) for r in collector.received] == [(1, 9), (4, 9)]
+
+
+def test_window_idle_flush_follows_event_time_not_wall_clock(make_packet):
+    pipeline = Pipeline({
+        "settings": {"delivery": "frame_sync"},
+        "nodes": [
+            {"type": "number_generator", "name": "src"},
+            {"type": "window", "name": "win", "inputs": ["src"],
+             "params": {"by": "time", "size": 10, "aggregations": ["sum"],
+                        "value_path": "v", "time_path": "content.t"}},
+        ],
+    }, "window-idle")
+    pipeline.build()
+    pipeline.data_bus.set_enabled(True)
+    collector = Collector()
+    pipeline.data_bus.subscribe(collector, "win_out")
+    node = pipeline.node_map["win"]
+    node.process()  # No events yet: nothing to advance from
+    node.on_data(make_packet({"v": 1, "t": 1000}), "src_out")
+    node.process()  # Only moments after t=1000
+    node.on_data(make_packet({"v": 2, "t": 1005}), "src_out")
+    pipeline.data_bus.run_pending()
+    assert collector.received == [] and node.late_count() == 0
+
+    node._latest_seen -= 6  # Six idle seconds take event time past 1010
+    node.process()
+    pipeline.data_bus.run_pending()
+    assert collector.received == [3.0]
+
+
+def test_accumulator_flushes_partial_chunk_by_age(make_packet):
+    pipeline = Pipeline({
+        "settings": {"delivery": "frame_sync"},
+        "nodes": [
+            {"type": "number_generator", "name": "src"},
+            {"type": "accumulator", "name": "acc", "inputs": ["src"],
+             "params": {"flush_by": "count", "packet_count": 100, "max_chunk_age": 0.05,
+                        "output_format": "textual", "include_metadata": False}},
+        ],
+    }, "accumulator-age")
+    pipeline.build()
+    pipeline.data_bus.set_enabled(True)
+    collector = Collector()
+    pipeline.data_bus.subscribe(collector, "acc_out")
+    node = pipeline.node_map["acc"]
+    node.on_data(make_packet("a"), "src_out")
+    node.on_data(make_packet("b"), "src_out")
+    assert node.should_process()
+    node.process()
+    pipeline.data_bus.run_pending()
+    assert collector.received == []
+    time.sleep(0.06)
+    node.process()
+    pipeline.data_bus.run_pending()
+    assert collector.received == ["a\nb"]
+    assert not node.should_process()